@@ -0,0 +1,348 @@
+"""
+Rotas de leitura em modo assíncrono (DB_ASYNC_MODE).
+
+Quando o modo assíncrono está ativo, estes routers são registrados antes
+dos routers síncronos e atendem as rotas GET com `AsyncSession`, sem ocupar
+threads do pool do FastAPI. As rotas de escrita continuam síncronas.
+"""
+
+from fastapi import APIRouter, Depends, Request, Response, Query, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from typing import Optional, List
+from uuid import UUID
+from datetime import date
+
+from app.db.async_session import get_async_db
+from app.schemas.author_schema import AuthorOut
+from app.schemas.book_schema import BookOut, BookExpandedOut
+from app.schemas.loan_schema import LoanOut, LoanStatus, LoanExpandedOut, OverdueLoanOut
+from app.schemas.user_schema import UserOut
+from app.dependencies.auth import get_current_user_async
+from app.core.logging import logger
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.expansion import (
+    BOOK_EXPANSIONS,
+    LOAN_EXPANSIONS,
+    parse_include,
+    expand_books,
+    expand_loans
+)
+from app.services import (
+    async_author_service,
+    async_book_service,
+    async_loan_service,
+    async_user_service
+)
+
+books_router = APIRouter()
+authors_router = APIRouter()
+users_router = APIRouter()
+loans_router = APIRouter()
+
+# Limite de requisições por minuto por IP
+limiter = Limiter(key_func=get_remote_address)
+
+
+# ---------- Livros ----------
+
+@books_router.get("/", response_model=List[BookExpandedOut], response_model_exclude_unset=True)
+@limiter.limit("50/minute")
+async def list_books(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 10,
+    title: Optional[str] = Query(None, description="Filtrar por título"),
+    q: Optional[str] = Query(None, min_length=2, description="Busca textual por título ou autor, ordenada por relevância"),
+    author_id: Optional[str] = Query(None, description="Filtrar por ID do autor"),
+    order_by: Optional[str] = Query("title", description="Campo de ordenação"),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor); substitui skip"),
+    include: Optional[str] = Query(None, description="Relacionamentos a incluir: author"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Lista os livros com suporte a paginação, filtro e ordenação.
+    Com `q`, realiza busca textual ordenada por relevância (paginação por skip/limit).
+    Com `include=author`, embute o resumo do autor de cada livro.
+    """
+    logger.debug(f"Listando livros (async) | title={title}, q={q}, author_id={author_id}, order_by={order_by}")
+    includes = parse_include(include, BOOK_EXPANSIONS)
+    try:
+        if q:
+            return await async_book_service.search_books_service(db, q, skip, limit, author_id, includes)
+        books, next_cursor = await async_book_service.list_books_service(
+            db, skip, limit, title, author_id, order_by, cursor, includes
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Erro ao listar livros: {str(e)}")
+        raise HTTPException(status_code=500, detail="Erro ao recuperar livros")
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return expand_books(books, includes)
+
+
+@books_router.get("/available", response_model=List[BookExpandedOut], response_model_exclude_unset=True, tags=["Livros"])
+@limiter.limit("50/minute")
+async def list_books_by_availability(
+    request: Request,
+    response: Response,
+    status: bool = Query(..., description="True para disponíveis, False para indisponíveis"),
+    skip: int = Query(0, ge=0, description="Número de itens a pular"),
+    limit: int = Query(10, ge=1, le=100, description="Número máximo de itens por página"),
+    order_by: Optional[str] = Query(
+        "title",
+        description="Campo de ordenação: 'title', 'published_date', 'total_copies'. Use prefixo '-' para ordem decrescente (ex: '-title')."
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor); substitui skip"),
+    include: Optional[str] = Query(None, description="Relacionamentos a incluir: author"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Lista livros disponíveis ou indisponíveis conforme o parâmetro,
+    com paginação e ordenação. Aceita `include=author`.
+    """
+    logger.info(
+        f"Listando livros (async) com disponibilidade={status}, skip={skip}, "
+        f"limit={limit}, order_by={order_by}"
+    )
+    includes = parse_include(include, BOOK_EXPANSIONS)
+    try:
+        books, next_cursor = await async_book_service.list_books_by_availability_service(
+            db=db,
+            status=status,
+            skip=skip,
+            limit=limit,
+            order_by=order_by,
+            cursor=cursor,
+            include=includes
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Erro ao listar livros por disponibilidade: {e}")
+        raise HTTPException(status_code=500, detail="Erro ao recuperar livros")
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return expand_books(books, includes)
+
+
+@books_router.get("/{book_id}", response_model=BookOut)
+@limiter.limit("50/minute")
+async def get_book(
+    request: Request,
+    book_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Busca os detalhes de um livro pelo seu ID.
+    """
+    logger.debug(f"Buscando livro por ID (async): {book_id}")
+    return await async_book_service.get_book_service(db, book_id)
+
+
+# ---------- Autores ----------
+
+@authors_router.get("/", response_model=list[AuthorOut], tags=["Autores"])
+@limiter.limit("50/minute")
+async def list_authors(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Retorna a lista completa de autores cadastrados.
+    """
+    logger.debug("Solicitada listagem de autores (async)")
+    return await async_author_service.list_authors_service(db)
+
+
+@authors_router.get("/{author_id}", response_model=AuthorOut, tags=["Autores"])
+@limiter.limit("50/minute")
+async def get_author(
+    request: Request,
+    author_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Busca os detalhes de um autor pelo seu ID.
+    """
+    logger.debug(f"Solicitada busca de autor ID (async): {author_id}")
+    return await async_author_service.get_author_service(db, author_id)
+
+
+@authors_router.get("/{author_id}/books", response_model=list[BookOut], tags=["Autores"])
+@limiter.limit("50/minute")
+async def list_books_by_author(
+    request: Request,
+    author_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Retorna todos os livros associados a um autor específico.
+    """
+    logger.debug(f"Solicitada listagem de livros para o autor ID (async): {author_id}")
+    return await async_author_service.list_books_by_author_service(db, str(author_id))
+
+
+# ---------- Usuários ----------
+
+@users_router.get("/", response_model=List[UserOut], tags=["Usuários"])
+@limiter.limit("50/minute")
+async def list_users(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Retorna a lista de todos os usuários cadastrados.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou a listagem de usuários (async)")
+    return await async_user_service.list_users_service(db)
+
+
+@users_router.get("/{user_id}", response_model=UserOut, tags=["Usuários"])
+@limiter.limit("50/minute")
+async def get_user(
+    request: Request,
+    user_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Retorna os dados de um usuário específico pelo seu ID.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou dados do usuário ID (async): {user_id}")
+    return await async_user_service.get_user_service(db, user_id)
+
+
+# ---------- Empréstimos ----------
+
+@loans_router.get("/", response_model=List[LoanExpandedOut], response_model_exclude_unset=True, tags=["Empréstimos"])
+@limiter.limit("50/minute")
+async def list_loans(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, description="Número máximo de itens por página (limitado por MAX_PAGE_SIZE)"),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor)"),
+    loan_status: Optional[LoanStatus] = Query(None, alias="status", description="Filtrar por situação: active, returned ou overdue"),
+    user_id: Optional[str] = Query(None, description="Filtrar por ID do usuário"),
+    book_id: Optional[str] = Query(None, description="Filtrar por ID do livro"),
+    loan_date_from: Optional[date] = Query(None, description="Data do empréstimo a partir de"),
+    loan_date_to: Optional[date] = Query(None, description="Data do empréstimo até"),
+    due_date_from: Optional[date] = Query(None, description="Data de vencimento a partir de"),
+    due_date_to: Optional[date] = Query(None, description="Data de vencimento até"),
+    include: Optional[str] = Query(None, description="Relacionamentos a incluir, separados por vírgula: book, user, author"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Lista os empréstimos com filtros e paginação por cursor, dos mais recentes
+    para os mais antigos. O cursor da próxima página é retornado no cabeçalho
+    X-Next-Cursor. Com `include`, embute resumos de livro, usuário e autor
+    carregados na mesma consulta.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou listagem de empréstimos (async) | status={loan_status}, user_id={user_id}, book_id={book_id}")
+    includes = parse_include(include, LOAN_EXPANSIONS)
+    loans, next_cursor = await async_loan_service.list_loans_service(
+        db, limit, cursor, loan_status, user_id, book_id,
+        loan_date_from, loan_date_to, due_date_from, due_date_to, includes
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return expand_loans(loans, includes)
+
+
+@loans_router.get("/active/{user_id}", response_model=List[LoanOut], tags=["Empréstimos"])
+@limiter.limit("50/minute")
+async def list_active_loans(
+    request: Request,
+    user_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Lista os empréstimos ativos (não devolvidos) de um usuário.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou empréstimos ativos do usuário {user_id} (async)")
+    return await async_loan_service.list_active_loans_by_user_service(db, user_id)
+
+
+@loans_router.get("/overdue/{user_id}", response_model=List[LoanOut], tags=["Empréstimos"])
+@limiter.limit("50/minute")
+async def list_overdue_loans(
+    request: Request,
+    user_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Lista os empréstimos atrasados de um usuário.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou empréstimos atrasados do usuário {user_id} (async)")
+    return await async_loan_service.list_overdue_loans_by_user_service(db, user_id)
+
+
+@loans_router.get("/history/{user_id}", response_model=List[LoanOut], tags=["Empréstimos"])
+@limiter.limit("50/minute")
+async def list_loan_history(
+    request: Request,
+    user_id: str,
+    include_archived: bool = Query(False, description="Inclui os empréstimos já movidos para o arquivo"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Lista o histórico de empréstimos de um usuário.
+    Com `include_archived=true`, inclui os empréstimos arquivados.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou histórico de empréstimos do usuário {user_id} (async)")
+    return await async_loan_service.list_loan_history_by_user_service(db, user_id, include_archived)
+
+
+@loans_router.get("/overdue", response_model=List[OverdueLoanOut], tags=["Empréstimos"])
+@limiter.limit("50/minute")
+async def list_overdue_queue(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, description="Número máximo de itens por página (limitado por MAX_PAGE_SIZE)"),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor)"),
+    include_details: bool = Query(False, description="Inclui resumos do usuário e do livro (mesma consulta)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Lista os empréstimos em atraso de toda a biblioteca, do vencimento mais
+    antigo para o mais recente, com paginação por cursor (cabeçalho X-Next-Cursor).
+    """
+    logger.info(f"Usuário {current_user.email} solicitou a fila de empréstimos em atraso (async)")
+    loans, next_cursor = await async_loan_service.list_overdue_loans_service(db, limit, cursor, include_details)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return loans
+
+
+@loans_router.get("/{loan_id}", response_model=LoanOut, tags=["Empréstimos"])
+@limiter.limit("50/minute")
+async def get_loan(
+    request: Request,
+    loan_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    """
+    Retorna os detalhes de um empréstimo específico.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou detalhes do empréstimo ID (async): {loan_id}")
+    return await async_loan_service.get_loan_service(db, loan_id)
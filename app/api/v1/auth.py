@@ -19,7 +19,7 @@ limiter = Limiter(key_func=get_remote_address)
 
 @router.post("/token", summary="Autenticação do usuário (Login)")
 @limiter.limit("7/minute")
-def login_for_access_token(
+async def login_for_access_token(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
@@ -37,4 +37,4 @@ def login_for_access_token(
     - Token JWT de acesso com tempo de expiração definido nas configurações.
     """
     logger.info(f"Tentando autenticar usuário: {form_data.username}")
-    return login_for_access_token_service(db, form_data)
+    return await login_for_access_token_service(db, form_data)
@@ -4,7 +4,7 @@ Módulo de rotas para operações relacionadas aos autores.
 Inclui criação, listagem, busca por ID, atualização completa/parcial e exclusão.
 """
 
-from fastapi import APIRouter, Depends, Request, HTTPException, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.orm import Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -18,12 +18,11 @@ from app.services.author_service import (
     create_author_service,
     list_authors_service,
     get_author_service,
+    list_books_by_author_service,
     update_author_service,
     patch_author_service,
     delete_author_service
 )
-from app.models.book_model import Book
-from app.models.author_model import Author
 from app.core.logging import logger
 
 router = APIRouter()
@@ -88,17 +87,7 @@ def list_books_by_author(
     Retorna todos os livros associados a um autor específico.
     """
     logger.debug(f"Solicitada listagem de livros para o autor ID: {author_id}")
-
-    author = db.query(Author).filter(Author.id == str(author_id)).first()
-    if not author:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Autor não encontrado"
-        )
-
-    books = db.query(Book).filter(Book.author_id == str(author_id)).all()
-    logger.info(f"{len(books)} livros encontrados para o autor {author.name}")
-    return books
+    return list_books_by_author_service(db, str(author_id))
 
 
 @router.put("/{author_id}", response_model=AuthorOut, tags=["Autores"])
@@ -2,7 +2,7 @@
 API endpoints relacionados à gestão de livros.
 """
 
-from fastapi import APIRouter, Depends, Request, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, Request, Response, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -11,17 +11,28 @@ from typing import Optional, List
 
 from app.db.session import get_db
 from app.models.book_model import Book
-from app.schemas.book_schema import BookCreate, BookOut, BookUpdate
+from app.schemas.book_schema import (
+    BookCreate,
+    BookOut,
+    BookUpdate,
+    BookExpandedOut,
+    BookImportFormat,
+    BookImportOut
+)
 from app.dependencies.auth import get_current_user
 from app.core.logging import logger
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.expansion import BOOK_EXPANSIONS, parse_include
 from app.services.book_service import (
     create_book_service,
     get_book_service,
     list_books_service,
     update_book_service,
     delete_book_service,
-    list_books_by_availability_service
+    list_books_by_availability_service,
+    search_books_service
 )
+from app.services.book_import_service import detect_import_format, import_books_service
 
 router = APIRouter()
 
@@ -51,33 +62,71 @@ def create_book(
         raise HTTPException(status_code=500, detail="Erro interno ao criar livro")
 
 
-@router.get("/", response_model=List[BookOut])
+@router.post("/import", response_model=BookImportOut)
+@limiter.limit("5/minute")
+def import_books(
+    request: Request,
+    file: UploadFile = File(..., description="Arquivo CSV (com cabeçalho) ou NDJSON com os campos do cadastro de livro"),
+    format: Optional[BookImportFormat] = Query(None, description="Formato do arquivo; se omitido, é identificado pela extensão"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    """
+    Importa livros em lote a partir de um arquivo CSV ou NDJSON.
+    Retorna os totais e os erros por linha; linhas inválidas não impedem
+    o cadastro das demais.
+    """
+    import_format = format or detect_import_format(file.filename, file.content_type)
+    logger.info(f"Importação de livros solicitada: {file.filename} ({import_format.value})")
+    try:
+        return import_books_service(db, file.file, import_format)
+    finally:
+        file.file.close()
+
+
+@router.get("/", response_model=List[BookExpandedOut], response_model_exclude_unset=True)
 @limiter.limit("50/minute")
 def list_books(
     request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 10,
     title: Optional[str] = Query(None, description="Filtrar por título"),
+    q: Optional[str] = Query(None, min_length=2, description="Busca textual por título ou autor, ordenada por relevância"),
     author_id: Optional[str] = Query(None, description="Filtrar por ID do autor"),
     order_by: Optional[str] = Query("title", description="Campo de ordenação"),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor); substitui skip"),
+    include: Optional[str] = Query(None, description="Relacionamentos a incluir: author"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
     """
     Lista os livros com suporte a paginação, filtro e ordenação.
+    Com `q`, realiza busca textual ordenada por relevância (paginação por skip/limit).
+    Com `include=author`, embute o resumo do autor de cada livro.
     """
-    logger.debug(f"Listando livros | title={title}, author_id={author_id}, order_by={order_by}")
+    logger.debug(f"Listando livros | title={title}, q={q}, author_id={author_id}, order_by={order_by}")
+    includes = parse_include(include, BOOK_EXPANSIONS)
     try:
-        return list_books_service(db, skip, limit, title, author_id, order_by)
+        if q:
+            return search_books_service(db, q, skip, limit, author_id, includes)
+        books, next_cursor = list_books_service(db, skip, limit, title, author_id, order_by, cursor, includes)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao listar livros: {str(e)}")
         raise HTTPException(status_code=500, detail="Erro ao recuperar livros")
 
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return books
 
-@router.get("/available", response_model=List[BookOut], tags=["Livros"])
+
+@router.get("/available", response_model=List[BookExpandedOut], response_model_exclude_unset=True, tags=["Livros"])
 @limiter.limit("50/minute")
 def list_books_by_availability(
     request: Request,
+    response: Response,
     status: bool = Query(..., description="True para disponíveis, False para indisponíveis"),
     skip: int = Query(0, ge=0, description="Número de itens a pular"),
     limit: int = Query(10, ge=1, le=100, description="Número máximo de itens por página"),
@@ -85,29 +134,40 @@ def list_books_by_availability(
         "title",
         description="Campo de ordenação: 'title', 'published_date', 'total_copies'. Use prefixo '-' para ordem decrescente (ex: '-title')."
     ),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor); substitui skip"),
+    include: Optional[str] = Query(None, description="Relacionamentos a incluir: author"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
     """
     Lista livros disponíveis ou indisponíveis conforme o parâmetro,
-    com paginação e ordenação.
+    com paginação e ordenação. Aceita `include=author`.
     """
     logger.info(
         f"Listando livros com disponibilidade={status}, skip={skip}, "
         f"limit={limit}, order_by={order_by}"
     )
+    includes = parse_include(include, BOOK_EXPANSIONS)
     try:
-        return list_books_by_availability_service(
+        books, next_cursor = list_books_by_availability_service(
             db=db,
             status=status,
             skip=skip,
             limit=limit,
-            order_by=order_by
+            order_by=order_by,
+            cursor=cursor,
+            include=includes
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao listar livros por disponibilidade: {e}")
         raise HTTPException(status_code=500, detail="Erro ao recuperar livros")
 
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return books
+
 
 @router.get("/{book_id}", response_model=BookOut)
 @limiter.limit("50/minute")
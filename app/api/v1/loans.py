@@ -5,21 +5,39 @@ Permite criar, listar, atualizar, editar parcialmente e remover registros de emp
 incluindo regras de negócio como limite de empréstimos por usuário, cálculo de multas etc.
 """
 
-from fastapi import APIRouter, Depends, status, Request
+from fastapi import APIRouter, Depends, status, Request, Response, Query
 from sqlalchemy.orm import Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from typing import List
+from typing import List, Optional
+from datetime import date
 
 from app.db.session import get_db
 from app.models.user_model import User
-from app.schemas.loan_schema import LoanCreate, LoanOut, LoanUpdate, LoanPut
+from app.schemas.loan_schema import (
+    LoanCreate,
+    LoanOut,
+    LoanUpdate,
+    LoanPut,
+    LoanBatchCreate,
+    LoanBatchOut,
+    LoanBatchReturn,
+    LoanBatchReturnOut,
+    LoanStatus,
+    LoanExpandedOut,
+    OverdueLoanOut
+)
 from app.dependencies.auth import get_current_user
 from app.core.logging import logger
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.expansion import LOAN_EXPANSIONS, parse_include, expand_loans
 from app.services.loan_service import (
     create_loan_service,
+    create_loans_batch_service,
+    return_loans_batch_service,
     list_loans_service,
+    list_overdue_loans_service,
     get_loan_service,
     patch_loan_service,
     update_loan_service,
@@ -48,6 +66,57 @@ def create_loan(
     logger.info(f"Usuário {current_user.email} solicitou criação de empréstimo")
     return create_loan_service(db, loan)
 
+@router.post("/batch", response_model=LoanBatchOut, tags=["Empréstimos"])
+@limiter.limit("20/minute")
+def create_loans_batch(
+    request: Request,
+    batch: LoanBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Cria vários empréstimos para um usuário em uma única transação,
+    retornando o resultado de cada livro.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou empréstimo em lote de {len(batch.book_ids)} livro(s)")
+    return create_loans_batch_service(db, batch)
+
+@router.post("/returns", response_model=LoanBatchReturnOut, tags=["Empréstimos"])
+@limiter.limit("20/minute")
+def return_loans_batch(
+    request: Request,
+    data: LoanBatchReturn,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Registra a devolução de vários empréstimos em uma única transação,
+    calculando as multas no banco.
+    """
+    logger.info(f"Usuário {current_user.email} solicitou devolução em lote de {len(data.loan_ids)} empréstimo(s)")
+    return return_loans_batch_service(db, data)
+
+@router.get("/overdue", response_model=List[OverdueLoanOut], tags=["Empréstimos"])
+@limiter.limit("50/minute")
+def list_overdue_queue(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, description="Número máximo de itens por página (limitado por MAX_PAGE_SIZE)"),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor)"),
+    include_details: bool = Query(False, description="Inclui resumos do usuário e do livro (mesma consulta)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Lista os empréstimos em atraso de toda a biblioteca, do vencimento mais
+    antigo para o mais recente, com paginação por cursor (cabeçalho X-Next-Cursor).
+    """
+    logger.info(f"Usuário {current_user.email} solicitou a fila de empréstimos em atraso")
+    loans, next_cursor = list_overdue_loans_service(db, limit, cursor, include_details)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return loans
+
 @router.get("/{loan_id}", response_model=LoanOut, tags=["Empréstimos"])
 @limiter.limit("50/minute")
 def get_loan(   
@@ -63,18 +132,39 @@ def get_loan(
     return get_loan_service(db, loan_id)
 
 
-@router.get("/", response_model=List[LoanOut], tags=["Empréstimos"])
+@router.get("/", response_model=List[LoanExpandedOut], response_model_exclude_unset=True, tags=["Empréstimos"])
 @limiter.limit("50/minute")
 def list_loans(
     request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, description="Número máximo de itens por página (limitado por MAX_PAGE_SIZE)"),
+    cursor: Optional[str] = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor)"),
+    loan_status: Optional[LoanStatus] = Query(None, alias="status", description="Filtrar por situação: active, returned ou overdue"),
+    user_id: Optional[str] = Query(None, description="Filtrar por ID do usuário"),
+    book_id: Optional[str] = Query(None, description="Filtrar por ID do livro"),
+    loan_date_from: Optional[date] = Query(None, description="Data do empréstimo a partir de"),
+    loan_date_to: Optional[date] = Query(None, description="Data do empréstimo até"),
+    due_date_from: Optional[date] = Query(None, description="Data de vencimento a partir de"),
+    due_date_to: Optional[date] = Query(None, description="Data de vencimento até"),
+    include: Optional[str] = Query(None, description="Relacionamentos a incluir, separados por vírgula: book, user, author"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Lista todos os empréstimos registrados no sistema.
+    Lista os empréstimos com filtros e paginação por cursor, dos mais recentes
+    para os mais antigos. O cursor da próxima página é retornado no cabeçalho
+    X-Next-Cursor. Com `include`, embute resumos de livro, usuário e autor
+    carregados na mesma consulta.
     """
-    logger.info(f"Usuário {current_user.email} solicitou listagem de todos os empréstimos")
-    return list_loans_service(db)
+    logger.info(f"Usuário {current_user.email} solicitou listagem de empréstimos | status={loan_status}, user_id={user_id}, book_id={book_id}")
+    includes = parse_include(include, LOAN_EXPANSIONS)
+    loans, next_cursor = list_loans_service(
+        db, limit, cursor, loan_status, user_id, book_id,
+        loan_date_from, loan_date_to, due_date_from, due_date_to, includes
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return expand_loans(loans, includes)
 
 
 @router.get("/active/{user_id}", response_model=List[LoanOut], tags=["Empréstimos"])
@@ -112,14 +202,16 @@ def list_overdue_loans(
 def list_loan_history(
     request: Request,
     user_id: str,
+    include_archived: bool = Query(False, description="Inclui os empréstimos já movidos para o arquivo"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Lista o histórico completo de empréstimos de um usuário.
+    Lista o histórico de empréstimos de um usuário.
+    Com `include_archived=true`, inclui os empréstimos arquivados.
     """
     logger.info(f"Usuário {current_user.email} solicitou histórico de empréstimos do usuário {user_id}")
-    return list_loan_history_by_user_service(db, user_id)
+    return list_loan_history_by_user_service(db, user_id, include_archived)
 
 
 @router.patch("/{loan_id}", response_model=LoanOut, tags=["Empréstimos"])
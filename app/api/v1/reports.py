@@ -1,14 +1,17 @@
 # app/api/v1/reports.py
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from datetime import datetime
 import os
 
 from app.db.session import get_db
-from app.services.report_service import export_books_csv, export_report_pdf
+from app.schemas.report_schema import ReportJobCreate, ReportJobOut, ReportJobStatus
+from app.services.report_service import export_books_csv, export_report_pdf, stream_books_csv
+from app.services.report_job_service import ReportJob, submit_report_job, get_report_job
 
 router = APIRouter()
 
@@ -16,7 +19,17 @@ router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)  # por IP
 
 @router.get('/books/csv', summary='Exportar relatório de livros em CSV')
-def get_books_csv(db: Session = Depends(get_db)):
+def get_books_csv(
+    stream: bool = Query(True, description="Envia o CSV em blocos à medida que é lido do banco"),
+    db: Session = Depends(get_db)
+):
+    if stream:
+        filename = f'books_{datetime.now():%Y%m%d_%H%M%S}.csv'
+        return StreamingResponse(
+            stream_books_csv(),
+            media_type='text/csv; charset=utf-8',
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
     try:
         file_path = export_books_csv(db)
         return FileResponse(path=file_path, media_type='text/csv', filename=os.path.basename(file_path))
@@ -30,3 +43,40 @@ def get_full_pdf(db: Session = Depends(get_db)):
         return FileResponse(path=file_path, media_type='application/pdf', filename=os.path.basename(file_path))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _job_out(request: Request, job: ReportJob, reused: bool = False) -> ReportJobOut:
+    download_url = None
+    if job.status == ReportJobStatus.done:
+        download_url = str(request.url_for('download_report_job', job_id=job.id))
+    return ReportJobOut(
+        id=job.id,
+        kind=job.kind,
+        status=job.status,
+        reused=reused,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        download_url=download_url
+    )
+
+@router.post(
+    '/jobs',
+    response_model=ReportJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary='Solicitar geração de relatório em background'
+)
+def create_report_job(request: Request, job_in: ReportJobCreate):
+    job, reused = submit_report_job(job_in.kind)
+    return _job_out(request, job, reused)
+
+@router.get('/jobs/{job_id}', response_model=ReportJobOut, summary='Consultar andamento de um relatório')
+def get_report_job_status(request: Request, job_id: str):
+    return _job_out(request, get_report_job(job_id))
+
+@router.get('/jobs/{job_id}/artifact', summary='Baixar relatório gerado')
+def download_report_job(job_id: str):
+    job = get_report_job(job_id)
+    if job.status != ReportJobStatus.done or not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail='Relatório ainda não está pronto')
+    return FileResponse(path=job.file_path, media_type=job.media_type, filename=os.path.basename(job.file_path))
@@ -1,8 +1,19 @@
 from fastapi import APIRouter
+from app.core.settings import settings
 from app.api.v1 import users, books, loans, auth, authors, reports
 
 api_router = APIRouter()
 
+# Em modo assíncrono, as rotas GET são atendidas pelos routers com AsyncSession,
+# registrados antes dos síncronos para terem precedência.
+if settings.DB_ASYNC_MODE:
+    from app.api.v1 import async_reads
+
+    api_router.include_router(async_reads.users_router, prefix="/users", tags=["Usuários"])
+    api_router.include_router(async_reads.books_router, prefix="/books", tags=["Livros"])
+    api_router.include_router(async_reads.loans_router, prefix="/loans", tags=["Empréstimos"])
+    api_router.include_router(async_reads.authors_router, prefix="/authors", tags=["Autores"])
+
 api_router.include_router(users.router, prefix="/users", tags=["Usuários"])
 api_router.include_router(books.router, prefix="/books", tags=["Livros"])
 api_router.include_router(loans.router, prefix="/loans", tags=["Empréstimos"])
@@ -5,7 +5,7 @@ Inclui operações de criação, listagem, detalhamento, atualização e remoç
 de usuários do sistema com autenticação e validações apropriadas.
 """
 
-from fastapi import APIRouter, Depends, status, HTTPException, Request
+from fastapi import APIRouter, Depends, status, Query, Request
 from sqlalchemy.orm import Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -13,12 +13,14 @@ from typing import List
 
 from app.db.session import get_db
 from app.models.user_model import User
+from app.schemas.loan_schema import LoanOut
 from app.schemas.user_schema import UserCreate, UserOut, UserUpdate
 from app.dependencies.auth import get_current_user
 from app.services.user_service import (
     create_user_service,
     list_users_service,
     get_user_service,
+    get_user_loans_service,
     update_user_service,
     delete_user_service
 )
@@ -72,36 +74,22 @@ def get_user(
     return get_user_service(db, user_id)
 
 
-@router.get("/{user_id}/loans", response_model=UserOut, tags=["Usuários"])
+@router.get("/{user_id}/loans", response_model=List[LoanOut], tags=["Usuários"])
 @limiter.limit("50/minute")
 def get_loans(
     request: Request,
     user_id: str,
+    include_archived: bool = Query(False, description="Inclui os empréstimos já movidos para o arquivo"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retorna lista de empréstimos de um usuário específico pelo seu ID.
+    Com `include_archived=true`, inclui os empréstimos arquivados.
     Requer autenticação.
     """
-    from app.models.loan_model import Loan  # Evita import circular
     logger.info(f"Usuário {current_user.email} solicitou lista de empréstimos do usuário ID: {user_id}")
-
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Usuário não encontrado"
-        )
-
-    loans = db.query(Loan).filter(Loan.user_id == user_id).all()
-    if not loans:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Nenhum empréstimo encontrado para este usuário"
-        )
-
-    return loans
+    return get_user_loans_service(db, user_id, include_archived)
 
 
 @router.put("/{user_id}", response_model=UserOut, tags=["Usuários"])
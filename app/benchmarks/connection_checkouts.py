@@ -0,0 +1,97 @@
+"""
+Benchmark de conexões retiradas do pool por requisição autenticada.
+
+Executa, com o TestClient do FastAPI, uma sequência de GETs autenticados
+contra a aplicação e compara o contador `checkouts_total` de `pool_stats()`
+antes e depois: com a sessão única por requisição (`get_db` compartilhado
+entre `get_current_user` e o handler), a razão checkouts / requisições deve
+ser no máximo 1, mesmo quando o usuário autenticado não está em cache.
+
+O token é gerado diretamente para o e-mail informado (sem passar pelo
+login, cujo bcrypt não interessa aqui); o usuário precisa existir no banco
+de SQLALCHEMY_DATABASE_URL. Os limites de requisições por IP são
+desativados durante a execução. Execute com DB_ASYNC_MODE desativado: as
+rotas assíncronas usam outra engine, fora deste contador.
+
+Uso:
+    python -m app.benchmarks.connection_checkouts --email leitor@exemplo.com
+        [--path /api/v1/books/?limit=10] [--requests 500] [--cold-principal]
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+
+from app.api.v1 import async_reads, auth, authors, books, loans, reports, users
+from app.core.security import create_access_token
+from app.db.session import pool_stats
+from app.dependencies.auth import principal_cache
+from main import app
+
+_ROUTE_MODULES = (async_reads, auth, authors, books, loans, reports, users)
+
+
+def run_benchmark(email: str, path: str, requests: int, cold_principal: bool = False) -> dict:
+    """
+    Executa `requests` GETs em `path` e retorna as medições. Com
+    `cold_principal`, o cache de usuários autenticados é limpo antes de cada
+    requisição, forçando a consulta do usuário na mesma sessão do handler.
+    """
+    for module in _ROUTE_MODULES:
+        module.limiter.enabled = False
+
+    token = create_access_token(data={"sub": email}, expires_delta=timedelta(hours=1))
+    headers = {"Authorization": f"Bearer {token}"}
+    statuses = {}
+
+    with TestClient(app) as client:
+        # Aquecimento: conexões iniciais do pool e caches de processo
+        response = client.get(path, headers=headers)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} retornou {response.status_code}: {response.text[:200]}")
+
+        before = pool_stats()["checkouts_total"]
+        start = time.perf_counter()
+        for _ in range(requests):
+            if cold_principal:
+                principal_cache.clear()
+            status_code = client.get(path, headers=headers).status_code
+            statuses[status_code] = statuses.get(status_code, 0) + 1
+        elapsed = time.perf_counter() - start
+        checkouts = pool_stats()["checkouts_total"] - before
+
+    return {
+        "requests": requests,
+        "checkouts": checkouts,
+        "checkouts_per_request": checkouts / requests if requests else 0.0,
+        "requests_per_second": requests / elapsed if elapsed else 0.0,
+        "statuses": statuses,
+    }
+
+
+def _report(path: str, cold_principal: bool, r: dict) -> None:
+    print(f"GET {path} ({'sem' if cold_principal else 'com'} cache de usuários autenticados)")
+    print(f"{'requisições':<24} {r['requests']:>10}")
+    print(f"{'checkouts do pool':<24} {r['checkouts']:>10}")
+    print(f"{'checkouts / requisição':<24} {r['checkouts_per_request']:>10.2f}")
+    print(f"{'requisições/s':<24} {r['requests_per_second']:>10.0f}")
+    print(f"{'status HTTP':<24} {r['statuses']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mede conexões retiradas do pool por requisição autenticada")
+    parser.add_argument("--email", required=True, help="E-mail de um usuário existente (sub do token)")
+    parser.add_argument("--path", default="/api/v1/books/?limit=10", help="Rota GET autenticada")
+    parser.add_argument("--requests", type=int, default=500, help="Requisições medidas")
+    parser.add_argument("--cold-principal", action="store_true",
+                        help="Limpa o cache de usuários autenticados antes de cada requisição")
+    args = parser.parse_args()
+
+    _report(args.path, args.cold_principal,
+            run_benchmark(args.email, args.path, args.requests, args.cold_principal))
+
+
+if __name__ == "__main__":
+    main()
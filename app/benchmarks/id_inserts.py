@@ -0,0 +1,107 @@
+"""
+Benchmark de vazão de inserção: UUIDv4 (aleatório) x UUIDv7 (ordenado).
+
+Insere as mesmas quantidades de linhas, em transações de `--batch-size`
+linhas, em tabelas no formato de `loans`, uma por gerador de ID, e compara:
+- linhas por segundo no total e no último décimo da carga (vazão sustentada,
+  quando a árvore da chave primária já não cabe nas páginas quentes);
+- tamanho final de dados e índices (divisões de página deixam páginas
+  parcialmente ocupadas com UUIDv4).
+
+Requer MySQL (usa a conexão de SQLALCHEMY_DATABASE_URL). As tabelas
+`bench_ids_*` são removidas ao final, salvo com --keep.
+
+Uso:
+    python -m app.benchmarks.id_inserts [--rows 500000] [--batch-size 500] [--storage char36|binary16]
+"""
+
+import argparse
+import time
+import uuid
+from typing import Dict
+
+from sqlalchemy import MetaData
+from sqlalchemy.engine import Engine
+
+from app.benchmarks.uuid_storage import ENCODERS, MODES, bench_table, table_sizes
+from app.db.session import engine as default_engine
+from app.utils.ids import ID_GENERATORS
+
+
+def run_benchmark(engine: Engine, rows: int, batch_size: int, storage: str,
+                  keep: bool = False) -> Dict[str, dict]:
+    """Executa a carga para cada gerador de ID e retorna as medições."""
+    if engine.dialect.name != "mysql":
+        raise RuntimeError("O benchmark de inserção requer MySQL")
+
+    encode = ENCODERS[storage]
+    parent_ids = [encode(uuid.uuid4()) for _ in range(1000)]
+
+    metadata = MetaData()
+    tables = {
+        strategy: bench_table(metadata, storage, name=f"bench_ids_{strategy}")
+        for strategy in ID_GENERATORS
+    }
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    tail_start = rows - rows // 10
+    results: Dict[str, dict] = {}
+    try:
+        for strategy, table in tables.items():
+            generate = ID_GENERATORS[strategy]
+            inserted = 0
+            tail_seconds = 0.0
+            start = time.perf_counter()
+            while inserted < rows:
+                count = min(batch_size, rows - inserted)
+                batch = [
+                    {"id": encode(generate()), "parent_id": parent_ids[(inserted + i) % len(parent_ids)],
+                     "loan_date": "2024-01-01"}
+                    for i in range(count)
+                ]
+                batch_start = time.perf_counter()
+                with engine.begin() as conn:
+                    conn.execute(table.insert(), batch)
+                if inserted >= tail_start:
+                    tail_seconds += time.perf_counter() - batch_start
+                inserted += count
+            total_seconds = time.perf_counter() - start
+
+            data_length, index_length = table_sizes(engine, table.name)
+            results[strategy] = {
+                "rows_per_second": rows / total_seconds,
+                "tail_rows_per_second": (rows - tail_start) / tail_seconds if tail_seconds else 0.0,
+                "data_bytes": data_length,
+                "index_bytes": index_length,
+            }
+    finally:
+        if not keep:
+            metadata.drop_all(engine)
+    return results
+
+
+def _report(results: Dict[str, dict]) -> None:
+    header = f"{'gerador':<8} {'linhas/s':>10} {'linhas/s (último 10%)':>22} {'dados (MB)':>11} {'índices (MB)':>13}"
+    print(header)
+    print("-" * len(header))
+    for strategy, r in results.items():
+        print(
+            f"{strategy:<8} {r['rows_per_second']:>10.0f} {r['tail_rows_per_second']:>22.0f} "
+            f"{r['data_bytes'] / 2**20:>11.2f} {r['index_bytes'] / 2**20:>13.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compara a vazão de inserção com UUIDv4 e UUIDv7 no MySQL")
+    parser.add_argument("--rows", type=int, default=500000, help="Linhas inseridas por gerador")
+    parser.add_argument("--batch-size", type=int, default=500, help="Linhas por transação")
+    parser.add_argument("--storage", choices=sorted(MODES), default="char36", help="Tipo das colunas UUID")
+    parser.add_argument("--keep", action="store_true", help="Mantém as tabelas bench_ids_* ao final")
+    args = parser.parse_args()
+
+    _report(run_benchmark(default_engine, args.rows, args.batch_size, args.storage, keep=args.keep))
+
+
+if __name__ == "__main__":
+    main()
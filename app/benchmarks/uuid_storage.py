@@ -0,0 +1,164 @@
+"""
+Benchmark de armazenamento de UUID: CHAR(36) x BINARY(16).
+
+Cria duas tabelas temporárias com o mesmo formato de `loans` (chave primária
+UUID e uma chave estrangeira UUID indexada), carrega as mesmas linhas em
+ambas e compara:
+- tamanho dos dados e dos índices (information_schema.TABLES, após ANALYZE);
+- latência de buscas pontuais pela chave primária e pelo índice secundário.
+
+Requer MySQL (usa a conexão de SQLALCHEMY_DATABASE_URL). As tabelas
+`bench_uuid_*` são removidas ao final, salvo com --keep.
+
+Uso:
+    python -m app.benchmarks.uuid_storage [--rows 200000] [--parents 5000] [--lookups 2000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import BINARY, CHAR, Column, Date, Index, MetaData, Table, select, text
+from sqlalchemy.engine import Engine
+
+from app.db.session import engine as default_engine
+
+MODES: Dict[str, Callable[[], object]] = {
+    "char36": lambda: CHAR(36),
+    "binary16": lambda: BINARY(16),
+}
+
+ENCODERS: Dict[str, Callable[[uuid.UUID], object]] = {
+    "char36": str,
+    "binary16": lambda value: value.bytes,
+}
+
+
+def bench_table(metadata: MetaData, mode: str, name: str = None) -> Table:
+    """Tabela no formato de `loans` com as chaves UUID no modo informado."""
+    name = name or f"bench_uuid_{mode}"
+    return Table(
+        name, metadata,
+        Column("id", MODES[mode](), primary_key=True),
+        Column("parent_id", MODES[mode](), nullable=False),
+        Column("loan_date", Date, nullable=False),
+        Index(f"idx_{name}_parent", "parent_id"),
+        mysql_engine="InnoDB",
+        mysql_charset="utf8mb4",
+    )
+
+
+def table_sizes(engine: Engine, table_name: str) -> Tuple[int, int]:
+    """Atualiza as estatísticas e retorna (bytes de dados, bytes de índices)."""
+    with engine.begin() as conn:
+        conn.execute(text(f"ANALYZE TABLE {table_name}")).fetchall()
+        data_length, index_length = conn.execute(
+            text(
+                "SELECT DATA_LENGTH, INDEX_LENGTH FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"
+            ),
+            {"name": table_name}
+        ).one()
+    return int(data_length), int(index_length)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _time_lookups(engine: Engine, query_for: Callable[[object], object], keys: List[object]) -> Dict[str, float]:
+    timings = []
+    with engine.connect() as conn:
+        for key in keys:
+            start = time.perf_counter()
+            conn.execute(query_for(key)).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": statistics.median(timings),
+        "p95_ms": _percentile(timings, 0.95),
+    }
+
+
+def run_benchmark(engine: Engine, rows: int, parents: int, lookups: int,
+                  batch_size: int = 5000, keep: bool = False) -> Dict[str, dict]:
+    """Executa o benchmark nos dois modos e retorna as medições por modo."""
+    if engine.dialect.name != "mysql":
+        raise RuntimeError("O benchmark de armazenamento de UUID requer MySQL")
+
+    rng = random.Random(42)
+    parent_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(parents)]
+    row_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(rows)]
+    row_parents = [rng.choice(parent_ids) for _ in range(rows)]
+    sample = rng.sample(range(rows), min(lookups, rows))
+
+    metadata = MetaData()
+    tables = {mode: bench_table(metadata, mode) for mode in MODES}
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    results: Dict[str, dict] = {}
+    try:
+        for mode, table in tables.items():
+            encode = ENCODERS[mode]
+            start = time.perf_counter()
+            with engine.begin() as conn:
+                for offset in range(0, rows, batch_size):
+                    conn.execute(table.insert(), [
+                        {"id": encode(row_ids[i]), "parent_id": encode(row_parents[i]), "loan_date": "2024-01-01"}
+                        for i in range(offset, min(offset + batch_size, rows))
+                    ])
+            load_seconds = time.perf_counter() - start
+
+            data_length, index_length = table_sizes(engine, table.name)
+
+            results[mode] = {
+                "load_seconds": load_seconds,
+                "data_bytes": data_length,
+                "index_bytes": index_length,
+                "pk_lookup": _time_lookups(
+                    engine, lambda key: select(table.c.loan_date).where(table.c.id == key),
+                    [encode(row_ids[i]) for i in sample]
+                ),
+                "secondary_lookup": _time_lookups(
+                    engine, lambda key: select(table.c.id).where(table.c.parent_id == key),
+                    [encode(row_parents[i]) for i in sample]
+                ),
+            }
+    finally:
+        if not keep:
+            metadata.drop_all(engine)
+    return results
+
+
+def _report(results: Dict[str, dict]) -> None:
+    header = f"{'modo':<10} {'carga (s)':>10} {'dados (MB)':>11} {'índices (MB)':>13} " \
+             f"{'PK med/p95 (ms)':>18} {'secundário med/p95 (ms)':>25}"
+    print(header)
+    print("-" * len(header))
+    for mode, r in results.items():
+        pk, sec = r["pk_lookup"], r["secondary_lookup"]
+        print(
+            f"{mode:<10} {r['load_seconds']:>10.2f} {r['data_bytes'] / 2**20:>11.2f} "
+            f"{r['index_bytes'] / 2**20:>13.2f} "
+            f"{pk['median_ms']:>8.3f}/{pk['p95_ms']:<9.3f} "
+            f"{sec['median_ms']:>12.3f}/{sec['p95_ms']:<12.3f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compara UUID em CHAR(36) e BINARY(16) no MySQL")
+    parser.add_argument("--rows", type=int, default=200000, help="Linhas por tabela")
+    parser.add_argument("--parents", type=int, default=5000, help="Valores distintos da chave estrangeira")
+    parser.add_argument("--lookups", type=int, default=2000, help="Buscas pontuais por tipo de índice")
+    parser.add_argument("--keep", action="store_true", help="Mantém as tabelas bench_uuid_* ao final")
+    args = parser.parse_args()
+
+    _report(run_benchmark(default_engine, args.rows, args.parents, args.lookups, keep=args.keep))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+# app/core/cache.py
+"""
+Caches da aplicação.
+
+Fornece um cache LRU limitado com expiração por TTL, seguro para uso
+concorrente pelas threads do FastAPI, com contadores de acerto/erro, e um
+cache read-through com backends em memória ou Redis.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+from uuid import UUID
+
+
+class TTLCache:
+    """
+    Cache LRU com tamanho máximo e tempo de vida por entrada.
+
+    Cada entrada expira após `ttl_seconds` (ou antes, se um `expires_at`
+    menor for informado em `set`). Quando o limite de tamanho é atingido,
+    a entrada usada há mais tempo é descartada.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna o valor armazenado ou None se ausente/expirado."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """
+        Armazena um valor. `expires_at` (relógio monotônico) limita o TTL padrão.
+        """
+        if self.max_size <= 0:
+            return
+        deadline = time.monotonic() + self.ttl_seconds
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        with self._lock:
+            self._data[key] = (value, deadline)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove todas as entradas cuja chave satisfaz o predicado."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores de uso do cache."""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# ---------- Cache de leitura (read-through) compartilhável ----------
+
+try:  # dependência opcional: necessária apenas com CACHE_BACKEND=redis
+    import redis
+except ImportError:  # pragma: no cover
+    redis = None
+
+
+class MemoryCacheBackend:
+    """
+    Backend em memória do processo: apenas para testes e implantações com um
+    único processo. Com vários workers, cada um mantém sua cópia e só
+    enxerga as invalidações feitas no próprio processo, servindo dados
+    desatualizados até o TTL expirar.
+    """
+
+    # Contadores e entradas não são vistos por outros processos
+    shared = False
+
+    def __init__(self, max_size: int = 10000):
+        # TTL efetivo vem de `expires_at` em cada escrita
+        self._entries = TTLCache(max_size=max_size, ttl_seconds=float("inf"))
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._entries.set(key, value, expires_at=time.monotonic() + ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        self._entries.delete(key)
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCacheBackend:
+    """Backend Redis, compartilhado entre workers e instâncias da API."""
+
+    shared = True
+
+    def __init__(self, host: str, port: int, db: int = 0, password: Optional[str] = None):
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requer o pacote 'redis' instalado")
+        self._client = redis.Redis(
+            host=host, port=port, db=db, password=password or None,
+            decode_responses=True, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._client.set(key, value, ex=max(int(ttl_seconds), 1))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def get_counter(self, key: str) -> int:
+        return int(self._client.get(key) or 0)
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(key))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Tipo não serializável no cache: {type(value).__name__}")
+
+
+class ReadThroughCache:
+    """
+    Cache read-through de resultados serializáveis em JSON.
+
+    As chaves combinam o namespace, a versão atual do namespace e os
+    parâmetros normalizados (ordenados, sem valores nulos). Invalidar um
+    namespace incrementa a versão, tornando todas as chaves anteriores
+    inalcançáveis sem precisar enumerá-las. O TTL recebe uma variação
+    aleatória (`jitter`) para que entradas criadas juntas não expirem juntas.
+    Falhas do backend são registradas e a leitura segue direto no banco;
+    após uma falha, leituras e gravações de entradas deixam de usar o
+    backend por `failure_backoff_seconds`, para que um Redis fora do ar não
+    custe o timeout do socket em toda requisição. Invalidações são sempre
+    tentadas; as que falham ficam pendentes (como invalidação do namespace
+    inteiro) e são repetidas no próximo acesso ao backend.
+    """
+
+    def __init__(self, backend, ttl_seconds: float = 60.0, jitter: float = 0.1,
+                 prefix: str = "cache", on_error: Optional[Callable[[Exception], None]] = None,
+                 failure_backoff_seconds: float = 5.0):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.jitter = jitter
+        self.prefix = prefix
+        self.on_error = on_error
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self._retry_at = 0.0
+        self._pending_invalidations: Set[str] = set()
+        self._pending_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.bypassed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self.ttl_seconds > 0
+
+    def _available(self) -> bool:
+        """Indica se o backend pode ser usado (habilitado e fora do intervalo de espera)."""
+        if not self.enabled:
+            return False
+        if time.monotonic() < self._retry_at:
+            self.bypassed += 1
+            return False
+        return True
+
+    def _failed(self, error: Exception) -> None:
+        self.errors += 1
+        self._retry_at = time.monotonic() + self.failure_backoff_seconds
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def _invalidation_failed(self, namespace: str, error: Exception) -> None:
+        with self._pending_lock:
+            self._pending_invalidations.add(namespace)
+        self._failed(error)
+
+    def _retry_invalidations(self) -> None:
+        """Repete as invalidações que falharam; interrompe na primeira falha."""
+        if not self._pending_invalidations:
+            return
+        with self._pending_lock:
+            pending = list(self._pending_invalidations)
+            self._pending_invalidations.clear()
+        for i, namespace in enumerate(pending):
+            try:
+                self.backend.incr(f"{self.prefix}:{namespace}:version")
+            except Exception:
+                with self._pending_lock:
+                    self._pending_invalidations.update(pending[i:])
+                raise
+
+    def _version(self, namespace: str) -> int:
+        return self.backend.get_counter(f"{self.prefix}:{namespace}:version")
+
+    def _key(self, namespace: str, version: int, params: Dict[str, Any]) -> str:
+        normalized = json.dumps(
+            {name: value for name, value in params.items() if value is not None},
+            sort_keys=True, separators=(",", ":"), default=_json_default
+        )
+        return f"{self.prefix}:{namespace}:v{version}:{normalized}"
+
+    def _ttl(self) -> float:
+        return self.ttl_seconds * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def get_or_load(self, namespace: str, params: Dict[str, Any], loader: Callable[[], Any]) -> Any:
+        """
+        Retorna o valor em cache para (namespace, params) ou executa `loader`,
+        armazena o resultado serializado e o retorna no formato desserializado.
+        """
+        if not self._available():
+            return loader()
+
+        try:
+            self._retry_invalidations()
+            key = self._key(namespace, self._version(namespace), params)
+            cached = self.backend.get(key)
+        except Exception as e:
+            self._failed(e)
+            return loader()
+
+        if cached is not None:
+            self.hits += 1
+            return json.loads(cached)
+
+        self.misses += 1
+        payload = json.dumps(loader(), default=_json_default)
+        try:
+            self.backend.set(key, payload, self._ttl())
+        except Exception as e:
+            self._failed(e)
+        return json.loads(payload)
+
+    def delete(self, namespace: str, params: Dict[str, Any]) -> None:
+        """
+        Remove uma entrada específica (ex.: detalhe de um registro). Se o
+        backend falhar, o namespace inteiro fica pendente de invalidação.
+        """
+        if not self.enabled:
+            return
+        try:
+            self.backend.delete(self._key(namespace, self._version(namespace), params))
+        except Exception as e:
+            self._invalidation_failed(namespace, e)
+
+    def version(self, namespace: str) -> Optional[int]:
+        """Versão atual do namespace, ou None se o cache estiver indisponível."""
+        if not self._available():
+            return None
+        try:
+            return self._version(namespace)
+        except Exception as e:
+            self._failed(e)
+            return None
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        Invalida todas as entradas do namespace (nova versão). Tentada mesmo
+        durante o intervalo de espera após falhas; se falhar, fica pendente.
+        """
+        if not self.enabled:
+            return
+        try:
+            self._retry_invalidations()
+            self.backend.incr(f"{self.prefix}:{namespace}:version")
+        except Exception as e:
+            self._invalidation_failed(namespace, e)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "bypassed": self.bypassed,
+            "pending_invalidations": len(self._pending_invalidations),
+        }
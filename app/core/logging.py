@@ -3,12 +3,17 @@ import sys
 import time
 import functools
 import inspect
+import atexit
+import queue
+import threading
 from datetime import datetime
 from typing import Optional, Callable, Any, Dict, Type
 import inspect
 from fastapi import HTTPException
 from enum import Enum
 
+from app.core.settings import settings
+
 try:
     from colorama import init, Fore, Back, Style
     init(autoreset=True)
@@ -105,11 +110,29 @@ class AdvancedLogger:
                  log_level: LogLevel = LogLevel.INFO,
                  show_timestamp: bool = True,
                  show_caller: bool = False,
-                 log_file: Optional[str] = None):
+                 log_file: Optional[str] = None,
+                 async_mode: bool = False,
+                 queue_size: int = 10000,
+                 batch_size: int = 256):
         self.log_level = log_level
         self.show_timestamp = show_timestamp
         self.show_caller = show_caller
         self.log_file = log_file
+        # Modo assíncrono: as threads das requisições apenas enfileiram os
+        # registros; uma única thread de escrita grava em lote no stdout e
+        # em um arquivo mantido aberto.
+        self.async_mode = async_mode
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._file_handle = None
+        # Após o shutdown, os registros voltam a ser gravados de forma síncrona
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
         self._alert_palette = {
             AlertType.SUCCESS: ("SUCCESS", '🟢'),
             AlertType.INFO: ("INFO", '🔵'),
@@ -135,12 +158,125 @@ class AdvancedLogger:
         timestamp = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] " if self.show_timestamp else ""
         caller = f" ({self._get_caller_info()})" if self.show_caller else ""
         log_line = f"{color}{icon} {timestamp}{message}{caller}{Style.RESET_ALL}"
-        
+        file_line = f"{icon} {timestamp}{message}{caller}\n"
+
+        if self.async_mode and self._enqueue(log_line, file_line):
+            return
+
         print(log_line)
-        
+
         if self.log_file:
             with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"{icon} {timestamp}{message}{caller}\n")
+                f.write(file_line)
+
+    # ---------- Modo assíncrono (fila + thread de escrita) ----------
+
+    def _enqueue(self, log_line: str, file_line: str) -> bool:
+        """Enfileira o registro; retorna False se o logger já foi encerrado."""
+        if not self._ensure_writer():
+            return False
+        try:
+            self._queue.put_nowait((log_line, file_line))
+            with self._stats_lock:
+                self.enqueued += 1
+        except queue.Full:
+            # Fila cheia: descarta o registro em vez de bloquear a requisição
+            with self._stats_lock:
+                self.dropped += 1
+        return True
+
+    def _ensure_writer(self) -> bool:
+        if self._writer is not None:
+            return True
+        with self._writer_lock:
+            if self._closed:
+                return False
+            if self._writer is None:
+                if self.log_file:
+                    self._file_handle = open(self.log_file, 'a', encoding='utf-8', buffering=64 * 1024)
+                self._writer = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+                self._writer.start()
+            return True
+
+    def _writer_loop(self):
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            records = [record for record in batch if record is not None]
+            if records:
+                sys.stdout.write("".join(f"{log_line}\n" for log_line, _ in records))
+                sys.stdout.flush()
+                if self._file_handle:
+                    self._file_handle.write("".join(file_line for _, file_line in records))
+                    self._file_handle.flush()
+                with self._stats_lock:
+                    self.written += len(records)
+
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        """Aguarda a gravação de todos os registros enfileirados."""
+        if self.async_mode and self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def shutdown(self):
+        """
+        Grava os registros pendentes, encerra a thread de escrita e fecha o
+        arquivo. Registros posteriores são gravados de forma síncrona, sem
+        reiniciar a thread. Se a thread não terminar a tempo, o arquivo fica
+        aberto para não ser fechado durante uma escrita.
+        """
+        with self._writer_lock:
+            self._closed = True
+            writer = self._writer
+            if writer is None:
+                return
+            self._queue.put(None)
+            writer.join(timeout=5)
+            self._writer = None
+            if writer.is_alive():
+                return
+            self._write_leftovers()
+            if self._file_handle:
+                self._file_handle.close()
+                self._file_handle = None
+
+    def _write_leftovers(self):
+        # Registros enfileirados por outras threads depois do sinal de parada
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._queue.task_done()
+            if record is None:
+                continue
+            log_line, file_line = record
+            sys.stdout.write(f"{log_line}\n")
+            if self._file_handle:
+                self._file_handle.write(file_line)
+            with self._stats_lock:
+                self.written += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores da fila de logs (modo assíncrono)."""
+        with self._stats_lock:
+            return {
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "queue_depth": self._queue.qsize(),
+            }
 
     def log(self, level: LogLevel, message: str):
         if level.value < self.log_level.value:
@@ -214,7 +350,13 @@ class AdvancedLogger:
             self.error(f"{error_message}")
 
 # Funções de conveniência
-logger = AdvancedLogger()
+logger = AdvancedLogger(
+    log_file=settings.LOG_FILE,
+    async_mode=settings.LOG_ASYNC,
+    queue_size=settings.LOG_QUEUE_MAX_SIZE,
+    batch_size=settings.LOG_BATCH_SIZE
+)
+atexit.register(logger.shutdown)
 
 def success(message: str):
     logger.alert(message, AlertType.SUCCESS)
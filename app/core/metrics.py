@@ -0,0 +1,186 @@
+# app/core/metrics.py
+"""
+Métricas da aplicação no formato texto do Prometheus.
+
+Implementação mínima de contadores, gauges e histogramas com rótulos,
+protegidos por lock e com custo constante por observação. Coletores
+registrados são consultados apenas no momento da leitura (`/metrics`),
+por exemplo para o estado do pool de conexões.
+"""
+
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (nome, descrição, tipo, [(rótulos, valor)])
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _labels(self, values: Sequence[str]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def collect(self) -> List[Family]:
+        with self._lock:
+            samples = [(self._labels(key), value) for key, value in self._values.items()]
+        return [(self.name, self.documentation, self.type_name, samples)]
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, *labelvalues: str, value: float) -> None:
+        with self._lock:
+            self._values[labelvalues] = value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # rótulos -> [contagem por bucket..., soma, total]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, *labelvalues: str, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labelvalues)
+            if state is None:
+                state = self._values[labelvalues] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def collect(self) -> List[Family]:
+        samples_bucket: List[Sample] = []
+        samples_sum: List[Sample] = []
+        samples_count: List[Sample] = []
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        for key, state in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                samples_bucket.append(({**labels, "le": _format_value(float(bound))}, cumulative))
+            samples_bucket.append(({**labels, "le": "+Inf"}, state[-1]))
+            samples_sum.append((labels, state[-2]))
+            samples_count.append((labels, state[-1]))
+        return [
+            (self.name, self.documentation, self.type_name, []),
+            (f"{self.name}_bucket", "", "", samples_bucket),
+            (f"{self.name}_sum", "", "", samples_sum),
+            (f"{self.name}_count", "", "", samples_count),
+        ]
+
+
+class MetricsRegistry:
+    """Agrupa métricas e coletores e gera a exposição em texto."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        metric = Gauge(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """Registra uma função chamada a cada leitura de `/metrics`."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        families: List[Family] = []
+        for metric in self._metrics:
+            families.extend(metric.collect())
+        for collector in self._collectors:
+            families.extend(collector())
+
+        lines: List[str] = []
+        for name, documentation, type_name, samples in families:
+            if type_name:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {type_name}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def gauges_from_dict(prefix: str, documentation: str, values: Dict[str, float]) -> List[Family]:
+    """Converte um dicionário de estatísticas em famílias de gauges."""
+    return [
+        (f"{prefix}_{key}", f"{documentation} ({key})", "gauge", [({}, value)])
+        for key, value in values.items()
+        if isinstance(value, (int, float))
+    ]
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "Total de requisições HTTP", ("method", "route", "status")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "Requisições HTTP em andamento"
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "Latência das requisições HTTP em segundos", ("method", "route", "status")
+)
@@ -2,10 +2,15 @@
 
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt
 
-from typing import Optional
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError
+from typing import Any, Callable, Optional
 from datetime import datetime, timedelta
+import asyncio
+import threading
 
 from app.core.settings import settings
 from app.models.user_model import User
@@ -13,14 +18,110 @@ from app.dependencies.auth import get_user_by_email
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# ---------- Pool dedicado para bcrypt ----------
+# Cada operação bcrypt consome ~100–300 ms de CPU. Executá-las em um pool
+# próprio e limitado impede que rajadas de login ocupem todas as threads
+# compartilhadas do FastAPI; quando o pool e a fila estão cheios, a
+# requisição falha imediatamente com 503. O login (a rota mais exposta)
+# aguarda o resultado com `await`, sem bloquear nenhuma thread do FastAPI;
+# os demais chamadores síncronos bloqueiam a thread da requisição, por isso
+# WORKERS + MAX_PENDING deve ficar bem abaixo das 40 threads do pool.
+
+_hash_executor: Optional[Executor] = None
+_hash_executor_lock = threading.Lock()
+_hash_slots = threading.BoundedSemaphore(
+    settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_PENDING
+)
+
+
+def _get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                if settings.PASSWORD_HASH_EXECUTOR == "process":
+                    _hash_executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS)
+                else:
+                    _hash_executor = ThreadPoolExecutor(
+                        max_workers=settings.PASSWORD_HASH_WORKERS,
+                        thread_name_prefix="password-hash"
+                    )
+    return _hash_executor
+
+
+def _hash_timeout() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Tempo esgotado ao processar credenciais, tente novamente",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _submit_to_hash_pool(func: Callable[..., Any], *args: Any) -> Future:
+    """Envia `func` ao pool de hash respeitando o limite de fila."""
+    if not _hash_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço de autenticação sobrecarregado, tente novamente",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = _get_hash_executor().submit(func, *args)
+    except Exception:
+        _hash_slots.release()
+        raise
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return future
+
+
+def _run_in_hash_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """Executa `func` no pool de hash, bloqueando a thread chamadora."""
+    future = _submit_to_hash_pool(func, *args)
+    try:
+        return future.result(timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS)
+    except TimeoutError:
+        raise _hash_timeout()
+
+
+async def _await_hash_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """Executa `func` no pool de hash sem bloquear o event loop nem threads do FastAPI."""
+    future = _submit_to_hash_pool(func, *args)
+    try:
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future),
+            timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        raise _hash_timeout()
+
+
+def shutdown_hash_executor() -> None:
+    """Encerra o pool de hash (chamado no shutdown da aplicação)."""
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is not None:
+            _hash_executor.shutdown(wait=False)
+            _hash_executor = None
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica se a senha fornecida corresponde ao hash armazenado."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return _run_in_hash_pool(_verify, plain_password, hashed_password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Variante assíncrona de `verify_password`, usada no login."""
+    return await _await_hash_pool(_verify, plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Gera um hash seguro para uma senha."""
-    return pwd_context.hash(password)
+    return _run_in_hash_pool(_hash, password)
 
 def authenticate_user(email: str, password: str, db: Session) -> Optional[User]:
     """Valida um usuário com base no email e senha fornecidos."""
@@ -31,6 +132,18 @@ def authenticate_user(email: str, password: str, db: Session) -> Optional[User]:
         return None
     return user
 
+async def authenticate_user_async(email: str, password: str, db: Session) -> Optional[User]:
+    """
+    Variante assíncrona de `authenticate_user`: a consulta do usuário é
+    rápida e roda no pool de threads; a verificação bcrypt é aguardada.
+    """
+    user = await run_in_threadpool(get_user_by_email, db, email)
+    if not user:
+        return None
+    if not await verify_password_async(password, user.hashed_password):
+        return None
+    return user
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Cria um token JWT com dados e tempo de expiração."""
     to_encode = data.copy()
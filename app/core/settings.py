@@ -2,6 +2,7 @@
 
 from pydantic import BaseSettings, Field
 
+from decimal import Decimal
 from typing import Optional
 
 
@@ -12,6 +13,12 @@ class Settings(BaseSettings):
     APP_ENV: str = Field("development", env="APP_ENV")
     DEBUG: bool = Field(True, env="DEBUG")
 
+    # Logging
+    LOG_FILE: Optional[str] = Field(None, env="LOG_FILE")
+    LOG_ASYNC: bool = Field(False, env="LOG_ASYNC")
+    LOG_QUEUE_MAX_SIZE: int = Field(10000, env="LOG_QUEUE_MAX_SIZE")
+    LOG_BATCH_SIZE: int = Field(256, env="LOG_BATCH_SIZE")
+
     # Server
     HOST: str = Field("0.0.0.0", env="HOST")
     PORT: int = Field(8000, env="PORT")
@@ -23,6 +30,52 @@ class Settings(BaseSettings):
     DB_PORT: int = Field(3306, env="DB_PORT")
     DB_NAME: str = Field("library_db", env="DB_NAME")
     SQLALCHEMY_DATABASE_URL: Optional[str] = None
+    UUID_STORAGE: str = Field("char", env="UUID_STORAGE")  # char | binary
+    ID_STRATEGY: str = Field("uuid7", env="ID_STRATEGY")  # uuid7 | uuid4
+
+    # Instrumentação de SQL
+    DB_SLOW_QUERY_MS: float = Field(200, env="DB_SLOW_QUERY_MS")
+    DB_N_PLUS_ONE_THRESHOLD: int = Field(5, env="DB_N_PLUS_ONE_THRESHOLD")
+
+    # Modo assíncrono (AsyncEngine/AsyncSession) para as rotas de leitura
+    DB_ASYNC_MODE: bool = Field(False, env="DB_ASYNC_MODE")
+    SQLALCHEMY_ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Busca de livros (índice em memória quando o banco não é MySQL)
+    SEARCH_INDEX_TTL_SECONDS: int = Field(300, env="SEARCH_INDEX_TTL_SECONDS")
+    SEARCH_MIN_SCORE: float = Field(0.3, env="SEARCH_MIN_SCORE")
+
+    # Relatórios
+    REPORT_CSV_BATCH_SIZE: int = Field(1000, env="REPORT_CSV_BATCH_SIZE")
+    REPORT_JOB_WORKERS: int = Field(2, env="REPORT_JOB_WORKERS")
+    REPORT_JOB_MAX_JOBS: int = Field(100, env="REPORT_JOB_MAX_JOBS")
+    REPORT_REUSE_MAX_AGE_SECONDS: int = Field(300, env="REPORT_REUSE_MAX_AGE_SECONDS")
+
+    # Importação de livros em lote
+    BOOK_IMPORT_BATCH_SIZE: int = Field(1000, env="BOOK_IMPORT_BATCH_SIZE")
+    BOOK_IMPORT_MAX_ERRORS: int = Field(1000, env="BOOK_IMPORT_MAX_ERRORS")
+
+    # Paginação
+    MAX_PAGE_SIZE: int = Field(100, env="MAX_PAGE_SIZE")
+
+    # Empréstimos
+    MAX_ACTIVE_LOANS: int = Field(3, env="MAX_ACTIVE_LOANS")
+    FINE_PER_DAY: Decimal = Field(Decimal("2.00"), env="FINE_PER_DAY")
+    FINE_ACCRUAL_INTERVAL_SECONDS: int = Field(0, env="FINE_ACCRUAL_INTERVAL_SECONDS")
+    LOAN_ARCHIVE_AFTER_DAYS: int = Field(365, env="LOAN_ARCHIVE_AFTER_DAYS")
+    LOAN_ARCHIVE_CHUNK_SIZE: int = Field(1000, env="LOAN_ARCHIVE_CHUNK_SIZE")
+
+    # Cache de leitura do catálogo (livros e autores)
+    CACHE_BACKEND: str = Field("none", env="CACHE_BACKEND")  # none | redis | memory (um único processo)
+    CACHE_TTL_SECONDS: int = Field(60, env="CACHE_TTL_SECONDS")
+    CACHE_TTL_JITTER: float = Field(0.1, env="CACHE_TTL_JITTER")
+    CACHE_MAX_SIZE: int = Field(10000, env="CACHE_MAX_SIZE")
+    CACHE_KEY_PREFIX: str = Field("library", env="CACHE_KEY_PREFIX")
+    CACHE_FAILURE_BACKOFF_SECONDS: float = Field(5.0, env="CACHE_FAILURE_BACKOFF_SECONDS")
+
+    # Cache L1 por worker de autores e metadados de livros
+    REFERENCE_CACHE_MAX_SIZE: int = Field(5000, env="REFERENCE_CACHE_MAX_SIZE")
+    REFERENCE_CACHE_TTL_SECONDS: int = Field(300, env="REFERENCE_CACHE_TTL_SECONDS")
 
     # Redis Cache
     REDIS_HOST: str = Field("localhost", env="REDIS_HOST")
@@ -35,6 +88,16 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = Field("HS256", env="JWT_ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(60 * 24, env="ACCESS_TOKEN_EXPIRE_MINUTES")
 
+    # Cache do usuário autenticado (principal)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(60, env="PRINCIPAL_CACHE_TTL_SECONDS")
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(10000, env="PRINCIPAL_CACHE_MAX_SIZE")
+
+    # Hash de senhas (bcrypt) em pool dedicado
+    PASSWORD_HASH_EXECUTOR: str = Field("thread", env="PASSWORD_HASH_EXECUTOR")  # thread | process
+    PASSWORD_HASH_WORKERS: int = Field(4, env="PASSWORD_HASH_WORKERS")
+    PASSWORD_HASH_MAX_PENDING: int = Field(8, env="PASSWORD_HASH_MAX_PENDING")
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = Field(5.0, env="PASSWORD_HASH_TIMEOUT_SECONDS")
+
     class Config:
         env_file = "app/core/.env"
         env_file_encoding = "utf-8"
@@ -49,3 +112,13 @@ if not settings.SQLALCHEMY_DATABASE_URL:
         f"{settings.DB_USER}:{settings.DB_PASSWORD}"
         f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
     )
+
+# Build async URL from the sync one if not overridden (aiomysql / aiosqlite)
+if not settings.SQLALCHEMY_ASYNC_DATABASE_URL:
+    _async_drivers = {
+        "mysql+pymysql": "mysql+aiomysql",
+        "mysql": "mysql+aiomysql",
+        "sqlite": "sqlite+aiosqlite",
+    }
+    _scheme, _, _rest = settings.SQLALCHEMY_DATABASE_URL.partition("://")
+    settings.SQLALCHEMY_ASYNC_DATABASE_URL = f"{_async_drivers.get(_scheme, _scheme)}://{_rest}"
@@ -0,0 +1,53 @@
+# app/db/async_session.py
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.settings import settings
+from app.db.instrumentation import instrument_engine
+
+# Engine assíncrona criada sob demanda: o driver (aiomysql/aiosqlite) só
+# precisa estar instalado quando DB_ASYNC_MODE estiver ativo.
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def get_async_engine():
+    """Retorna (criando na primeira chamada) a AsyncEngine da aplicação."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        options = {"pool_pre_ping": True}
+        if not settings.SQLALCHEMY_ASYNC_DATABASE_URL.startswith("sqlite"):
+            options.update(pool_size=10, max_overflow=20)
+        _async_engine = create_async_engine(settings.SQLALCHEMY_ASYNC_DATABASE_URL, **options)
+        instrument_engine(_async_engine.sync_engine)
+        _AsyncSessionLocal = sessionmaker(
+            bind=_async_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def get_async_db():
+    """
+    Dependency para o FastAPI: gera e fecha uma AsyncSession a cada request.
+    Usage:
+        from fastapi import Depends
+        from app.db.async_session import get_async_db
+
+        @router.get("/items")
+        async def list_items(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Fecha as conexões da engine assíncrona (shutdown da aplicação)."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
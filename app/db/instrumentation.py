@@ -0,0 +1,116 @@
+# app/db/instrumentation.py
+"""
+Instrumentação das consultas SQL.
+
+Registra, via eventos do SQLAlchemy, a quantidade de comandos e o tempo de
+banco de cada requisição, registra em log os comandos lentos e aponta
+comandos idênticos repetidos dentro da mesma requisição (padrão N+1).
+"""
+
+import time
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.settings import settings
+from app.core.logging import logger
+from app.core.metrics import registry
+
+db_statements_total = registry.counter(
+    "db_statements_total", "Total de comandos SQL executados"
+)
+db_statement_duration_seconds = registry.histogram(
+    "db_statement_duration_seconds", "Duração dos comandos SQL em segundos"
+)
+db_slow_statements_total = registry.counter(
+    "db_slow_statements_total", "Comandos SQL acima do limite de lentidão"
+)
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request", "Comandos SQL por requisição", ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+db_time_per_request_seconds = registry.histogram(
+    "db_time_per_request_seconds", "Tempo de banco por requisição em segundos", ("route",)
+)
+db_n_plus_one_total = registry.counter(
+    "db_n_plus_one_total", "Requisições com comandos idênticos repetidos (N+1)", ("route",)
+)
+
+
+class QueryStats:
+    """Contadores de SQL acumulados durante uma requisição."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements = StatementCounter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Comandos executados `threshold` vezes ou mais."""
+        return [(stmt, n) for stmt, n in self.statements.items() if n >= threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+def start_request_stats():
+    """Inicia a coleta para a requisição atual; retorna (stats, token)."""
+    stats = QueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def end_request_stats(token) -> None:
+    _current_stats.reset(token)
+
+
+def report_request_stats(stats: QueryStats, route: str) -> None:
+    """Publica as métricas da requisição e registra possíveis N+1."""
+    db_queries_per_request.observe(route, value=stats.count)
+    db_time_per_request_seconds.observe(route, value=stats.total_time)
+
+    repeated = stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD)
+    if repeated:
+        db_n_plus_one_total.inc(route)
+        for statement, times in repeated:
+            logger.warning(f"Possível N+1 em {route}: comando repetido {times}x: {' '.join(statement.split())[:200]}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    db_statements_total.inc()
+    db_statement_duration_seconds.observe(value=elapsed)
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+        db_slow_statements_total.inc()
+        logger.warning(f"Consulta lenta ({elapsed * 1000:.1f} ms): {' '.join(statement.split())[:500]}")
+
+
+def _handle_error(exception_context):
+    # Comando com erro não dispara after_cursor_execute: descarta o início registrado
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Registra os eventos de instrumentação em uma engine síncrona."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,8 +1,9 @@
 # app/db/session.py
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from app.core.settings import settings
+from app.db.instrumentation import instrument_engine
 
 # Cria engine de conexão com MySQL usando URL do settings
 engine = create_engine(
@@ -12,6 +13,26 @@ engine = create_engine(
     max_overflow=20
 )
 
+# Contagem/tempo de SQL por requisição, consultas lentas e detecção de N+1
+instrument_engine(engine)
+
+# Contador de conexões retiradas do pool (checkouts)
+_pool_counters = {"checkouts": 0}
+
+@event.listens_for(engine, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    _pool_counters["checkouts"] += 1
+
+def pool_stats() -> dict:
+    """Retorna o estado atual do pool de conexões da engine."""
+    pool = engine.pool
+    stats = {"checkouts_total": _pool_counters["checkouts"]}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    return stats
+
 # sessionmaker configurado para gerar sessões atreladas à engine
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -22,6 +43,10 @@ SessionLocal = sessionmaker(
 def get_db():
     """
     Dependency para o FastAPI: gera e fecha sessão do SQLAlchemy a cada request.
+
+    É a única fonte de sessões da API: o FastAPI resolve cada dependência uma
+    única vez por requisição, então `get_current_user` e o handler recebem a
+    mesma sessão e no máximo uma conexão é retirada do pool.
     Usage:
         from fastapi import Depends
         from app.db.session import get_db
@@ -0,0 +1,60 @@
+# app/db/types.py
+"""
+Tipos de coluna compartilhados pelos modelos.
+
+`UUIDType` armazena identificadores UUID como `CHAR(36)` (padrão) ou como
+`BINARY(16)`, conforme `UUID_STORAGE`. Em ambos os modos a aplicação
+continua trabalhando com o UUID em texto canônico (`str`), então serviços,
+cursores de paginação e schemas não mudam; apenas a representação no banco
+(e o tamanho dos índices primários e secundários) é diferente.
+
+No modo binário os bytes seguem a ordem do `UUID_TO_BIN(id)` do MySQL sem
+o `swap_flag`, ou seja, os mesmos bytes de `uuid.UUID(id).bytes`.
+"""
+
+import uuid
+
+from sqlalchemy.types import BINARY, CHAR, TypeDecorator
+
+from app.core.settings import settings
+
+
+def uuid_storage_is_binary() -> bool:
+    return settings.UUID_STORAGE.lower() == "binary"
+
+
+class UUIDType(TypeDecorator):
+    """UUID exposto como `str` e armazenado como CHAR(36) ou BINARY(16)."""
+
+    impl = CHAR(36)
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return str
+
+    def load_dialect_impl(self, dialect):
+        if uuid_storage_is_binary():
+            return dialect.type_descriptor(BINARY(16))
+        return dialect.type_descriptor(CHAR(36))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not uuid_storage_is_binary():
+            return str(value)
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        try:
+            return uuid.UUID(str(value)).bytes
+        except ValueError:
+            # Texto que não é UUID não corresponde a nenhuma linha (ex.: busca
+            # por ID inválido retorna 404, como no modo CHAR(36))
+            return str(value).encode("utf-8")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray)):
+            return str(uuid.UUID(bytes=bytes(value)))
+        return value
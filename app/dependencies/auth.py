@@ -1,13 +1,20 @@
-from typing import Optional
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.settings import settings
-from app.db.session import SessionLocal
+from app.core.cache import TTLCache
+from app.db.async_session import get_async_db
+from app.db.session import get_db
 from app.models.user_model import User
 
 # Define o esquema OAuth2 com token do tipo Bearer
@@ -16,30 +23,54 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 # Contexto do algoritmo de hash das senhas
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# ---------- Funções auxiliares ----------
 
-def get_db():
-    """Fornece uma instância da sessão do banco para dependências."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+@dataclass(frozen=True)
+class Principal:
+    """
+    Representação leve e desacoplada da sessão do usuário autenticado.
+
+    Mantida em cache entre requisições no lugar do objeto ORM `User`.
+    """
+    id: str
+    name: str
+    email: str
+    created_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, name=user.name, email=user.email, created_at=user.created_at)
+
+
+# Cache (sub, exp) -> Principal; local a cada processo worker
+principal_cache = TTLCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+# ---------- Funções auxiliares ----------
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """Busca um usuário no banco de dados pelo email."""
     return db.query(User).filter(User.email == email).first()
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """Valida e retorna o usuário autenticado com base no token JWT."""
-    credentials_exception = HTTPException(
+def invalidate_principal(email: Optional[str]) -> None:
+    """Remove do cache todos os tokens associados ao e-mail informado."""
+    if email:
+        principal_cache.delete_where(lambda key: key[0] == email)
+
+def principal_cache_stats() -> dict:
+    """Contadores de acerto/erro do cache de usuários autenticados."""
+    return principal_cache.stats()
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Não foi possível validar as credenciais.",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _decode_token(token: str) -> Tuple[str, Optional[float]]:
+    """Valida o token JWT e retorna (sub, exp); lança 401 se inválido."""
     try:
         payload = jwt.decode(
             token,
@@ -48,12 +79,54 @@ def get_current_user(
         )
         email: str = payload.get("sub")
         if email is None:
-            raise credentials_exception
+            raise _credentials_exception()
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    return email, payload.get("exp")
 
-    user = get_user_by_email(db, email)
+def _remember_principal(user: Optional[User], email: str, exp: Optional[float]) -> Principal:
+    """Converte o usuário carregado em Principal e o guarda no cache."""
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    principal = Principal.from_user(user)
+    if settings.PRINCIPAL_CACHE_TTL_SECONDS > 0:
+        expires_at = None
+        if exp is not None:
+            expires_at = time.monotonic() + (float(exp) - time.time())
+        principal_cache.set((email, exp), principal, expires_at=expires_at)
+    return principal
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    Valida o token JWT e retorna o usuário autenticado.
+
+    O resultado é mantido em cache por (sub, exp) até o menor entre o TTL
+    configurado e a expiração do token, evitando a consulta ao banco.
+    """
+    email, exp = _decode_token(token)
+    principal = principal_cache.get((email, exp))
+    if principal is not None:
+        return principal
+    return _remember_principal(get_user_by_email(db, email), email, exp)
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """
+    Variante assíncrona de `get_current_user` para as rotas de DB_ASYNC_MODE.
 
-    return user
+    Usa o mesmo cache de usuários autenticados e, em caso de falta, consulta
+    o banco pela `AsyncSession` da requisição, sem ocupar uma thread do pool
+    nem abrir uma segunda sessão síncrona.
+    """
+    email, exp = _decode_token(token)
+    principal = principal_cache.get((email, exp))
+    if principal is not None:
+        return principal
+    result = await db.execute(select(User).where(User.email == email))
+    return _remember_principal(result.scalars().first(), email, exp)
@@ -0,0 +1,159 @@
+"""
+Acúmulo diário das multas de empréstimos em atraso.
+
+Atualiza `fine_amount` de todos os empréstimos abertos e vencidos com o valor
+devido na data de execução, para que as leituras apenas selecionem o valor já
+calculado. O processamento é feito em lotes com paginação por
+`(due_date, id)`, apoiada no índice `idx_loans_overdue (due_date, return_date)`,
+e cada lote é um único UPDATE com o cálculo no banco.
+
+A execução é idempotente por data: `fine_accrued_on` registra a última data
+aplicada e os empréstimos já atualizados nessa data são ignorados.
+
+Uso (ex.: cron diário):
+    python -m app.jobs.fine_accrual [--date AAAA-MM-DD] [--chunk-size 1000]
+
+Também pode rodar dentro da API a cada FINE_ACCRUAL_INTERVAL_SECONDS.
+"""
+
+import argparse
+import threading
+import time
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.core.logging import logger
+from app.core.metrics import registry
+from app.db.session import SessionLocal
+from app.models.loan_model import Loan
+from app.services.catalog_cache import bump_data_version
+from app.services.loan_service import days_late_expression
+from app.utils.pagination import apply_keyset
+
+fine_accrual_runs_total = registry.counter(
+    "fine_accrual_runs_total", "Execuções do acúmulo de multas", ("status",)
+)
+fine_accrual_rows_total = registry.counter(
+    "fine_accrual_rows_total", "Empréstimos com multa atualizada pelo acúmulo"
+)
+fine_accrual_duration_seconds = registry.histogram(
+    "fine_accrual_duration_seconds", "Duração do acúmulo de multas em segundos",
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+)
+
+
+def accrue_overdue_fines(db: Session, run_date: Optional[date] = None, chunk_size: int = 1000) -> int:
+    """
+    Atualiza as multas dos empréstimos em atraso para `run_date` (padrão: hoje).
+    Retorna a quantidade de empréstimos atualizados.
+    """
+    run_date = run_date or date.today()
+    run_value = literal(run_date)
+    fine = days_late_expression(db.get_bind().dialect.name, run_value) * settings.FINE_PER_DAY
+    keyset_columns = [Loan.due_date, Loan.id]
+
+    started = time.perf_counter()
+    updated = 0
+    cursor_values = None
+    try:
+        while True:
+            query = apply_keyset(
+                select(Loan.due_date, Loan.id).where(
+                    Loan.due_date < run_date,
+                    Loan.return_date.is_(None)
+                ),
+                keyset_columns,
+                cursor_values
+            ).limit(chunk_size)
+            rows = db.execute(query).all()
+            if not rows:
+                break
+
+            result = db.execute(
+                update(Loan)
+                .where(
+                    Loan.id.in_([row.id for row in rows]),
+                    Loan.return_date.is_(None),
+                    or_(Loan.fine_accrued_on.is_(None), Loan.fine_accrued_on != run_date)
+                )
+                .values(fine_amount=fine, fine_accrued_on=run_value)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            updated += result.rowcount or 0
+            cursor_values = [rows[-1].due_date, rows[-1].id]
+    except Exception as e:
+        db.rollback()
+        fine_accrual_runs_total.inc("failed")
+        logger.error(f"Falha no acúmulo de multas de {run_date}: {str(e)}")
+        raise
+
+    if updated:
+        bump_data_version()
+    elapsed = time.perf_counter() - started
+    fine_accrual_runs_total.inc("success")
+    fine_accrual_rows_total.inc(amount=updated)
+    fine_accrual_duration_seconds.observe(value=elapsed)
+    logger.info(f"Acúmulo de multas de {run_date}: {updated} empréstimo(s) atualizado(s) em {elapsed:.2f}s")
+    return updated
+
+
+def run_fine_accrual(run_date: Optional[date] = None, chunk_size: int = 1000) -> int:
+    """Executa o acúmulo com uma sessão própria."""
+    db = SessionLocal()
+    try:
+        return accrue_overdue_fines(db, run_date, chunk_size)
+    finally:
+        db.close()
+
+
+_scheduler_stop = threading.Event()
+_scheduler_thread: Optional[threading.Thread] = None
+
+
+def _scheduler_loop(interval: float) -> None:
+    while not _scheduler_stop.is_set():
+        try:
+            run_fine_accrual()
+        except Exception:
+            pass  # falha já registrada em log e métricas; tenta no próximo ciclo
+        _scheduler_stop.wait(interval)
+
+
+def start_fine_accrual_scheduler() -> None:
+    """
+    Inicia o acúmulo periódico dentro da API quando
+    FINE_ACCRUAL_INTERVAL_SECONDS for maior que zero.
+    """
+    global _scheduler_thread
+    interval = settings.FINE_ACCRUAL_INTERVAL_SECONDS
+    if interval <= 0 or _scheduler_thread is not None:
+        return
+    _scheduler_stop.clear()
+    _scheduler_thread = threading.Thread(
+        target=_scheduler_loop, args=(interval,), name="fine-accrual", daemon=True
+    )
+    _scheduler_thread.start()
+
+
+def stop_fine_accrual_scheduler() -> None:
+    """Interrompe o acúmulo periódico (shutdown da aplicação)."""
+    global _scheduler_thread
+    _scheduler_stop.set()
+    _scheduler_thread = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Atualiza as multas dos empréstimos em atraso")
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="Data de referência (AAAA-MM-DD)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Empréstimos por lote")
+    args = parser.parse_args()
+    run_fine_accrual(args.date, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
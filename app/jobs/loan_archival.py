@@ -0,0 +1,127 @@
+"""
+Arquivamento de empréstimos devolvidos antigos.
+
+Move para `loans_archive` os empréstimos devolvidos há mais de
+LOAN_ARCHIVE_AFTER_DAYS dias, para que `loans` e seus índices contenham
+apenas os empréstimos ativos e recentes usados nas consultas do dia a dia
+(contagem de ativos, atrasos, listagens por usuário).
+
+O processamento é feito em lotes paginados por `(return_date, id)`, apoiados
+no índice `idx_loans_return_id` (db/07_loans_archive.sql), de modo que cada
+SELECT ... FOR UPDATE lê e bloqueia apenas as linhas do lote. Cada lote é
+uma transação com um INSERT ... SELECT no arquivo e um DELETE dos mesmos
+IDs em `loans`, então uma interrupção não deixa empréstimos duplicados nem
+perdidos.
+
+Uso (ex.: cron semanal):
+    python -m app.jobs.loan_archival [--older-than-days 365] [--chunk-size 1000]
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.core.logging import logger
+from app.core.metrics import registry
+from app.db.session import SessionLocal
+from app.models.loan_archive_model import LoanArchive
+from app.models.loan_model import Loan
+from app.services.catalog_cache import bump_data_version
+from app.utils.pagination import apply_keyset
+
+loan_archival_runs_total = registry.counter(
+    "loan_archival_runs_total", "Execuções do arquivamento de empréstimos", ("status",)
+)
+loan_archival_rows_total = registry.counter(
+    "loan_archival_rows_total", "Empréstimos movidos para loans_archive"
+)
+
+ARCHIVE_COLUMNS = ["id", "user_id", "book_id", "loan_date", "due_date", "return_date", "fine_amount", "archived_at"]
+
+
+def archive_returned_loans(db: Session, older_than_days: Optional[int] = None,
+                           chunk_size: Optional[int] = None) -> int:
+    """
+    Move os empréstimos devolvidos antes do limite para `loans_archive`.
+    Retorna a quantidade de empréstimos arquivados.
+    """
+    older_than_days = settings.LOAN_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    chunk_size = chunk_size or settings.LOAN_ARCHIVE_CHUNK_SIZE
+    cutoff = date.today() - timedelta(days=older_than_days)
+    keyset_columns = [Loan.return_date, Loan.id]
+
+    started = time.perf_counter()
+    archived = 0
+    cursor_values = None
+    try:
+        while True:
+            query = apply_keyset(
+                select(Loan.return_date, Loan.id).where(
+                    Loan.return_date.is_not(None),
+                    Loan.return_date < cutoff
+                ),
+                keyset_columns,
+                cursor_values
+            ).limit(chunk_size).with_for_update()
+            rows = db.execute(query).all()
+            if not rows:
+                break
+
+            loan_ids = [row.id for row in rows]
+            db.execute(
+                insert(LoanArchive).from_select(
+                    ARCHIVE_COLUMNS,
+                    select(
+                        Loan.id, Loan.user_id, Loan.book_id, Loan.loan_date, Loan.due_date,
+                        Loan.return_date, func.coalesce(Loan.fine_amount, 0),
+                        literal(datetime.now(timezone.utc), LoanArchive.archived_at.type)
+                    ).where(Loan.id.in_(loan_ids))
+                )
+            )
+            db.execute(
+                delete(Loan)
+                .where(Loan.id.in_(loan_ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            archived += len(loan_ids)
+            cursor_values = [rows[-1].return_date, rows[-1].id]
+    except Exception as e:
+        db.rollback()
+        loan_archival_runs_total.inc("failed")
+        logger.error(f"Falha no arquivamento de empréstimos devolvidos antes de {cutoff}: {str(e)}")
+        raise
+
+    if archived:
+        bump_data_version()
+    loan_archival_runs_total.inc("success")
+    loan_archival_rows_total.inc(amount=archived)
+    logger.info(
+        f"Arquivamento de empréstimos devolvidos antes de {cutoff}: "
+        f"{archived} empréstimo(s) movido(s) em {time.perf_counter() - started:.2f}s"
+    )
+    return archived
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move empréstimos devolvidos antigos para loans_archive")
+    parser.add_argument("--older-than-days", type=int, default=None,
+                        help="Idade mínima da devolução em dias (padrão: LOAN_ARCHIVE_AFTER_DAYS)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Empréstimos por transação (padrão: LOAN_ARCHIVE_CHUNK_SIZE)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        archive_returned_loans(db, args.older_than_days, args.chunk_size)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Reconciliação do contador de empréstimos ativos (`users.active_loan_count`).
+
+O contador é mantido pelos serviços de empréstimo na mesma transação de
+criação, devolução e exclusão; este comando o reconstrói a partir da tabela
+`loans`, em lotes de usuários, para corrigir divergências (ex.: alterações
+manuais no banco ou a carga inicial após a migração).
+
+Uso:
+    python -m app.jobs.loan_counters [--batch-size 1000]
+"""
+
+import argparse
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+from app.db.session import SessionLocal
+from app.models.loan_model import Loan
+from app.models.user_model import User
+
+
+def reconcile_active_loan_counts(db: Session, batch_size: int = 1000) -> int:
+    """
+    Recalcula `active_loan_count` de todos os usuários.
+    Retorna a quantidade de usuários cujo contador foi corrigido.
+    """
+    active_loans = (
+        select(func.count(Loan.id))
+        .where(Loan.user_id == User.id, Loan.return_date.is_(None))
+        .scalar_subquery()
+    )
+
+    fixed = 0
+    last_id = None
+    while True:
+        query = select(User.id).order_by(User.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(User.id > last_id)
+        user_ids = db.execute(query).scalars().all()
+        if not user_ids:
+            break
+
+        result = db.execute(
+            update(User)
+            .where(User.id.in_(user_ids), User.active_loan_count != active_loans)
+            .values(active_loan_count=active_loans)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        fixed += result.rowcount or 0
+        last_id = user_ids[-1]
+
+    logger.info(f"Contadores de empréstimos ativos reconciliados: {fixed} usuário(s) corrigido(s)")
+    return fixed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconstrói users.active_loan_count a partir de loans")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Usuários por lote")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        reconcile_active_loan_counts(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,8 @@ como nome e biografia do autor.
 """
 
 from sqlalchemy import Column, String, Text
-from sqlalchemy.dialects.mysql import CHAR
 from app.db.base import Base
+from app.db.types import UUIDType
 
 class Author(Base):
     """
@@ -20,6 +20,6 @@ class Author(Base):
     """
     __tablename__ = "authors"
 
-    id = Column(CHAR(36), primary_key=True, index=True)
+    id = Column(UUIDType, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     bio = Column(Text, nullable=True)
@@ -6,10 +6,10 @@ título, autor, datas e controle de cópias.
 """
 
 from sqlalchemy import Column, String, Integer, Date, ForeignKey
-from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from app.models.author_model import Author
 from app.db.base import Base
+from app.db.types import UUIDType
 
 class Book(Base):
     """
@@ -26,9 +26,9 @@ class Book(Base):
     """
     __tablename__ = "books"
 
-    id = Column(CHAR(36), primary_key=True, index=True)
+    id = Column(UUIDType, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
-    author_id = Column(CHAR(36), ForeignKey("authors.id"), nullable=False)
+    author_id = Column(UUIDType, ForeignKey("authors.id"), nullable=False)
     published_date = Column(Date)
     available_copies = Column(Integer, default=0)
     total_copies = Column(Integer, default=1)
@@ -0,0 +1,51 @@
+"""
+Modelo de banco de dados para o histórico arquivado de empréstimos.
+
+Define a estrutura da tabela `loans_archive`, que recebe do job de
+arquivamento os empréstimos devolvidos há mais tempo, mantendo a tabela
+`loans` (e seus índices) restrita aos empréstimos recentes.
+"""
+
+from sqlalchemy import Column, Date, DateTime, Index, Numeric
+from datetime import datetime, timezone
+from app.db.base import Base
+from app.db.types import UUIDType
+
+class LoanArchive(Base):
+    """
+    Representa um empréstimo devolvido movido para o arquivo.
+
+    Não há chaves estrangeiras: tabelas particionadas do MySQL não as
+    suportam e o arquivo não deve impedir a exclusão de livros e usuários.
+    A chave primária inclui `return_date` para permitir o particionamento
+    por ano da devolução.
+
+    Atributos:
+        id (str): Identificador do empréstimo original (UUID).
+        user_id (str): Usuário do empréstimo.
+        book_id (str): Livro emprestado.
+        loan_date (date): Data em que o livro foi emprestado.
+        due_date (date): Data prevista para devolução.
+        return_date (date): Data da devolução.
+        fine_amount (Decimal): Valor final da multa.
+        archived_at (datetime): Momento em que o empréstimo foi arquivado.
+    """
+    __tablename__ = "loans_archive"
+
+    id = Column(UUIDType, primary_key=True)
+    return_date = Column(Date, primary_key=True)
+    user_id = Column(UUIDType, nullable=False)
+    book_id = Column(UUIDType, nullable=False)
+
+    loan_date = Column(Date, nullable=False)
+    due_date = Column(Date, nullable=False)
+
+    fine_amount = Column(Numeric(10, 2), default=0.00)
+    archived_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (
+        Index("idx_loans_archive_user_loan_date", "user_id", "loan_date"),
+    )
@@ -6,12 +6,12 @@ com campos de data de empréstimo, devolução e multa.
 """
 
 from sqlalchemy import Column, Date, ForeignKey, Numeric
-from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.models.book_model import Book
 from app.models.user_model import User
 from app.db.base import Base
+from app.db.types import UUIDType
 
 class Loan(Base):
     """
@@ -25,20 +25,22 @@ class Loan(Base):
         due_date (date): Data prevista para devolução.
         return_date (date | None): Data real da devolução (opcional).
         fine_amount (Decimal): Valor da multa por atraso, se houver.
+        fine_accrued_on (date | None): Última data em que a multa em aberto foi acumulada.
         user (User): Objeto de relacionamento com o usuário.
         book (Book): Objeto de relacionamento com o livro.
     """
     __tablename__ = "loans"
 
-    id = Column(CHAR(36), primary_key=True, index=True)
-    user_id = Column(CHAR(36), ForeignKey("users.id"), nullable=False)
-    book_id = Column(CHAR(36), ForeignKey("books.id"), nullable=False)
+    id = Column(UUIDType, primary_key=True, index=True)
+    user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False)
+    book_id = Column(UUIDType, ForeignKey("books.id"), nullable=False)
 
     loan_date = Column(Date, nullable=False)
     due_date = Column(Date, nullable=False)
     return_date = Column(Date, nullable=True)
 
     fine_amount = Column(Numeric(10, 2), default=0.00)
+    fine_accrued_on = Column(Date, nullable=True)
 
     user = relationship("User", backref="loans")
     book = relationship("Book", backref="loans")
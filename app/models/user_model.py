@@ -5,10 +5,10 @@ Define a estrutura da tabela `users`, incluindo campos
 como nome, e-mail, senha criptografada e data de criação.
 """
 
-from sqlalchemy import Column, String, DateTime
-from sqlalchemy.dialects.mysql import CHAR
+from sqlalchemy import Column, String, DateTime, Integer
 from datetime import datetime, timezone
 from app.db.base import Base
+from app.db.types import UUIDType
 
 class User(Base):
     """
@@ -20,10 +20,11 @@ class User(Base):
         email (str): Endereço de e-mail do usuário (único).
         hashed_password (str): Senha do usuário criptografada.
         created_at (datetime): Data de criação do registro.
+        active_loan_count (int): Empréstimos ativos (mantido pelos serviços de empréstimo).
     """
     __tablename__ = "users"
 
-    id = Column(CHAR(36), primary_key=True, index=True)
+    id = Column(UUIDType, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
@@ -31,3 +32,4 @@ class User(Base):
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc)
     )
+    active_loan_count = Column(Integer, nullable=False, default=0, server_default="0")
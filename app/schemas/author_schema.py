@@ -47,3 +47,14 @@ class AuthorUpdate(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class AuthorSummary(BaseModel):
+    """
+    Resumo de um autor embutido em respostas de outros recursos.
+    """
+    id: UUID
+    name: str
+
+    class Config:
+        orm_mode = True
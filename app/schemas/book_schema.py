@@ -7,8 +7,11 @@ de dados relacionados aos livros cadastrados no sistema.
 
 from pydantic import BaseModel, Field
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 from datetime import date
+from enum import Enum
+
+from app.schemas.author_schema import AuthorSummary
 
 
 class BookBase(BaseModel):
@@ -54,3 +57,49 @@ class BookUpdate(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class BookSummary(BaseModel):
+    """
+    Resumo de um livro embutido em respostas de outros recursos.
+    """
+    id: UUID
+    title: str
+    author_id: UUID
+    author: Optional[AuthorSummary] = Field(None, description="Resumo do autor (include=author)")
+
+    class Config:
+        orm_mode = True
+
+
+class BookExpandedOut(BookOut):
+    """
+    Modelo de saída de livros com relacionamentos expandidos (`include`).
+    """
+    author: Optional[AuthorSummary] = Field(None, description="Resumo do autor (include=author)")
+
+
+class BookImportFormat(str, Enum):
+    """Formatos aceitos na importação em lote de livros."""
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class BookImportRowError(BaseModel):
+    """
+    Erro de uma linha da importação em lote.
+    """
+    line: int = Field(..., ge=1, description="Linha do arquivo (no CSV, contando o cabeçalho)")
+    title: Optional[str] = Field(None, description="Título informado na linha, se houver")
+    error: str = Field(..., description="Motivo da rejeição")
+
+
+class BookImportOut(BaseModel):
+    """
+    Modelo de saída da importação em lote, com o relatório de erros por linha.
+    """
+    received: int = Field(..., ge=0, description="Linhas lidas do arquivo")
+    created: int = Field(..., ge=0, description="Livros cadastrados")
+    failed: int = Field(..., ge=0, description="Linhas rejeitadas")
+    errors: List[BookImportRowError] = Field(..., description="Erros por linha (limitado a BOOK_IMPORT_MAX_ERRORS)")
+    errors_truncated: bool = Field(False, description="Indica que há mais erros do que os listados")
@@ -9,7 +9,18 @@ from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
+
+from app.schemas.book_schema import BookSummary
+from app.schemas.user_schema import UserSummary
+
+
+class LoanStatus(str, Enum):
+    """Situação de um empréstimo usada nos filtros de listagem."""
+    active = "active"
+    returned = "returned"
+    overdue = "overdue"
 
 
 class LoanBase(BaseModel):
@@ -52,6 +63,24 @@ class LoanOut(LoanBase):
     class Config:
         orm_mode = True
 
+class LoanExpandedOut(LoanOut):
+    """
+    Modelo de saída de empréstimos com relacionamentos expandidos (`include`).
+    """
+    book: Optional[BookSummary] = Field(None, description="Resumo do livro (include=book ou include=author)")
+    user: Optional[UserSummary] = Field(None, description="Resumo do usuário (include=user)")
+
+
+class OverdueLoanOut(LoanOut):
+    """
+    Modelo de saída da fila de empréstimos em atraso.
+    Inclui os dias de atraso e, se solicitado, resumos do usuário e do livro.
+    """
+    days_overdue: int = Field(..., ge=1, description="Dias de atraso até hoje")
+    user: Optional[UserSummary] = Field(None, description="Resumo do usuário (include_details=true)")
+    book: Optional[BookSummary] = Field(None, description="Resumo do livro (include_details=true)")
+
+
 class LoanUpdate(BaseModel):
     """
     Modelo para atualização de um empréstimo.
@@ -65,3 +94,73 @@ class LoanUpdate(BaseModel):
     class Config:
         orm_mode = True
 
+
+
+class LoanBatchCreate(BaseModel):
+    """
+    Modelo para criação de vários empréstimos de um mesmo usuário
+    em uma única transação.
+    """
+    user_id: UUID = Field(..., description="ID do usuário que realizou os empréstimos")
+    book_ids: List[UUID] = Field(..., min_items=1, max_items=50, description="IDs dos livros emprestados")
+    loan_date: Optional[date] = Field(None, description="Data do empréstimo (padrão: hoje)")
+
+
+class LoanBatchItemStatus(str, Enum):
+    """Resultado de cada livro em um empréstimo em lote."""
+    created = "created"
+    not_found = "not_found"
+    unavailable = "unavailable"
+    limit_reached = "limit_reached"
+    duplicate = "duplicate"
+
+
+class LoanBatchItem(BaseModel):
+    """
+    Resultado individual de um livro no empréstimo em lote.
+    """
+    book_id: UUID
+    status: LoanBatchItemStatus
+    loan: Optional[LoanOut] = Field(None, description="Empréstimo criado, se houver")
+
+
+class LoanBatchOut(BaseModel):
+    """
+    Modelo de saída do empréstimo em lote, com o resultado por livro.
+    """
+    user_id: UUID
+    created: int = Field(..., ge=0, description="Quantidade de empréstimos criados")
+    items: List[LoanBatchItem]
+
+
+class LoanBatchReturn(BaseModel):
+    """
+    Modelo para devolução de vários empréstimos na mesma data.
+    """
+    loan_ids: List[UUID] = Field(..., min_items=1, max_items=500, description="IDs dos empréstimos devolvidos")
+    return_date: Optional[date] = Field(None, description="Data de devolução (padrão: hoje)")
+
+
+class LoanReturnItemStatus(str, Enum):
+    """Resultado de cada empréstimo em uma devolução em lote."""
+    returned = "returned"
+    not_found = "not_found"
+    already_returned = "already_returned"
+
+
+class LoanReturnItem(BaseModel):
+    """
+    Resultado individual de um empréstimo na devolução em lote.
+    """
+    loan_id: UUID
+    status: LoanReturnItemStatus
+    fine_amount: Optional[Decimal] = Field(None, ge=0, description="Multa calculada, se devolvido")
+
+
+class LoanBatchReturnOut(BaseModel):
+    """
+    Modelo de saída da devolução em lote, com o resultado por empréstimo.
+    """
+    return_date: date
+    returned: int = Field(..., ge=0, description="Quantidade de empréstimos devolvidos")
+    items: List[LoanReturnItem]
@@ -0,0 +1,50 @@
+"""
+Schemas para os jobs de geração de relatórios.
+
+Define os modelos Pydantic utilizados para solicitar a geração assíncrona
+de relatórios e consultar seu andamento.
+"""
+
+from pydantic import BaseModel, Field
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class ReportKind(str, Enum):
+    """Tipos de relatório disponíveis para geração em background."""
+    full_pdf = "full_pdf"
+    books_csv = "books_csv"
+
+
+class ReportJobStatus(str, Enum):
+    """Estados possíveis de um job de relatório."""
+    pending = "pending"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
+class ReportJobCreate(BaseModel):
+    """
+    Modelo para solicitação de um novo relatório.
+    """
+    kind: ReportKind = Field(ReportKind.full_pdf, description="Tipo de relatório")
+
+
+class ReportJobOut(BaseModel):
+    """
+    Modelo de saída com o andamento de um job de relatório.
+    Inclui a URL de download quando o arquivo estiver pronto.
+    """
+    id: str
+    kind: ReportKind
+    status: ReportJobStatus
+    reused: bool = Field(False, description="Indica se um relatório já gerado foi reaproveitado")
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None
+
+    class Config:
+        orm_mode = True
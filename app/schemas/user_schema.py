@@ -49,3 +49,15 @@ class UserOut(UserBase):
 
     class Config:
         orm_mode = True
+
+
+class UserSummary(BaseModel):
+    """
+    Resumo de um usuário embutido em respostas de outros recursos.
+    """
+    id: UUID
+    name: str
+    email: EmailStr
+
+    class Config:
+        orm_mode = True
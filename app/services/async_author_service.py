@@ -0,0 +1,74 @@
+"""
+Variantes assíncronas (AsyncSession) dos serviços de leitura de autores.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from typing import List
+
+from app.models.author_model import Author
+from app.services.reference_cache import (
+    AuthorRecord,
+    BookMetadata,
+    author_books_copies_query,
+    author_books_metadata_query,
+    current_version,
+    lookup_author,
+    lookup_author_books,
+    merge_author_books,
+    remember_author,
+    remember_author_books,
+)
+
+
+async def list_authors_service(db: AsyncSession) -> List[Author]:
+    """
+    Lista todos os autores cadastrados.
+    """
+    result = await db.execute(select(Author))
+    return result.scalars().all()
+
+
+async def get_author_service(db: AsyncSession, author_id: str) -> AuthorRecord:
+    """
+    Busca um autor pelo ID (com cache L1 do worker).
+    """
+    version = current_version()
+    record = lookup_author(author_id)
+    if record is not None:
+        return record
+    result = await db.execute(select(Author).where(Author.id == author_id))
+    author = result.scalars().first()
+    if not author:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Autor não encontrado"
+        )
+    return remember_author(author, version)
+
+
+async def _author_books_metadata(db: AsyncSession, author_id: str, refresh: bool = False) -> List[BookMetadata]:
+    version = current_version()
+    records = None if refresh else lookup_author_books(author_id)
+    if records is not None:
+        return records
+    result = await db.execute(author_books_metadata_query(author_id))
+    return remember_author_books(author_id, result.all(), version)
+
+
+async def list_books_by_author_service(db: AsyncSession, author_id: str) -> List[dict]:
+    """
+    Retorna todos os livros de um autor, validando a existência do autor.
+
+    Mesma estratégia da versão síncrona: autor e metadados dos livros vêm
+    do cache L1 e do banco são lidas apenas as cópias atuais.
+    """
+    author = await get_author_service(db, author_id)
+
+    copies = (await db.execute(author_books_copies_query(author.id))).all()
+    books = merge_author_books(await _author_books_metadata(db, author.id), copies)
+    if books is None:
+        books = merge_author_books(await _author_books_metadata(db, author.id, refresh=True), copies, strict=False)
+    return books
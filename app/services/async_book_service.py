@@ -0,0 +1,92 @@
+"""
+Variantes assíncronas (AsyncSession) dos serviços de leitura de livros.
+
+Reutilizam as consultas montadas em `book_service`, garantindo as mesmas
+regras de filtro e ordenação nos modos síncrono e assíncrono.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from typing import Optional, List, Set, Tuple
+
+from app.models.book_model import Book
+from app.services.book_service import (
+    book_sort_spec,
+    build_books_query,
+    build_books_by_availability_query,
+    search_books_service as _search_books_sync
+)
+from app.utils.pagination import split_page
+from app.utils.expansion import book_load_options
+
+
+async def get_book_service(db: AsyncSession, book_id: str) -> Book:
+    """
+    Busca um livro pelo seu ID.
+    """
+    result = await db.execute(select(Book).where(Book.id == book_id))
+    book = result.scalars().first()
+    if not book:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Livro não encontrado")
+    return book
+
+
+async def list_books_service(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    title: Optional[str] = None,
+    author_id: Optional[str] = None,
+    order_by: Optional[str] = "title",
+    cursor: Optional[str] = None,
+    include: Set[str] = frozenset()
+) -> Tuple[List[Book], Optional[str]]:
+    """
+    Retorna livros cadastrados com paginação (offset ou cursor), filtro e ordenação.
+    """
+    query = build_books_query(title, author_id, order_by, cursor).options(*book_load_options(include))
+    if not cursor:
+        query = query.offset(skip)
+
+    result = await db.execute(query.limit(limit + 1))
+    sort_key, attributes, _ = book_sort_spec(order_by)
+    return split_page(result.scalars().all(), limit, sort_key, attributes)
+
+
+async def list_books_by_availability_service(
+    db: AsyncSession,
+    status: bool,
+    skip: int = 0,
+    limit: int = 10,
+    order_by: Optional[str] = "title",
+    cursor: Optional[str] = None,
+    include: Set[str] = frozenset()
+) -> Tuple[List[Book], Optional[str]]:
+    """
+    Lista livros disponíveis ou indisponíveis conforme parâmetro,
+    com paginação (offset ou cursor) e ordenação.
+    """
+    query = build_books_by_availability_query(status, order_by, cursor).options(*book_load_options(include))
+    if not cursor:
+        query = query.offset(skip)
+
+    result = await db.execute(query.limit(limit + 1))
+    sort_key, attributes, _ = book_sort_spec(order_by, allow_desc=True)
+    return split_page(result.scalars().all(), limit, sort_key, attributes)
+
+
+async def search_books_service(
+    db: AsyncSession,
+    q: str,
+    skip: int = 0,
+    limit: int = 10,
+    author_id: Optional[str] = None,
+    include: Set[str] = frozenset()
+) -> List[dict]:
+    """
+    Busca livros por relevância. Executa o serviço síncrono via `run_sync`,
+    que escolhe entre FULLTEXT (MySQL) e o índice de trigramas em memória.
+    """
+    return await db.run_sync(_search_books_sync, q, skip, limit, author_id, include)
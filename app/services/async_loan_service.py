@@ -0,0 +1,107 @@
+"""
+Variantes assíncronas (AsyncSession) dos serviços de leitura de empréstimos.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from typing import List, Optional, Set, Tuple
+from datetime import date
+
+from app.models.loan_model import Loan
+from app.schemas.loan_schema import LoanStatus
+from app.services.loan_service import (
+    LOAN_LIST_SORT_KEY,
+    LOAN_LIST_SORT_ATTRIBUTES,
+    build_archived_history_query,
+    build_loans_query,
+    build_overdue_loans_query,
+    overdue_page,
+    page_size
+)
+from app.utils.pagination import split_page
+from app.utils.expansion import loan_load_options
+
+
+async def list_loans_service(
+    db: AsyncSession,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    loan_status: Optional[LoanStatus] = None,
+    user_id: Optional[str] = None,
+    book_id: Optional[str] = None,
+    loan_date_from: Optional[date] = None,
+    loan_date_to: Optional[date] = None,
+    due_date_from: Optional[date] = None,
+    due_date_to: Optional[date] = None,
+    include: Set[str] = frozenset()
+) -> Tuple[List[Loan], Optional[str]]:
+    """
+    Retorna uma página de empréstimos, com filtros, e o cursor da próxima página.
+    Os relacionamentos em `include` são carregados na mesma consulta.
+    """
+    limit = page_size(limit)
+    query = build_loans_query(
+        loan_status, user_id, book_id,
+        loan_date_from, loan_date_to, due_date_from, due_date_to,
+        cursor
+    ).options(*loan_load_options(include))
+    result = await db.execute(query.limit(limit + 1))
+    return split_page(result.scalars().all(), limit, LOAN_LIST_SORT_KEY, LOAN_LIST_SORT_ATTRIBUTES)
+
+
+async def list_overdue_loans_service(
+    db: AsyncSession,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    include_details: bool = False
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Retorna uma página da fila de empréstimos em atraso, do vencimento mais
+    antigo para o mais recente, e o cursor da próxima página.
+    """
+    limit = page_size(limit)
+    query = build_overdue_loans_query(cursor, include_details)
+    result = await db.execute(query.limit(limit + 1))
+    return overdue_page(result.all(), limit, include_details)
+
+
+async def get_loan_service(db: AsyncSession, loan_id: str) -> Loan:
+    """
+    Busca um empréstimo pelo seu ID.
+    """
+    result = await db.execute(select(Loan).where(Loan.id == loan_id))
+    loan = result.scalars().first()
+    if not loan:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Empréstimo não encontrado"
+        )
+    return loan
+
+
+async def list_active_loans_by_user_service(db: AsyncSession, user_id: str) -> List[Loan]:
+    result = await db.execute(select(Loan).where(
+        Loan.user_id == user_id,
+        Loan.return_date == None
+    ))
+    return result.scalars().all()
+
+
+async def list_overdue_loans_by_user_service(db: AsyncSession, user_id: str) -> List[Loan]:
+    today = date.today()
+    result = await db.execute(select(Loan).where(
+        Loan.user_id == user_id,
+        Loan.return_date == None,
+        Loan.due_date < today
+    ))
+    return result.scalars().all()
+
+
+async def list_loan_history_by_user_service(db: AsyncSession, user_id: str, include_archived: bool = False) -> List:
+    if include_archived:
+        result = await db.execute(build_archived_history_query(user_id))
+        return [dict(row) for row in result.mappings().all()]
+    result = await db.execute(select(Loan).where(Loan.user_id == user_id))
+    return result.scalars().all()
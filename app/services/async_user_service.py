@@ -0,0 +1,33 @@
+"""
+Variantes assíncronas (AsyncSession) dos serviços de leitura de usuários.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from typing import List
+
+from app.models.user_model import User
+
+
+async def list_users_service(db: AsyncSession) -> List[User]:
+    """
+    Retorna uma lista com todos os usuários cadastrados.
+    """
+    result = await db.execute(select(User))
+    return result.scalars().all()
+
+
+async def get_user_service(db: AsyncSession, user_id: str) -> User:
+    """
+    Busca um usuário pelo ID.
+    """
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalars().first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuário não encontrado"
+        )
+    return user
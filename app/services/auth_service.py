@@ -12,12 +12,12 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from datetime import timedelta
 
-from app.core.security import authenticate_user, create_access_token
+from app.core.security import authenticate_user_async, create_access_token
 from app.core.settings import settings
 from app.core.logging import logger
 
 
-def login_for_access_token_service(    
+async def login_for_access_token_service(
     db: Session,
     form_data: OAuth2PasswordRequestForm
 ):
@@ -38,7 +38,7 @@ def login_for_access_token_service(
 
         logger.info(f"Tentativa de login para o usuário: {form_data}")
 
-        user = authenticate_user(form_data.username, form_data.password, db)        
+        user = await authenticate_user_async(form_data.username, form_data.password, db)
 
         # Se o usuário não for encontrado ou a senha estiver incorreta
         if not user:
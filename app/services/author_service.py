@@ -13,10 +13,19 @@ Inclui regras de negócio para:
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
-from uuid import uuid4
-
 from app.models.author_model import Author
 from app.schemas.author_schema import AuthorCreate
+from app.services.book_service import book_search_index
+from app.services.catalog_cache import AUTHORS, catalog_cache, invalidate_authors
+from app.services.reference_cache import (
+    author_books_copies_query,
+    bump_reference_version,
+    get_author_books_metadata,
+    get_author_record,
+    merge_author_books
+)
+from app.utils.expansion import author_fields
+from app.utils.ids import new_id
 from app.core.logging import logger
 
 
@@ -32,35 +41,65 @@ def create_author_service(db: Session, author_data: AuthorCreate) -> Author:
         )
 
     new_author = Author(
-        id=str(uuid4()),
+        id=new_id(),
         name=author_data.name,
         bio=author_data.bio or None
     )
     db.add(new_author)
     db.commit()
+    invalidate_authors()
+    bump_reference_version()
     logger.info(f"Autor {new_author.name} criado com sucesso")
     db.refresh(new_author)
     return new_author
 
 
-def list_authors_service(db: Session) -> list[Author]:
+def list_authors_service(db: Session) -> list[dict]:
     """
-    Lista todos os autores cadastrados.
+    Lista todos os autores cadastrados (com cache de leitura).
     """
-    return db.query(Author).all()
+    def load() -> list:
+        return [author_fields(author) for author in db.query(Author).all()]
+
+    return catalog_cache.get_or_load(AUTHORS, {"list": "all"}, load)
 
 
-def get_author_service(db: Session, author_id: str) -> Author:
+def get_author_service(db: Session, author_id: str) -> dict:
     """
-    Busca um autor pelo ID.
+    Busca um autor pelo ID (com cache L1 do worker).
     """
-    author = db.query(Author).filter(Author.id == author_id).first()
-    if not author:
+    record = get_author_record(db, author_id)
+    if record is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Autor não encontrado"
         )
-    return author
+    return record.to_dict()
+
+
+def list_books_by_author_service(db: Session, author_id: str) -> list[dict]:
+    """
+    Retorna todos os livros de um autor, validando a existência do autor.
+
+    Autor e metadados dos livros (título, autor, data) vêm do cache L1; do
+    banco são lidas apenas as cópias atuais (total e disponíveis), que mudam
+    a cada empréstimo ou edição. Se o conjunto de livros divergir do cache
+    (livro criado ou removido em outro worker), os metadados são recarregados.
+    """
+    author = get_author_record(db, author_id)
+    if author is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Autor não encontrado"
+        )
+
+    copies = db.execute(author_books_copies_query(author.id)).all()
+    books = merge_author_books(get_author_books_metadata(db, author.id), copies)
+    if books is None:
+        books = merge_author_books(get_author_books_metadata(db, author.id, refresh=True), copies, strict=False)
+
+    logger.info(f"{len(books)} livros encontrados para o autor {author.name}")
+    return books
 
 
 def update_author_service(db: Session, author_id: str, author_data: AuthorCreate) -> Author:
@@ -77,6 +116,9 @@ def update_author_service(db: Session, author_id: str, author_data: AuthorCreate
     author.name = author_data.name
     author.bio = author_data.bio
     db.commit()
+    book_search_index.invalidate()
+    invalidate_authors()
+    bump_reference_version()
     logger.info(f"Autor {author.name} atualizado com sucesso")
     db.refresh(author)
     return author
@@ -98,6 +140,9 @@ def patch_author_service(db: Session, author_id: str, author_data: AuthorCreate)
         author.bio = author_data.bio
 
     db.commit()
+    book_search_index.invalidate()
+    invalidate_authors()
+    bump_reference_version()
     logger.info(f"Autor {author.name} atualizado parcialmente com sucesso")
     db.refresh(author)
     return author
@@ -116,4 +161,7 @@ def delete_author_service(db: Session, author_id: str) -> None:
 
     db.delete(author)
     db.commit()
+    book_search_index.invalidate()
+    invalidate_authors()
+    bump_reference_version()
     logger.info(f"Autor {author.name} removido com sucesso")
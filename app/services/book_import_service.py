@@ -0,0 +1,251 @@
+"""
+Serviço de importação em lote de livros (CSV ou NDJSON).
+
+Inclui regras de negócio para:
+- Ler o arquivo de forma incremental, linha a linha (o upload é mantido
+  pelo FastAPI em arquivo temporário, não em memória)
+- Validar cada linha com o mesmo schema do cadastro individual
+- Resolver autores e títulos duplicados com uma consulta por lote
+- Inserir cada lote com um único INSERT (executemany) e um commit
+- Gerar o relatório de erros por linha, limitado a BOOK_IMPORT_MAX_ERRORS
+"""
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+import codecs
+import csv
+import json
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.core.settings import settings
+from app.core.logging import logger
+from app.models.author_model import Author
+from app.models.book_model import Book
+from app.schemas.book_schema import BookCreate, BookImportFormat
+from app.services.book_service import book_search_index
+from app.services.catalog_cache import invalidate_books
+from app.services.reference_cache import bump_reference_version
+from app.utils.ids import new_id
+
+# Linha do arquivo, título informado (se houver) e livro validado
+ParsedRow = Tuple[int, Optional[str], BookCreate]
+
+_FORMATS_BY_EXTENSION = {
+    ".csv": BookImportFormat.csv,
+    ".ndjson": BookImportFormat.ndjson,
+    ".jsonl": BookImportFormat.ndjson,
+}
+_FORMATS_BY_CONTENT_TYPE = {
+    "text/csv": BookImportFormat.csv,
+    "application/x-ndjson": BookImportFormat.ndjson,
+    "application/jsonl": BookImportFormat.ndjson,
+}
+
+
+def detect_import_format(filename: Optional[str], content_type: Optional[str]) -> BookImportFormat:
+    """
+    Identifica o formato pela extensão do arquivo ou pelo Content-Type.
+    Lança 422 se não for possível identificar.
+    """
+    name = (filename or "").lower()
+    for extension, import_format in _FORMATS_BY_EXTENSION.items():
+        if name.endswith(extension):
+            return import_format
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in _FORMATS_BY_CONTENT_TYPE:
+        return _FORMATS_BY_CONTENT_TYPE[media_type]
+    raise HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Formato do arquivo não reconhecido; informe format=csv ou format=ndjson"
+    )
+
+
+def _iter_csv(stream: BinaryIO) -> Iterator[Tuple[int, object]]:
+    reader = csv.DictReader(codecs.iterdecode(stream, "utf-8-sig"))
+    for row in reader:
+        yield reader.line_num, {
+            key.strip(): (value.strip() or None) if isinstance(value, str) else value
+            for key, value in row.items() if key
+        }
+
+
+def _iter_ndjson(stream: BinaryIO) -> Iterator[Tuple[int, object]]:
+    for line_number, line in enumerate(codecs.iterdecode(stream, "utf-8-sig"), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, e
+
+
+_READERS = {
+    BookImportFormat.csv: _iter_csv,
+    BookImportFormat.ndjson: _iter_ndjson,
+}
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+class _ImportReport:
+    """Acumula os contadores e os erros (limitados) da importação."""
+
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.received = 0
+        self.created = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+
+    def reject(self, line: int, title: Optional[str], error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "title": title, "error": error})
+
+    def as_dict(self) -> dict:
+        return {
+            "received": self.received,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def _insert_batch(
+    db: Session,
+    batch: List[ParsedRow],
+    known_authors: Set[str],
+    imported_titles: Set[str],
+    report: _ImportReport
+) -> None:
+    """
+    Valida autores e títulos do lote com uma consulta para cada e insere as
+    linhas aceitas com um único INSERT.
+    """
+    author_ids = {str(book.author_id) for _, _, book in batch} - known_authors
+    if author_ids:
+        known_authors.update(
+            db.execute(select(Author.id).where(Author.id.in_(author_ids))).scalars()
+        )
+
+    titles = {book.title for _, _, book in batch}
+    existing: Dict[str, str] = {
+        title.casefold(): author_id
+        for title, author_id in db.execute(
+            select(Book.title, Book.author_id).where(Book.title.in_(titles))
+        )
+    }
+
+    rows: List[dict] = []
+    accepted: List[ParsedRow] = []
+    for line, title, book in batch:
+        author_id = str(book.author_id)
+        key = book.title.casefold()
+        if author_id not in known_authors:
+            report.reject(line, title, "Autor não encontrado")
+        elif key in existing:
+            report.reject(line, title, (
+                "Já existe um livro com esse título vinculado a outro autor"
+                if existing[key] != author_id else "Já existe um livro com esse título."
+            ))
+        elif key in imported_titles:
+            report.reject(line, title, "Título repetido no arquivo")
+        else:
+            imported_titles.add(key)
+            accepted.append((line, title, book))
+            rows.append({
+                "id": new_id(),
+                "title": book.title,
+                "author_id": author_id,
+                "published_date": book.published_date,
+                "total_copies": book.total_copies,
+                "available_copies": book.available_copies,
+            })
+
+    if not rows:
+        return
+    try:
+        db.execute(insert(Book), rows)
+        db.commit()
+        report.created += len(rows)
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Falha ao gravar lote da importação de livros: {str(e)}")
+        for line, title, book in accepted:
+            imported_titles.discard(book.title.casefold())
+            report.reject(line, title, "Falha ao gravar o lote no banco de dados")
+
+
+def import_books_service(
+    db: Session,
+    stream: BinaryIO,
+    import_format: BookImportFormat,
+    batch_size: Optional[int] = None
+) -> dict:
+    """
+    Importa livros de um arquivo CSV (com cabeçalho) ou NDJSON, com os
+    campos de `BookCreate`. Cada lote aceito é gravado em sua própria
+    transação; linhas rejeitadas não interrompem a importação.
+    """
+    batch_size = batch_size or settings.BOOK_IMPORT_BATCH_SIZE
+    report = _ImportReport(settings.BOOK_IMPORT_MAX_ERRORS)
+    known_authors: Set[str] = set()
+    imported_titles: Set[str] = set()
+    batch: List[ParsedRow] = []
+    line = 0
+
+    try:
+        try:
+            for line, record in _READERS[import_format](stream):
+                report.received += 1
+                if isinstance(record, ValueError):
+                    report.reject(line, None, f"JSON inválido: {str(record)}")
+                    continue
+                if not isinstance(record, dict):
+                    report.reject(line, None, "Linha deve conter um objeto")
+                    continue
+
+                title = record.get("title") if isinstance(record.get("title"), str) else None
+                try:
+                    book = BookCreate.parse_obj(record)
+                except ValidationError as e:
+                    report.reject(line, title, _validation_message(e))
+                    continue
+                if book.available_copies > book.total_copies:
+                    report.reject(line, title, "Cópias disponíveis não podem ser maiores que o total")
+                    continue
+
+                batch.append((line, title, book))
+                if len(batch) >= batch_size:
+                    _insert_batch(db, batch, known_authors, imported_titles, report)
+                    batch = []
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Arquivo corrompido: encerra a leitura e grava o que já foi validado
+            report.received += 1
+            report.reject(line + 1, None, f"Falha ao ler o arquivo: {str(e)}")
+
+        if batch:
+            _insert_batch(db, batch, known_authors, imported_titles, report)
+    finally:
+        # Lotes já gravados continuam válidos mesmo se um lote posterior
+        # falhar fora do tratamento de erros (ex.: consulta de autores)
+        if report.created:
+            book_search_index.invalidate()
+            invalidate_books()
+            bump_reference_version()
+
+    logger.info(
+        f"Importação de livros ({import_format.value}): {report.created} criado(s), "
+        f"{report.failed} rejeitado(s) de {report.received} linha(s)"
+    )
+    return report.as_dict()
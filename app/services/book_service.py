@@ -4,23 +4,38 @@ busca, listagem, atualização (completa e parcial) e remoção de livros.
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import bindparam, select, text, union
+from sqlalchemy.sql import Select
 from fastapi import HTTPException, status
 
-from uuid import uuid4
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 
 from app.models.book_model import Book
+from app.models.author_model import Author
 from app.schemas.book_schema import BookCreate, BookUpdate
 from app.core.logging import logger
+from app.core.settings import settings
+from app.utils.pagination import apply_keyset, decode_cursor, split_page
+from app.utils.search import TrigramIndex
+from app.utils.expansion import book_fields, book_load_options, expand_books
+from app.utils.ids import new_id
+from app.services.catalog_cache import BOOK, BOOKS, catalog_cache, invalidate_books
+from app.services.reference_cache import bump_reference_version
+
+# Índice de busca em memória usado quando o banco não é MySQL
+book_search_index = TrigramIndex(
+    ttl_seconds=settings.SEARCH_INDEX_TTL_SECONDS,
+    min_score=settings.SEARCH_MIN_SCORE
+)
 
 def create_book_service(db: Session, book_data: BookCreate) -> Book:
     """
     Cria um novo livro no banco de dados com validações.
     """
-    # Verifica existência do autor
-    author_exists = db.query("Author").filter_by(id=str(book_data.author_id)).first()
-    if not author_exists:
+    # Verifica existência do autor direto no banco: o cache L1 pode estar
+    # desatualizado (autor removido em outro worker) e a FK falharia com 500
+    author_exists = db.query(Author.id).filter(Author.id == str(book_data.author_id)).first()
+    if author_exists is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Autor não encontrado")
 
     # Verifica duplicidade de título com autor diferente
@@ -50,7 +65,7 @@ def create_book_service(db: Session, book_data: BookCreate) -> Book:
         )
 
     book = Book(
-        id=str(uuid4()),
+        id=new_id(),
         title=book_data.title,
         author_id=str(book_data.author_id),
         published_date=book_data.published_date,
@@ -59,19 +74,102 @@ def create_book_service(db: Session, book_data: BookCreate) -> Book:
     )
     db.add(book)
     db.commit()
+    book_search_index.invalidate()
+    invalidate_books()
+    bump_reference_version()
     logger.info(f"Livro {book.title} criado com sucesso")
     db.refresh(book)
     return book
 
 
-def get_book_service(db: Session, book_id: str) -> Book:
+def get_book_service(db: Session, book_id: str) -> dict:
     """
-    Busca um livro pelo seu ID.
+    Busca um livro pelo seu ID (com cache de leitura).
     """
-    book = db.query(Book).filter(Book.id == book_id).first()
-    if not book:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Livro não encontrado")
-    return book
+    def load() -> dict:
+        book = db.query(Book).filter(Book.id == book_id).first()
+        if not book:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Livro não encontrado")
+        return book_fields(book)
+
+    return catalog_cache.get_or_load(BOOK, {"id": str(book_id)}, load)
+
+
+BOOK_SORT_FIELDS = ["title", "published_date", "total_copies"]
+
+
+def book_sort_spec(order_by: Optional[str], allow_desc: bool = False) -> Tuple[str, List[str], bool]:
+    """
+    Resolve a ordenação em (chave do cursor, atributos ordenados, decrescente).
+    O `id` é sempre o último critério, garantindo uma ordem total para o cursor.
+    `published_date` é anulável; `apply_keyset` pagina os livros sem data
+    (ordenados como menor valor) sem encerrar a listagem.
+    """
+    field = order_by or ""
+    descending = False
+
+    if allow_desc and field.startswith("-"):
+        descending = True
+        field = field[1:]
+
+    if field not in BOOK_SORT_FIELDS:
+        if allow_desc:
+            raise HTTPException(status_code=422, detail=f"Campo inválido para ordenação: {order_by}")
+        return "id", ["id"], False
+
+    return order_by, [field, "id"], descending
+
+
+def _apply_book_keyset(query: Select, order_by: Optional[str], cursor: Optional[str], allow_desc: bool) -> Select:
+    sort_key, attributes, descending = book_sort_spec(order_by, allow_desc)
+    columns = [getattr(Book, attribute) for attribute in attributes]
+    cursor_values = decode_cursor(cursor, sort_key, columns) if cursor else None
+    return apply_keyset(query, columns, cursor_values, descending)
+
+
+def build_books_query(
+    title: Optional[str] = None,
+    author_id: Optional[str] = None,
+    order_by: Optional[str] = "title",
+    cursor: Optional[str] = None
+) -> Select:
+    """
+    Monta a consulta de listagem de livros (compartilhada pelos serviços
+    síncronos e assíncronos).
+    """
+    query = select(Book)
+
+    if title:
+        query = query.where(Book.title.ilike(f"%{title}%"))
+    if author_id:
+        query = query.where(Book.author_id == author_id)
+
+    return _apply_book_keyset(query, order_by, cursor, allow_desc=False)
+
+
+def build_books_by_availability_query(
+    status: bool,
+    order_by: Optional[str] = "title",
+    cursor: Optional[str] = None
+) -> Select:
+    """
+    Monta a consulta de livros disponíveis/indisponíveis com ordenação segura.
+    Aceita prefixo '-' para ordem decrescente.
+    """
+    query = select(Book)
+
+    # Filtra pela disponibilidade
+    if status:
+        query = query.where(Book.available_copies > 0)
+    else:
+        query = query.where(Book.available_copies == 0)
+
+    return _apply_book_keyset(query, order_by, cursor, allow_desc=True)
+
+
+def _page_cache_params(skip: int, cursor: Optional[str], include: Set[str]) -> dict:
+    # Com cursor o `skip` é ignorado; não deve diferenciar as chaves
+    return {"skip": None if cursor else skip, "cursor": cursor, "include": sorted(include)}
 
 
 def list_books_service(
@@ -80,21 +178,38 @@ def list_books_service(
     limit: int = 10,
     title: Optional[str] = None,
     author_id: Optional[str] = None,
-    order_by: Optional[str] = "title"
-) -> List[Book]:
+    order_by: Optional[str] = "title",
+    cursor: Optional[str] = None,
+    include: Set[str] = frozenset()
+) -> Tuple[List[dict], Optional[str]]:
     """
     Retorna livros cadastrados com paginação, filtro e ordenação.
-    """
-    query = db.query(Book)
 
-    if title:
-        query = query.filter(Book.title.ilike(f"%{title}%"))
-    if author_id:
-        query = query.filter(Book.author_id == author_id)
-    if order_by in ["title", "published_date", "total_copies"]:
-        query = query.order_by(getattr(Book, order_by))
-
-    return query.offset(skip).limit(limit).all()
+    Com `cursor`, a página começa após a última linha da página anterior
+    (keyset) e `skip` é ignorado. Retorna os livros e o cursor da próxima página.
+    Os relacionamentos em `include` são carregados na mesma consulta.
+    O resultado passa pelo cache de leitura do catálogo.
+    """
+    def load() -> dict:
+        query = build_books_query(title, author_id, order_by, cursor).options(*book_load_options(include))
+        if not cursor:
+            query = query.offset(skip)
+
+        rows = db.execute(query.limit(limit + 1)).scalars().all()
+        sort_key, attributes, _ = book_sort_spec(order_by)
+        books, next_cursor = split_page(rows, limit, sort_key, attributes)
+        return {"items": expand_books(books, include), "next_cursor": next_cursor}
+
+    params = {
+        "list": "all",
+        "limit": limit,
+        "title": title.strip().lower() if title else None,
+        "author_id": author_id,
+        "order_by": order_by,
+        **_page_cache_params(skip, cursor, include),
+    }
+    page = catalog_cache.get_or_load(BOOKS, params, load)
+    return page["items"], page["next_cursor"]
 
 
 def list_books_by_availability_service(
@@ -102,44 +217,128 @@ def list_books_by_availability_service(
     status: bool,
     skip: int = 0,
     limit: int = 10,
-    order_by: Optional[str] = "title"
-) -> List[Book]:
+    order_by: Optional[str] = "title",
+    cursor: Optional[str] = None,
+    include: Set[str] = frozenset()
+) -> Tuple[List[dict], Optional[str]]:
     
     """
     Lista livros disponíveis ou indisponíveis conforme parâmetro,
-    com paginação e ordenação.
+    com paginação (offset ou cursor) e ordenação.
+    O resultado passa pelo cache de leitura do catálogo.
     """
 
+    def load() -> dict:
+        query = build_books_by_availability_query(status, order_by, cursor).options(*book_load_options(include))
+        if not cursor:
+            query = query.offset(skip)
+
+        rows = db.execute(query.limit(limit + 1)).scalars().all()
+        sort_key, attributes, _ = book_sort_spec(order_by, allow_desc=True)
+        books, next_cursor = split_page(rows, limit, sort_key, attributes)
+        return {"items": expand_books(books, include), "next_cursor": next_cursor}
+
     try:
-        query = db.query(Book)
+        params = {
+            "list": "availability",
+            "status": status,
+            "limit": limit,
+            "order_by": order_by,
+            **_page_cache_params(skip, cursor, include),
+        }
+        page = catalog_cache.get_or_load(BOOKS, params, load)
+        return page["items"], page["next_cursor"]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        # Log opcional
+        print(f"Erro interno: {str(e)}")
+        raise HTTPException(status_code=500, detail="Erro ao recuperar livros")
 
-        # Filtra pela disponibilidade
-        if status:
-            query = query.filter(Book.available_copies > 0)
-        else:
-            query = query.filter(Book.available_copies == 0)
 
-        # Ordenação segura
-        allowed_fields = ["title", "published_date", "total_copies"]
-        direction = "asc"
-        field = order_by
+# Condições FULLTEXT (MySQL); cada uma é resolvida pelo seu próprio índice
+_MYSQL_TITLE_MATCH = "MATCH (books.title) AGAINST (:search_q IN NATURAL LANGUAGE MODE)"
+_MYSQL_AUTHOR_MATCH = "MATCH (authors.name) AGAINST (:search_q IN NATURAL LANGUAGE MODE)"
 
-        if order_by.startswith("-"):
-            direction = "desc"
-            field = order_by[1:]
+# Relevância (título do livro + nome do autor), usada apenas na ordenação
+_MYSQL_RELEVANCE = f"{_MYSQL_TITLE_MATCH} + COALESCE({_MYSQL_AUTHOR_MATCH}, 0)"
 
-        if field not in allowed_fields:
-            raise HTTPException(status_code=422, detail=f"Campo inválido para ordenação: {order_by}")
 
-        sort_column = getattr(Book, field)
-        query = query.order_by(desc(sort_column) if direction == "desc" else sort_column)
+def build_books_search_query(q: str, author_id: Optional[str] = None) -> Select:
+    """
+    Monta a busca por relevância usando os índices FULLTEXT do MySQL.
 
-        return query.offset(skip).limit(limit).all()
+    Os livros candidatos vêm da união de duas buscas, cada uma atendida pelo
+    seu índice (`ft_books_title` nos títulos, `ft_authors_name` nos autores);
+    uma condição única somando os dois MATCH sobre o join não usa nenhum dos
+    índices e percorre todos os livros. A relevância somada é calculada
+    apenas para os candidatos, na ordenação.
+    """
+    search_q = bindparam("search_q", q)
+    title_hits = select(Book.id).where(text(_MYSQL_TITLE_MATCH).bindparams(search_q))
+    author_hits = (
+        select(Book.id)
+        .join(Author, Author.id == Book.author_id)
+        .where(text(_MYSQL_AUTHOR_MATCH).bindparams(search_q))
+    )
+    if author_id:
+        title_hits = title_hits.where(Book.author_id == author_id)
+        author_hits = author_hits.where(Book.author_id == author_id)
+    matches = union(title_hits, author_hits).subquery("matches")
+
+    return (
+        select(Book)
+        .join(matches, matches.c.id == Book.id)
+        .outerjoin(Author, Author.id == Book.author_id)
+        .order_by(text(f"({_MYSQL_RELEVANCE}) DESC").bindparams(search_q), Book.id)
+    )
 
-    except Exception as e:
-        # Log opcional
-        print(f"Erro interno: {str(e)}")
-        raise HTTPException(status_code=500, detail="Erro ao recuperar livros")
+
+def _load_search_documents(db: Session):
+    rows = db.execute(
+        select(Book.id, Book.title, Author.name).outerjoin(Author, Author.id == Book.author_id)
+    )
+    for book_id, title, author_name in rows:
+        yield book_id, f"{title} {author_name or ''}"
+
+
+def search_books_service(
+    db: Session,
+    q: str,
+    skip: int = 0,
+    limit: int = 10,
+    author_id: Optional[str] = None,
+    include: Set[str] = frozenset()
+) -> List[dict]:
+    """
+    Busca livros por título ou nome do autor, ordenados por relevância.
+
+    No MySQL usa MATCH ... AGAINST sobre os índices FULLTEXT; nos demais
+    bancos usa o índice de trigramas em memória.
+    """
+    if db.get_bind().dialect.name == "mysql":
+        query = build_books_search_query(q, author_id).options(*book_load_options(include))
+        return expand_books(db.execute(query.offset(skip).limit(limit)).scalars().all(), include)
+
+    book_search_index.ensure_built(lambda: _load_search_documents(db))
+    ranked_ids = [book_id for book_id, _ in book_search_index.search(q)]
+
+    if author_id and ranked_ids:
+        # Interseção em Python: a lista ranqueada pode ter milhares de IDs,
+        # acima do limite de parâmetros de um IN
+        allowed = set(db.execute(select(Book.id).where(Book.author_id == author_id)).scalars())
+        ranked_ids = [book_id for book_id in ranked_ids if book_id in allowed]
+
+    page_ids = ranked_ids[skip:skip + limit]
+    if not page_ids:
+        return []
+
+    books = db.execute(
+        select(Book).where(Book.id.in_(page_ids)).options(*book_load_options(include))
+    ).scalars().all()
+    position = {book_id: i for i, book_id in enumerate(page_ids)}
+    return expand_books(sorted(books, key=lambda book: position[book.id]), include)
 
 
 def update_book_service(
@@ -189,6 +388,9 @@ def update_book_service(
         book.available_copies = book_data.available_copies
 
     db.commit()
+    book_search_index.invalidate()
+    invalidate_books([book_id])
+    bump_reference_version()
     logger.info(f"Livro {book.title} atualizado com sucesso")
     db.refresh(book)
     return book
@@ -210,5 +412,8 @@ def delete_book_service(db: Session, book_id: str) -> None:
 
     db.delete(book)
     db.commit()
+    book_search_index.invalidate()
+    invalidate_books([book_id])
+    bump_reference_version()
     logger.info(f"Livro {book.title} removido com sucesso")
 
@@ -0,0 +1,103 @@
+"""
+Cache de leitura do catálogo (livros e autores).
+
+Os serviços de leitura de `book_service` e `author_service` passam por
+`catalog_cache.get_or_load`, e os serviços de escrita (livros, autores e
+empréstimos, que alteram as cópias disponíveis) invalidam as entradas
+afetadas logo após o commit.
+"""
+
+import threading
+from typing import Iterable, Optional
+
+from app.core.cache import MemoryCacheBackend, ReadThroughCache, RedisCacheBackend
+from app.core.logging import logger
+from app.core.settings import settings
+
+# Namespaces: detalhe por ID e listagens (invalidadas em bloco por versão).
+# O detalhe de autor é servido pelo cache L1 de `reference_cache`.
+BOOK = "book"
+BOOKS = "books"
+AUTHORS = "authors"
+# Versão dos dados de livros e empréstimos (reaproveitamento de relatórios)
+DATA_VERSION = "data_version"
+
+
+def _create_backend():
+    backend = settings.CACHE_BACKEND.lower()
+    if backend == "redis":
+        return RedisCacheBackend(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD
+        )
+    if backend == "memory":
+        return MemoryCacheBackend(max_size=settings.CACHE_MAX_SIZE)
+    return None
+
+
+catalog_cache = ReadThroughCache(
+    _create_backend(),
+    ttl_seconds=settings.CACHE_TTL_SECONDS,
+    jitter=settings.CACHE_TTL_JITTER,
+    prefix=settings.CACHE_KEY_PREFIX,
+    on_error=lambda e: logger.warning(f"Falha no cache do catálogo: {str(e)}"),
+    failure_backoff_seconds=settings.CACHE_FAILURE_BACKOFF_SECONDS
+)
+
+
+_local_data_version = 0
+_local_data_version_lock = threading.Lock()
+
+
+def bump_data_version() -> None:
+    """
+    Registra uma alteração em livros ou empréstimos. O contador local cobre
+    as escritas deste processo; o contador no backend do cache (Redis), as
+    escritas de outros workers e dos jobs executados fora da API.
+    """
+    global _local_data_version
+    with _local_data_version_lock:
+        _local_data_version += 1
+    catalog_cache.invalidate(DATA_VERSION)
+
+
+def data_version() -> Optional[str]:
+    """
+    Versão atual dos dados de livros e empréstimos, ou None quando não há um
+    backend compartilhado entre processos (CACHE_BACKEND=none ou memory) ou
+    ele está indisponível: o contador local sozinho não percebe escritas de
+    outros workers nem dos jobs, então a versão não é confiável.
+    """
+    if not getattr(catalog_cache.backend, "shared", False):
+        return None
+    shared_version = catalog_cache.version(DATA_VERSION)
+    if shared_version is None:
+        return None
+    return f"{_local_data_version}:{shared_version}"
+
+
+def invalidate_books(book_ids: Iterable[str] = ()) -> None:
+    """
+    Invalida o detalhe dos livros informados e todas as listagens de livros.
+    Chamado por todas as escritas de livros e empréstimos, também avança a
+    versão dos dados usada pelos relatórios.
+    """
+    for book_id in set(book_ids):
+        catalog_cache.delete(BOOK, {"id": str(book_id)})
+    catalog_cache.invalidate(BOOKS)
+    bump_data_version()
+
+
+def invalidate_authors() -> None:
+    """
+    Invalida as listagens de autores e as listagens de livros (que podem
+    embutir o resumo do autor).
+    """
+    catalog_cache.invalidate(AUTHORS)
+    catalog_cache.invalidate(BOOKS)
+
+
+def catalog_cache_stats() -> dict:
+    return catalog_cache.stats()
@@ -1,83 +1,415 @@
+from sqlalchemy import Integer, case, cast, func, insert, literal, select, union_all, update
+from sqlalchemy.sql import Select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
-from uuid import uuid4
 from decimal import Decimal
-from typing import List
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import date, timedelta
 
 from app.models.loan_model import Loan
+from app.models.loan_archive_model import LoanArchive
 from app.models.book_model import Book
 from app.models.user_model import User
-from app.schemas.loan_schema import LoanCreate, LoanUpdate, LoanPut
+from app.schemas.loan_schema import (
+    LoanCreate,
+    LoanUpdate,
+    LoanPut,
+    LoanBatchCreate,
+    LoanBatchItemStatus,
+    LoanBatchReturn,
+    LoanReturnItemStatus,
+    LoanStatus
+)
+from app.core.settings import settings
 from app.core.logging import logger
+from app.utils.pagination import apply_keyset, decode_cursor, split_page
+from app.utils.expansion import loan_fields, loan_load_options
+from app.utils.ids import new_id
+from app.services.catalog_cache import invalidate_books
 
 
 
-def create_loan_service(db: Session, loan_data: LoanCreate) -> Loan:
+def _checkout_copy(db: Session, book_id: str) -> None:
     """
-    Cria um novo empréstimo, validando a disponibilidade do livro
-    e o limite de empréstimos ativos por usuário.
+    Reserva uma cópia do livro com um UPDATE condicional atômico
+    (`available_copies > 0`), evitando que checkouts concorrentes da última
+    cópia sejam aceitos ao mesmo tempo.
     """
+    updated = db.query(Book).filter(
+        Book.id == book_id,
+        Book.available_copies > 0
+    ).update(
+        {Book.available_copies: Book.available_copies - 1},
+        synchronize_session=False
+    )
+    if updated:
+        return
 
-    user = db.query(User).filter(User.id == str(loan_data.user_id)).first()
-    if not user:
+    if not db.query(Book.id).filter(Book.id == book_id).first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Usuário não encontrado"
+            detail="Livro não encontrado"
         )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Livro indisponível"
+    )
 
-    book = db.query(Book).filter(Book.id == str(loan_data.book_id)).first()
-    if not book:
+
+def _release_copy(db: Session, book_id: str) -> None:
+    """
+    Devolve uma cópia do livro com incremento atômico no próprio banco.
+    """
+    db.query(Book).filter(Book.id == book_id).update(
+        {Book.available_copies: Book.available_copies + 1},
+        synchronize_session=False
+    )
+
+
+def _reserve_loan_slot(db: Session, user_id: str) -> None:
+    """
+    Incrementa o contador de empréstimos ativos do usuário com um UPDATE
+    condicional que aplica o limite por usuário no próprio banco.
+    """
+    updated = db.query(User).filter(
+        User.id == user_id,
+        User.active_loan_count < settings.MAX_ACTIVE_LOANS
+    ).update(
+        {User.active_loan_count: User.active_loan_count + 1},
+        synchronize_session=False
+    )
+    if updated:
+        return
+
+    if not db.query(User.id).filter(User.id == user_id).first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Livro não encontrado"
+            detail="Usuário não encontrado"
         )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Limite de empréstimos ativos atingido"
+    )
 
-    if book.available_copies <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Livro indisponível"
-        )
 
-    active_loans = db.query(Loan).filter(
-        Loan.user_id == str(loan_data.user_id),
-        Loan.return_date == None
-    ).count()
+def _release_loan_slot(db: Session, user_id: str) -> None:
+    """
+    Decrementa o contador de empréstimos ativos do usuário.
+    """
+    db.query(User).filter(
+        User.id == user_id,
+        User.active_loan_count > 0
+    ).update(
+        {User.active_loan_count: User.active_loan_count - 1},
+        synchronize_session=False
+    )
 
 
-    logger.info(f"Usuário {user.email} tem {active_loans} empréstimos ativos")
-    # Limite de 3 empréstimos ativos por usuário
+def _sync_loan_counters(
+    db: Session,
+    old_user_id: str,
+    old_book_id: str,
+    was_active: bool,
+    new_user_id: str,
+    new_book_id: str,
+    is_active: bool
+) -> None:
+    """
+    Ajusta as cópias disponíveis e os contadores de empréstimos ativos
+    conforme a mudança de estado do empréstimo (devolução, reabertura,
+    troca de livro ou de usuário).
 
-    if active_loans >= 3:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Limite de empréstimos ativos atingido"
-        )
+    Segue a mesma ordem de bloqueio do checkout (usuários antes de livros,
+    cada grupo em ordem de ID) para que devoluções e empréstimos
+    concorrentes não entrem em deadlock.
+    """
+    user_changes = []
+    if was_active and (not is_active or old_user_id != new_user_id):
+        user_changes.append((old_user_id, _release_loan_slot))
+    if is_active and (not was_active or old_user_id != new_user_id):
+        user_changes.append((new_user_id, _reserve_loan_slot))
 
+    book_changes = []
+    if was_active and (not is_active or old_book_id != new_book_id):
+        book_changes.append((old_book_id, _release_copy))
+    if is_active and (not was_active or old_book_id != new_book_id):
+        book_changes.append((new_book_id, _checkout_copy))
+
+    for record_id, change in sorted(user_changes, key=lambda item: item[0]):
+        change(db, record_id)
+    for record_id, change in sorted(book_changes, key=lambda item: item[0]):
+        change(db, record_id)
+
+
+def _loan_dates(loan_date: Optional[date]) -> Tuple[date, date]:
+    """
+    Retorna a data do empréstimo (padrão: hoje) e o vencimento (14 dias).
+    """
+    loan_date = loan_date or date.today()
+    return loan_date, loan_date + timedelta(days=14)
+
+
+def create_loan_service(db: Session, loan_data: LoanCreate) -> Loan:
+    """
+    Cria um novo empréstimo, validando a disponibilidade do livro
+    e o limite de empréstimos ativos por usuário.
+    """
+
+    # Contador de empréstimos ativos: valida existência do usuário e o limite
+    _reserve_loan_slot(db, str(loan_data.user_id))
+
+    # Decremento condicional: valida existência e disponibilidade do livro
+    _checkout_copy(db, str(loan_data.book_id))
+
+    loan_date, due_date = _loan_dates(loan_data.loan_date)
     loan = Loan(
-        id=str(uuid4()),
+        id=new_id(),
         user_id=loan_data.user_id,
         book_id=loan_data.book_id,
-        loan_date=loan_data.loan_date or date.today(),
-        due_date=loan_data.loan_date + timedelta(days=14) if loan_data.loan_date else date.today() + timedelta(days=14),
+        loan_date=loan_date,
+        due_date=due_date,
         fine_amount=Decimal("0.00"),
         return_date=None
     )
 
-    book.available_copies -= 1
     db.add(loan)
     db.commit()
+    invalidate_books([loan.book_id])
     logger.info(f"Empréstimo criado: {loan.id} para o usuário {loan.user_id} do livro {loan.book_id}")
     db.refresh(loan)
     return loan
 
 
-def list_loans_service(db: Session) -> List[Loan]:
+def create_loans_batch_service(db: Session, batch: LoanBatchCreate) -> dict:
+    """
+    Cria vários empréstimos para um mesmo usuário em uma única transação.
+
+    O usuário e os livros são bloqueados (SELECT ... FOR UPDATE, livros em
+    ordem de ID para evitar deadlocks), o limite de empréstimos ativos é
+    verificado uma única vez para o lote, as cópias são decrementadas com um
+    único UPDATE e os empréstimos são inseridos em um único INSERT em lote.
+    Livros inexistentes, indisponíveis, repetidos ou além do limite são
+    reportados individualmente sem impedir os demais.
+    """
+    user_id = str(batch.user_id)
+    user = db.query(User).filter(User.id == user_id).with_for_update().first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuário não encontrado"
+        )
+    free_slots = max(settings.MAX_ACTIVE_LOANS - user.active_loan_count, 0)
+
+    requested = [str(book_id) for book_id in batch.book_ids]
+    available: Dict[str, int] = dict(
+        db.query(Book.id, Book.available_copies)
+        .filter(Book.id.in_(set(requested)))
+        .order_by(Book.id)
+        .with_for_update()
+        .all()
+    )
+
+    loan_date, due_date = _loan_dates(batch.loan_date)
+    results = []
+    accepted: Dict[str, dict] = {}
+    for book_id in requested:
+        if book_id in accepted:
+            results.append((book_id, LoanBatchItemStatus.duplicate))
+        elif book_id not in available:
+            results.append((book_id, LoanBatchItemStatus.not_found))
+        elif available[book_id] <= 0:
+            results.append((book_id, LoanBatchItemStatus.unavailable))
+        elif len(accepted) >= free_slots:
+            results.append((book_id, LoanBatchItemStatus.limit_reached))
+        else:
+            accepted[book_id] = {
+                "id": new_id(),
+                "user_id": user_id,
+                "book_id": book_id,
+                "loan_date": loan_date,
+                "due_date": due_date,
+                "return_date": None,
+                "fine_amount": Decimal("0.00"),
+            }
+            results.append((book_id, LoanBatchItemStatus.created))
+
+    if accepted:
+        db.execute(
+            update(Book)
+            .where(Book.id.in_(list(accepted)), Book.available_copies > 0)
+            .values(available_copies=Book.available_copies - 1)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(active_loan_count=User.active_loan_count + len(accepted))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(insert(Loan), list(accepted.values()))
+        db.commit()
+        invalidate_books(accepted)
+    else:
+        db.rollback()
+
+    logger.info(f"Empréstimo em lote: {len(accepted)} de {len(requested)} livro(s) emprestado(s) ao usuário {user_id}")
+    return {
+        "user_id": user_id,
+        "created": len(accepted),
+        "items": [
+            {
+                "book_id": book_id,
+                "status": item_status,
+                "loan": accepted[book_id] if item_status == LoanBatchItemStatus.created else None,
+            }
+            for book_id, item_status in results
+        ],
+    }
+
+
+# Ordenação da listagem geral: mais recentes primeiro, `id` como desempate
+LOAN_LIST_SORT_KEY = "-loan_date"
+LOAN_LIST_SORT_ATTRIBUTES = ["loan_date", "id"]
+
+
+def page_size(limit: int) -> int:
+    """Aplica o limite máximo de itens por página configurado no servidor."""
+    return max(1, min(limit, settings.MAX_PAGE_SIZE))
+
+
+def build_loans_query(
+    loan_status: Optional[LoanStatus] = None,
+    user_id: Optional[str] = None,
+    book_id: Optional[str] = None,
+    loan_date_from: Optional[date] = None,
+    loan_date_to: Optional[date] = None,
+    due_date_from: Optional[date] = None,
+    due_date_to: Optional[date] = None,
+    cursor: Optional[str] = None
+) -> Select:
+    """
+    Monta a consulta da listagem de empréstimos com filtros e paginação por
+    cursor em `(loan_date, id)` decrescente (compartilhada pelos serviços
+    síncronos e assíncronos).
+    """
+    query = select(Loan)
+
+    if loan_status == LoanStatus.active:
+        query = query.where(Loan.return_date.is_(None))
+    elif loan_status == LoanStatus.returned:
+        query = query.where(Loan.return_date.isnot(None))
+    elif loan_status == LoanStatus.overdue:
+        query = query.where(Loan.return_date.is_(None), Loan.due_date < date.today())
+
+    if user_id:
+        query = query.where(Loan.user_id == user_id)
+    if book_id:
+        query = query.where(Loan.book_id == book_id)
+    if loan_date_from:
+        query = query.where(Loan.loan_date >= loan_date_from)
+    if loan_date_to:
+        query = query.where(Loan.loan_date <= loan_date_to)
+    if due_date_from:
+        query = query.where(Loan.due_date >= due_date_from)
+    if due_date_to:
+        query = query.where(Loan.due_date <= due_date_to)
+
+    columns = [getattr(Loan, attribute) for attribute in LOAN_LIST_SORT_ATTRIBUTES]
+    cursor_values = decode_cursor(cursor, LOAN_LIST_SORT_KEY, columns) if cursor else None
+    return apply_keyset(query, columns, cursor_values, descending=True)
+
+
+def list_loans_service(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    loan_status: Optional[LoanStatus] = None,
+    user_id: Optional[str] = None,
+    book_id: Optional[str] = None,
+    loan_date_from: Optional[date] = None,
+    loan_date_to: Optional[date] = None,
+    due_date_from: Optional[date] = None,
+    due_date_to: Optional[date] = None,
+    include: Set[str] = frozenset()
+) -> Tuple[List[Loan], Optional[str]]:
+    """
+    Retorna uma página de empréstimos, com filtros, e o cursor da próxima página.
+    Os relacionamentos em `include` são carregados na mesma consulta.
+    """
+    limit = page_size(limit)
+    query = build_loans_query(
+        loan_status, user_id, book_id,
+        loan_date_from, loan_date_to, due_date_from, due_date_to,
+        cursor
+    ).options(*loan_load_options(include))
+    loans = db.execute(query.limit(limit + 1)).scalars().all()
+    return split_page(loans, limit, LOAN_LIST_SORT_KEY, LOAN_LIST_SORT_ATTRIBUTES)
+
+
+# Fila de atrasos: vencimento mais antigo primeiro (índice idx_loans_overdue)
+OVERDUE_SORT_KEY = "due_date"
+OVERDUE_SORT_ATTRIBUTES = ["due_date", "id"]
+
+
+def build_overdue_loans_query(cursor: Optional[str] = None, include_details: bool = False) -> Select:
+    """
+    Monta a consulta da fila de empréstimos em atraso de toda a biblioteca,
+    paginada por cursor em `(due_date, id)`. Com `include_details`, usuário e
+    livro são obtidos na mesma consulta (JOIN), sem consultas por linha.
+    """
+    if include_details:
+        query = (
+            select(Loan, User.name, User.email, Book.title, Book.author_id)
+            .join(User, User.id == Loan.user_id)
+            .join(Book, Book.id == Loan.book_id)
+        )
+    else:
+        query = select(Loan)
+
+    query = query.where(Loan.due_date < date.today(), Loan.return_date.is_(None))
+
+    columns = [getattr(Loan, attribute) for attribute in OVERDUE_SORT_ATTRIBUTES]
+    cursor_values = decode_cursor(cursor, OVERDUE_SORT_KEY, columns) if cursor else None
+    return apply_keyset(query, columns, cursor_values)
+
+
+def overdue_page(rows, limit: int, include_details: bool) -> Tuple[List[dict], Optional[str]]:
     """
-    Retorna uma lista com todos os empréstimos cadastrados.
+    Converte até `limit + 1` linhas da fila de atrasos na página de resposta
+    e no cursor seguinte.
     """
-    return db.query(Loan).all()
+    loans = [row[0] for row in rows]
+    page, next_cursor = split_page(loans, limit, OVERDUE_SORT_KEY, OVERDUE_SORT_ATTRIBUTES)
+    today = date.today()
+
+    items = []
+    for loan, row in zip(page, rows):
+        item = loan_fields(loan)
+        item["days_overdue"] = (today - loan.due_date).days
+        if include_details:
+            _, user_name, user_email, book_title, author_id = row
+            item["user"] = {"id": loan.user_id, "name": user_name, "email": user_email}
+            item["book"] = {"id": loan.book_id, "title": book_title, "author_id": author_id}
+        items.append(item)
+    return items, next_cursor
+
+
+def list_overdue_loans_service(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    include_details: bool = False
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Retorna uma página da fila de empréstimos em atraso, do vencimento mais
+    antigo para o mais recente, e o cursor da próxima página.
+    """
+    limit = page_size(limit)
+    query = build_overdue_loans_query(cursor, include_details)
+    rows = db.execute(query.limit(limit + 1)).all()
+    return overdue_page(rows, limit, include_details)
 
 
 def get_loan_service(db: Session, loan_id: str) -> Loan:
@@ -97,13 +429,19 @@ def update_loan_service(db: Session, loan_id: str, loan_data: LoanPut) -> Loan:
     """
     Substitui completamente os dados de um empréstimo.
     """
-    loan = db.query(Loan).filter(Loan.id == loan_id).first()
+    # Bloqueia o empréstimo: duas devoluções simultâneas não podem ambas
+    # vê-lo como ativo e devolver a cópia duas vezes
+    loan = db.query(Loan).filter(Loan.id == loan_id).with_for_update().first()
     if not loan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Empréstimo não encontrado"
         )
 
+    old_user_id = loan.user_id
+    old_book_id = loan.book_id
+    was_active = loan.return_date is None
+
     loan.user_id = loan_data.user_id
     loan.book_id = loan_data.book_id
     loan.loan_date = loan_data.loan_date
@@ -125,19 +463,22 @@ def update_loan_service(db: Session, loan_id: str, loan_data: LoanPut) -> Loan:
 
             loan.return_date = loan_data.return_date            
             days_late = (loan.return_date - loan.due_date).days
-            loan.fine_amount = Decimal("2.00") * days_late
+            loan.fine_amount = settings.FINE_PER_DAY * days_late
         else:
             loan.fine_amount = Decimal("0.00")
 
-        # Libera cópia do livro se devolução feita
-        book = db.query(Book).filter(Book.id == loan.book_id).first()
-        if book:
-            book.available_copies += 1
-
     else:
         loan.fine_amount = Decimal("0.00")
 
+    # Libera/reserva cópias e contadores conforme a transição de estado do empréstimo
+    _sync_loan_counters(
+        db,
+        str(old_user_id), str(old_book_id), was_active,
+        str(loan.user_id), str(loan.book_id), loan.return_date is None
+    )
+
     db.commit()
+    invalidate_books([old_book_id, loan.book_id])
     logger.info(f"Empréstimo {loan.id} atualizado com sucesso via PUT")
     db.refresh(loan)
     return loan
@@ -148,7 +489,9 @@ def patch_loan_service(db: Session, loan_id: str, loan_data: LoanUpdate) -> Loan
     Atualiza parcialmente os dados de um empréstimo.
     Se houver devolução, calcula a multa e devolve a cópia do livro.
     """
-    loan = db.query(Loan).filter(Loan.id == loan_id).first()
+    # Bloqueia o empréstimo: duas devoluções simultâneas não podem ambas
+    # vê-lo como ativo e devolver a cópia duas vezes
+    loan = db.query(Loan).filter(Loan.id == loan_id).with_for_update().first()
     if not loan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -156,6 +499,9 @@ def patch_loan_service(db: Session, loan_id: str, loan_data: LoanUpdate) -> Loan
         )
 
     data = loan_data.dict(exclude_unset=True)
+    old_user_id = loan.user_id
+    old_book_id = loan.book_id
+    was_active = loan.return_date is None
 
     if "user_id" in data:
         loan.user_id = data["user_id"]
@@ -181,16 +527,19 @@ def patch_loan_service(db: Session, loan_id: str, loan_data: LoanUpdate) -> Loan
             # se a data de devolução for posterior à data de vencimento, calcula a multa
             if loan.return_date > loan.due_date:
                 days_late = (loan.return_date - loan.due_date).days
-                loan.fine_amount = Decimal("2.00") * days_late
+                loan.fine_amount = settings.FINE_PER_DAY * days_late
             else:
                 loan.fine_amount = Decimal("0.00")
 
-        # Libera cópia do livro se devolução feita
-        book = db.query(Book).filter(Book.id == loan.book_id).first()
-        if book:
-            book.available_copies += 1
+    # Libera/reserva cópias e contadores conforme a transição de estado do empréstimo
+    _sync_loan_counters(
+        db,
+        str(old_user_id), str(old_book_id), was_active,
+        str(loan.user_id), str(loan.book_id), loan.return_date is None
+    )
 
     db.commit()
+    invalidate_books([old_book_id, loan.book_id])
     logger.info(f"Empréstimo {loan.id} atualizado parcialmente com sucesso")
     db.refresh(loan)
     return loan
@@ -201,7 +550,9 @@ def delete_loan_service(db: Session, loan_id: str) -> None:
     """
     Remove um empréstimo do banco de dados e devolve o livro se não foi devolvido.
     """
-    loan = db.query(Loan).filter(Loan.id == loan_id).first()
+    # Bloqueia o empréstimo: duas devoluções simultâneas não podem ambas
+    # vê-lo como ativo e devolver a cópia duas vezes
+    loan = db.query(Loan).filter(Loan.id == loan_id).with_for_update().first()
     if not loan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -209,15 +560,123 @@ def delete_loan_service(db: Session, loan_id: str) -> None:
         )
 
     if loan.return_date is None:
-        book = db.query(Book).filter(Book.id == loan.book_id).first()
-        if book:
-            book.available_copies += 1
+        _release_loan_slot(db, str(loan.user_id))
+        _release_copy(db, str(loan.book_id))
 
     db.delete(loan)
     db.commit()
+    invalidate_books([loan.book_id])
     logger.info(f"Empréstimo {loan.id} removido com sucesso")
 
 
+def _greatest(dialect_name: str, *values):
+    """
+    GREATEST() no MySQL; no SQLite, max() com vários argumentos equivale.
+    """
+    if dialect_name == "sqlite":
+        return func.max(*values)
+    return func.greatest(*values)
+
+
+def days_late_expression(dialect_name: str, return_date):
+    """
+    Expressão SQL com os dias de atraso (nunca negativos) entre o
+    vencimento do empréstimo e `return_date`, conforme o dialeto do banco.
+    """
+    if dialect_name == "sqlite":
+        days = cast(func.julianday(return_date) - func.julianday(Loan.due_date), Integer)
+    else:
+        days = func.datediff(return_date, Loan.due_date)
+    return _greatest(dialect_name, 0, days)
+
+
+def _per_id_case(column, counts: Counter):
+    """
+    CASE column WHEN id THEN n ... ELSE 0; as comparações usam o tipo da
+    coluna, então os IDs são convertidos também no armazenamento BINARY(16).
+    """
+    return case(*[(column == record_id, n) for record_id, n in counts.items()], else_=0)
+
+
+def return_loans_batch_service(db: Session, data: LoanBatchReturn) -> dict:
+    """
+    Devolve vários empréstimos em uma única transação.
+
+    A multa de todos os empréstimos é calculada no banco em um único UPDATE,
+    os contadores de empréstimos ativos com um único UPDATE agrupado por
+    usuário e as cópias com um único UPDATE agrupado por livro.
+    """
+    return_date = data.return_date or date.today()
+    if return_date > date.today():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Data de devolução não pode ser no futuro"
+        )
+
+    requested = list(dict.fromkeys(str(loan_id) for loan_id in data.loan_ids))
+    loans = (
+        db.query(Loan.id, Loan.user_id, Loan.book_id, Loan.return_date)
+        .filter(Loan.id.in_(requested))
+        .order_by(Loan.id)
+        .with_for_update()
+        .all()
+    )
+    found = {loan.id: loan for loan in loans}
+    active = [loan for loan in loans if loan.return_date is None]
+
+    fines: Dict[str, Decimal] = {}
+    if active:
+        active_ids = [loan.id for loan in active]
+        dialect_name = db.get_bind().dialect.name
+        return_value = literal(return_date)
+        days_late = days_late_expression(dialect_name, return_value)
+
+        db.execute(
+            update(Loan)
+            .where(Loan.id.in_(active_ids), Loan.return_date.is_(None))
+            .values(return_date=return_value, fine_amount=days_late * settings.FINE_PER_DAY)
+            .execution_options(synchronize_session=False)
+        )
+
+        # Mesma ordem de bloqueio do checkout: usuários, depois livros (cada
+        # UPDATE percorre a chave primária, ou seja, em ordem de ID)
+        per_user = Counter(loan.user_id for loan in active)
+        db.execute(
+            update(User)
+            .where(User.id.in_(sorted(per_user)))
+            .values(active_loan_count=_greatest(
+                dialect_name, 0, User.active_loan_count - _per_id_case(User.id, per_user)
+            ))
+            .execution_options(synchronize_session=False)
+        )
+
+        per_book = Counter(loan.book_id for loan in active)
+        db.execute(
+            update(Book)
+            .where(Book.id.in_(sorted(per_book)))
+            .values(available_copies=Book.available_copies + _per_id_case(Book.id, per_book))
+            .execution_options(synchronize_session=False)
+        )
+
+        fines = dict(
+            db.query(Loan.id, Loan.fine_amount).filter(Loan.id.in_(active_ids)).all()
+        )
+        db.commit()
+        invalidate_books(per_book)
+
+    items = []
+    for loan_id in requested:
+        if loan_id not in found:
+            items.append({"loan_id": loan_id, "status": LoanReturnItemStatus.not_found})
+        elif loan_id in fines:
+            items.append({"loan_id": loan_id, "status": LoanReturnItemStatus.returned, "fine_amount": fines[loan_id]})
+        else:
+            items.append({"loan_id": loan_id, "status": LoanReturnItemStatus.already_returned})
+
+    logger.info(f"Devolução em lote: {len(fines)} de {len(requested)} empréstimo(s) devolvido(s) em {return_date}")
+    return {"return_date": return_date, "returned": len(fines), "items": items}
+
+
 def list_active_loans_by_user_service(db: Session, user_id: str) -> List[Loan]:
     return db.query(Loan).filter(
         Loan.user_id == user_id,
@@ -234,5 +693,25 @@ def list_overdue_loans_by_user_service(db: Session, user_id: str) -> List[Loan]:
     ).all()
 
 
-def list_loan_history_by_user_service(db: Session, user_id: str) -> List[Loan]:
+def build_archived_history_query(user_id: str) -> Select:
+    """
+    Histórico completo: empréstimos de `loans` unidos aos de `loans_archive`
+    (UNION ALL; um empréstimo está em apenas uma das tabelas).
+    """
+    columns = ("id", "user_id", "book_id", "loan_date", "due_date", "return_date", "fine_amount")
+    history = union_all(
+        select(*[getattr(Loan, name) for name in columns]).where(Loan.user_id == user_id),
+        select(*[getattr(LoanArchive, name) for name in columns]).where(LoanArchive.user_id == user_id)
+    ).subquery()
+    return select(history).order_by(history.c.loan_date, history.c.id)
+
+
+def list_loan_history_by_user_service(db: Session, user_id: str, include_archived: bool = False) -> List:
+    """
+    Histórico de empréstimos do usuário. Por padrão consulta apenas a tabela
+    `loans`; com `include_archived` inclui os empréstimos já arquivados.
+    """
+    if include_archived:
+        rows = db.execute(build_archived_history_query(user_id)).mappings().all()
+        return [dict(row) for row in rows]
     return db.query(Loan).filter(Loan.user_id == user_id).all()
@@ -0,0 +1,173 @@
+"""
+Cache L1 (por worker) de registros de referência: autores e metadados de livros.
+
+Autores e título/data/autor dos livros quase nunca mudam, mas são lidos a
+cada detalhe de autor e listagem de livros por autor (síncrona ou assíncrona).
+Este cache mantém registros compactos e desacoplados da sessão (sem
+relacionamentos nem lazy loads) em um LRU limitado do próprio processo.
+
+As chaves incluem uma versão global do processo, incrementada pelos
+serviços de escrita de autores e livros: após uma escrita, todas as
+entradas anteriores ficam inalcançáveis. Escritas feitas em outros workers
+são percebidas ao expirar o TTL (REFERENCE_CACHE_TTL_SECONDS).
+"""
+
+import threading
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.cache import TTLCache
+from app.core.settings import settings
+from app.models.author_model import Author
+from app.models.book_model import Book
+
+
+@dataclass(frozen=True)
+class AuthorRecord:
+    id: str
+    name: str
+    bio: Optional[str]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class BookMetadata:
+    id: str
+    title: str
+    author_id: str
+    published_date: Optional[date]
+
+
+reference_cache = TTLCache(
+    max_size=settings.REFERENCE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS
+)
+
+_version = 0
+_version_lock = threading.Lock()
+
+
+def bump_reference_version() -> None:
+    """Invalida todos os registros de referência deste worker."""
+    global _version
+    with _version_lock:
+        _version += 1
+
+
+def current_version() -> int:
+    """
+    Versão atual; capture-a antes de ler do banco e informe-a ao guardar o
+    registro, para que uma leitura concorrente a uma escrita não seja
+    guardada sob a versão nova.
+    """
+    return _version
+
+
+def _key(kind: str, record_id, version: Optional[int] = None) -> Tuple[str, int, str]:
+    return kind, _version if version is None else version, str(record_id)
+
+
+# ---------- Autores ----------
+
+def lookup_author(author_id: str) -> Optional[AuthorRecord]:
+    """Consulta apenas o cache L1 (sem acesso ao banco)."""
+    return reference_cache.get(_key("author", author_id))
+
+
+def remember_author(author: Author, version: int) -> AuthorRecord:
+    """Guarda no cache L1 uma cópia compacta do autor carregado."""
+    record = AuthorRecord(id=author.id, name=author.name, bio=author.bio)
+    reference_cache.set(_key("author", record.id, version), record)
+    return record
+
+
+def get_author_record(db: Session, author_id: str) -> Optional[AuthorRecord]:
+    """
+    Retorna o registro do autor (cache L1, depois banco) ou None se não existir.
+    """
+    version = current_version()
+    record = lookup_author(author_id)
+    if record is not None:
+        return record
+    author = db.query(Author).filter(Author.id == str(author_id)).first()
+    return remember_author(author, version) if author else None
+
+
+# ---------- Metadados de livros ----------
+
+def lookup_author_books(author_id: str) -> Optional[List[BookMetadata]]:
+    """Consulta apenas o cache L1 (sem acesso ao banco)."""
+    return reference_cache.get(_key("author_books", author_id))
+
+
+def remember_author_books(author_id: str, books, version: int) -> List[BookMetadata]:
+    """Guarda no cache L1 os metadados dos livros de um autor."""
+    records = [
+        BookMetadata(
+            id=book.id,
+            title=book.title,
+            author_id=book.author_id,
+            published_date=book.published_date
+        )
+        for book in books
+    ]
+    reference_cache.set(_key("author_books", author_id, version), records)
+    return records
+
+
+def author_books_metadata_query(author_id: str) -> Select:
+    """Consulta dos metadados dos livros de um autor (sessões síncronas e assíncronas)."""
+    return (
+        select(Book.id, Book.title, Book.author_id, Book.published_date)
+        .where(Book.author_id == str(author_id))
+        .order_by(Book.title, Book.id)
+    )
+
+
+def get_author_books_metadata(db: Session, author_id: str, refresh: bool = False) -> List[BookMetadata]:
+    """
+    Retorna os metadados dos livros de um autor (cache L1, depois banco).
+    Com `refresh`, ignora o cache e recarrega a entrada do banco.
+    """
+    version = current_version()
+    records = None if refresh else lookup_author_books(author_id)
+    if records is not None:
+        return records
+    books = db.execute(author_books_metadata_query(author_id)).all()
+    return remember_author_books(author_id, books, version)
+
+
+def author_books_copies_query(author_id: str) -> Select:
+    """Cópias atuais (total e disponíveis) dos livros de um autor, sempre lidas do banco."""
+    return select(Book.id, Book.available_copies, Book.total_copies).where(Book.author_id == str(author_id))
+
+
+def merge_author_books(books: List[BookMetadata], copies, strict: bool = True) -> Optional[List[dict]]:
+    """
+    Combina os metadados do cache L1 com as cópias lidas do banco. Com
+    `strict`, retorna None se o conjunto de livros divergir (livro criado ou
+    removido em outro worker), indicando que os metadados devem ser recarregados.
+    """
+    current = {row.id: row for row in copies}
+    if strict and {book.id for book in books} != set(current):
+        return None
+    merged = []
+    for book in books:
+        row = current.get(book.id)
+        merged.append({
+            **asdict(book),
+            "available_copies": row.available_copies if row else 0,
+            "total_copies": row.total_copies if row else 0,
+        })
+    return merged
+
+
+def reference_cache_stats() -> Dict[str, int]:
+    return {**reference_cache.stats(), "version": _version}
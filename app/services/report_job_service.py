@@ -0,0 +1,170 @@
+"""
+Serviços de geração de relatórios em background.
+
+Inclui regras de negócio para:
+- Enfileirar a geração de um relatório em um pool de workers
+- Consultar o andamento de um job
+- Reaproveitar um relatório já gerado enquanto os dados não mudarem
+  (apenas com um backend de cache compartilhado, por até
+  REPORT_REUSE_MAX_AGE_SECONDS)
+"""
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
+from uuid import uuid4
+import os
+import threading
+
+from app.core.settings import settings
+from app.core.logging import logger
+from app.db.session import SessionLocal
+from app.schemas.report_schema import ReportKind, ReportJobStatus
+from app.services.catalog_cache import data_version
+from app.services.report_service import export_books_csv, export_report_pdf
+
+REPORT_EXPORTERS: Dict[ReportKind, Tuple[Callable[[Session, str], str], str]] = {
+    ReportKind.full_pdf: (export_report_pdf, "application/pdf"),
+    ReportKind.books_csv: (export_books_csv, "text/csv"),
+}
+
+
+class ReportJob:
+    """
+    Representa a geração de um relatório.
+
+    Atributos:
+        id (str): Identificador do job.
+        kind (ReportKind): Tipo de relatório.
+        fingerprint (str | None): Assinatura dos dados no momento da solicitação
+            (None quando não há versão compartilhada; o job não é reaproveitado).
+        status (ReportJobStatus): Estado atual do job.
+        file_path (str | None): Caminho do arquivo gerado.
+        error (str | None): Mensagem de erro, se falhou.
+    """
+
+    def __init__(self, kind: ReportKind, fingerprint: Optional[str]):
+        self.id = str(uuid4())
+        self.kind = kind
+        self.fingerprint = fingerprint
+        self.status = ReportJobStatus.pending
+        self.file_path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def media_type(self) -> str:
+        return REPORT_EXPORTERS[self.kind][1]
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.REPORT_JOB_WORKERS,
+    thread_name_prefix="report-job"
+)
+_jobs: Dict[str, ReportJob] = {}
+_jobs_by_fingerprint: Dict[Tuple[ReportKind, str], str] = {}
+_lock = threading.Lock()
+
+
+def report_data_fingerprint() -> Optional[str]:
+    """
+    Assinatura dos dados usados nos relatórios: a versão avançada por todas
+    as escritas de livros e empréstimos (`bump_data_version`), sem consultar
+    as tabelas. None quando a versão não é compartilhada entre processos.
+    """
+    return data_version()
+
+
+def _run_report_job(job: ReportJob) -> None:
+    exporter, _ = REPORT_EXPORTERS[job.kind]
+    job.status = ReportJobStatus.running
+    db = SessionLocal()
+    try:
+        job.file_path = exporter(db, job.id)
+        job.status = ReportJobStatus.done
+        logger.info(f"Relatório {job.kind.value} gerado pelo job {job.id}")
+    except Exception as e:
+        job.error = str(e)
+        job.status = ReportJobStatus.failed
+        logger.error(f"Falha no job de relatório {job.id}: {str(e)}")
+    finally:
+        job.finished_at = datetime.now()
+        db.close()
+
+
+def _is_reusable(job: Optional[ReportJob]) -> bool:
+    if job is None or job.status == ReportJobStatus.failed:
+        return False
+    # Limita a defasagem caso alguma invalidação da versão tenha se perdido
+    if datetime.now() - job.created_at > timedelta(seconds=settings.REPORT_REUSE_MAX_AGE_SECONDS):
+        return False
+    if job.status == ReportJobStatus.done:
+        return bool(job.file_path) and os.path.exists(job.file_path)
+    return True
+
+
+def _evict_old_jobs() -> None:
+    """Remove os jobs finalizados mais antigos além do limite configurado."""
+    finished = sorted(
+        (job for job in _jobs.values() if job.finished_at is not None),
+        key=lambda job: job.created_at
+    )
+    excess = len(_jobs) - settings.REPORT_JOB_MAX_JOBS
+    for job in finished[:max(excess, 0)]:
+        _jobs.pop(job.id, None)
+        if _jobs_by_fingerprint.get((job.kind, job.fingerprint)) == job.id:
+            del _jobs_by_fingerprint[(job.kind, job.fingerprint)]
+        if job.file_path and os.path.exists(job.file_path):
+            os.remove(job.file_path)
+
+
+def submit_report_job(kind: ReportKind) -> Tuple[ReportJob, bool]:
+    """
+    Enfileira a geração de um relatório.
+
+    Se já existe um job (em andamento ou concluído) para os mesmos dados,
+    criado há menos de REPORT_REUSE_MAX_AGE_SECONDS, ele é retornado em vez
+    de gerar o relatório novamente. Sem versão compartilhada dos dados
+    (CACHE_BACKEND diferente de redis), todo pedido gera um novo relatório.
+    Retorna o job e se ele foi reaproveitado.
+    """
+    fingerprint = report_data_fingerprint()
+
+    with _lock:
+        if fingerprint is not None:
+            existing = _jobs.get(_jobs_by_fingerprint.get((kind, fingerprint)))
+            if _is_reusable(existing):
+                logger.info(f"Reaproveitando job de relatório {existing.id} ({kind.value})")
+                return existing, True
+
+        job = ReportJob(kind, fingerprint)
+        _jobs[job.id] = job
+        if fingerprint is not None:
+            _jobs_by_fingerprint[(kind, fingerprint)] = job.id
+        _evict_old_jobs()
+
+    _executor.submit(_run_report_job, job)
+    logger.info(f"Job de relatório {job.id} ({kind.value}) enfileirado")
+    return job, False
+
+
+def get_report_job(job_id: str) -> ReportJob:
+    """
+    Busca um job de relatório pelo ID.
+    """
+    job = _jobs.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job de relatório não encontrado"
+        )
+    return job
+
+
+def shutdown_report_jobs() -> None:
+    """Encerra o pool de workers de relatórios (shutdown da aplicação)."""
+    _executor.shutdown(wait=False)
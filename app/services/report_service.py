@@ -1,12 +1,17 @@
 # app/services/report_service.py
 from fpdf import FPDF
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional
+from uuid import uuid4
 import csv
+import io
 import os
 
+from app.core.settings import settings
+from app.db.session import SessionLocal
 from app.models.book_model import Book
 from app.models.loan_model import Loan
 
@@ -22,18 +27,64 @@ def fetch_loans(db: Session) -> List[Loan]:
     return db.query(Loan).all()
 
 
-def export_books_csv(db: Session) -> str:
+def _report_path(prefix: str, extension: str, token: Optional[str] = None) -> str:
+    """
+    Caminho de um novo arquivo de relatório. O `token` (ex.: ID do job)
+    evita que relatórios gerados no mesmo segundo compartilhem o arquivo.
+    """
+    return os.path.join(
+        REPORT_DIR, f'{prefix}_{datetime.now():%Y%m%d_%H%M%S}_{token or uuid4().hex}.{extension}'
+    )
+
+
+BOOKS_CSV_HEADER = ["ID", "Título", "Autor ID", "Publicado em", "Total Cópia", "Disponíveis"]
+
+
+def export_books_csv(db: Session, token: Optional[str] = None) -> str:
     books = fetch_books(db)
-    filename = os.path.join(REPORT_DIR, f'books_{datetime.now():%Y%m%d_%H%M%S}.csv')
+    filename = _report_path('books', 'csv', token)
     with open(filename, mode="w", newline="", encoding="utf-8-sig") as file:
         writer = csv.writer(file)
-        writer.writerow(["ID", "Título", "Autor ID", "Publicado em", "Total Cópia", "Disponíveis"])
+        writer.writerow(BOOKS_CSV_HEADER)
         for b in books:
             writer.writerow([b.id, b.title, b.author_id, b.published_date, b.total_copies, b.available_copies])
     return filename
 
 
-def export_report_pdf(db: Session) -> str:
+def stream_books_csv(batch_size: int = settings.REPORT_CSV_BATCH_SIZE) -> Iterator[str]:
+    """
+    Gera o CSV de livros em blocos, sem carregar a tabela inteira.
+
+    Usa consulta só de colunas com cursor no servidor (`stream_results`) e
+    emite um bloco de texto por lote de `batch_size` linhas. Abre a própria
+    sessão, pois a resposta é consumida depois que o handler retorna.
+    """
+    db = SessionLocal()
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write("\ufeff")  # BOM, como no arquivo gerado em disco (utf-8-sig)
+        writer.writerow(BOOKS_CSV_HEADER)
+
+        query = select(
+            Book.id, Book.title, Book.author_id, Book.published_date,
+            Book.total_copies, Book.available_copies
+        ).order_by(Book.id).execution_options(stream_results=True)
+
+        result = db.execute(query)
+        for rows in result.partitions(batch_size):
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+        if buffer.tell():
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+
+def export_report_pdf(db: Session, token: Optional[str] = None) -> str:
     books = fetch_books(db)
     loans = fetch_loans(db)
     pdf = FPDF()
@@ -51,6 +102,6 @@ def export_report_pdf(db: Session) -> str:
     for ln in loans:
         pdf.cell(0, 6, f'{ln.id} | Usuário: {ln.user_id} | Livro: {ln.book_id} | Empréstimo: {ln.loan_date} | Devolução: {ln.return_date}', ln=True)
 
-    filename = os.path.join(REPORT_DIR, f'report_{datetime.now():%Y%m%d_%H%M%S}.pdf')
+    filename = _report_path('report', 'pdf', token)
     pdf.output(filename)
     return filename
\ No newline at end of file
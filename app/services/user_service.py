@@ -1,13 +1,14 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
-from uuid import uuid4
 from typing import List
 
 from app.models.user_model import User
-from app.models.loan_model import Loan
 from app.schemas.user_schema import UserCreate, UserUpdate
 from app.core.security import get_password_hash
+from app.dependencies.auth import invalidate_principal
+from app.services.loan_service import list_loan_history_by_user_service
+from app.utils.ids import new_id
 from app.core.logging import logger
 
 
@@ -26,7 +27,7 @@ def create_user_service(db: Session, user_data: UserCreate) -> User:
     hashed_pw = get_password_hash(user_data.password)
 
     new_user = User(
-        id=str(uuid4()),
+        id=new_id(),
         name=user_data.name,
         email=user_data.email,
         hashed_password=hashed_pw
@@ -59,9 +60,10 @@ def get_user_service(db: Session, user_id: str) -> User:
     return user
 
 
-def get_user_loans_service(db: Session, user_id: str) -> List[Loan]:
+def get_user_loans_service(db: Session, user_id: str, include_archived: bool = False) -> List:
     """
-    Retorna os empréstimos de um usuário específico.
+    Retorna os empréstimos de um usuário específico. Com `include_archived`,
+    inclui os empréstimos já movidos para `loans_archive`.
     """
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -70,7 +72,7 @@ def get_user_loans_service(db: Session, user_id: str) -> List[Loan]:
             detail="Usuário não encontrado"
         )
 
-    loans = db.query(Loan).filter(Loan.user_id == user_id).all()
+    loans = list_loan_history_by_user_service(db, user_id, include_archived)
     if not loans:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -91,6 +93,8 @@ def update_user_service(db: Session, user_id: str, user_data: UserUpdate) -> Use
             detail="Usuário não encontrado"
         )
 
+    previous_email = user.email
+
     if user_data.email and user.email != user_data.email:
         existing_user = db.query(User).filter(User.email == user_data.email).first()
         if existing_user:
@@ -107,6 +111,7 @@ def update_user_service(db: Session, user_id: str, user_data: UserUpdate) -> Use
         user.hashed_password = get_password_hash(user_data.password)
 
     db.commit()
+    invalidate_principal(previous_email)
     logger.info(f"Usuário {user.email} atualizado com sucesso")
     db.refresh(user)
     return user
@@ -123,6 +128,8 @@ def delete_user_service(db: Session, user_id: str) -> None:
             detail="Usuário não encontrado"
         )
 
+    email = user.email
     db.delete(user)
     db.commit()
-    logger.info(f"Usuário {user.email} removido com sucesso")
+    invalidate_principal(email)
+    logger.info(f"Usuário {email} removido com sucesso")
@@ -0,0 +1,134 @@
+"""
+Expansão de relacionamentos nas listagens (`include=book,user,author`).
+
+Os relacionamentos pedidos são carregados junto com a consulta principal
+(`joinedload`) e as respostas são montadas explicitamente a partir das
+colunas, sem acessar relacionamentos não carregados, para que a
+serialização não dispare consultas adicionais (N+1).
+"""
+
+from typing import Iterable, List, Optional, Set
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import joinedload
+
+from app.models.author_model import Author
+from app.models.book_model import Book
+from app.models.loan_model import Loan
+from app.models.user_model import User
+
+# Relacionamentos aceitos em cada listagem
+LOAN_EXPANSIONS = ("book", "user", "author")
+BOOK_EXPANSIONS = ("author",)
+
+
+def parse_include(include: Optional[str], allowed: Iterable[str]) -> Set[str]:
+    """
+    Converte o parâmetro `include` (separado por vírgulas) em um conjunto.
+    Lança 422 para relacionamentos não suportados.
+    """
+    if not include:
+        return set()
+    requested = {part.strip() for part in include.split(",") if part.strip()}
+    invalid = requested - set(allowed)
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Relacionamento inválido em include: {', '.join(sorted(invalid))}"
+        )
+    return requested
+
+
+def loan_load_options(include: Set[str]) -> list:
+    """Opções de carregamento para a consulta de empréstimos."""
+    options = []
+    if "user" in include:
+        options.append(joinedload(Loan.user))
+    if "author" in include:
+        options.append(joinedload(Loan.book).joinedload(Book.author))
+    elif "book" in include:
+        options.append(joinedload(Loan.book))
+    return options
+
+
+def book_load_options(include: Set[str]) -> list:
+    """Opções de carregamento para a consulta de livros."""
+    return [joinedload(Book.author)] if "author" in include else []
+
+
+def loan_fields(loan: Loan) -> dict:
+    """
+    Campos de coluna do empréstimo (sem acessar relacionamentos, evitando
+    carregamentos adicionais na serialização).
+    """
+    return {
+        "id": loan.id,
+        "user_id": loan.user_id,
+        "book_id": loan.book_id,
+        "loan_date": loan.loan_date,
+        "due_date": loan.due_date,
+        "return_date": loan.return_date,
+        "fine_amount": loan.fine_amount,
+    }
+
+
+def book_fields(book: Book) -> dict:
+    """Campos de coluna do livro."""
+    return {
+        "id": book.id,
+        "title": book.title,
+        "author_id": book.author_id,
+        "published_date": book.published_date,
+        "total_copies": book.total_copies,
+        "available_copies": book.available_copies,
+    }
+
+
+def author_fields(author: Author) -> dict:
+    """Campos de coluna do autor."""
+    return {"id": author.id, "name": author.name, "bio": author.bio}
+
+
+def author_summary(author: Optional[Author]) -> Optional[dict]:
+    if author is None:
+        return None
+    return {"id": author.id, "name": author.name}
+
+
+def user_summary(user: Optional[User]) -> Optional[dict]:
+    if user is None:
+        return None
+    return {"id": user.id, "name": user.name, "email": user.email}
+
+
+def book_summary(book: Optional[Book], include: Set[str]) -> Optional[dict]:
+    if book is None:
+        return None
+    summary = {"id": book.id, "title": book.title, "author_id": book.author_id}
+    if "author" in include:
+        summary["author"] = author_summary(book.author)
+    return summary
+
+
+def expand_loans(loans: Iterable[Loan], include: Set[str]) -> List[dict]:
+    """Monta a resposta de empréstimos com os relacionamentos pedidos."""
+    items = []
+    for loan in loans:
+        item = loan_fields(loan)
+        if "user" in include:
+            item["user"] = user_summary(loan.user)
+        if "book" in include or "author" in include:
+            item["book"] = book_summary(loan.book, include)
+        items.append(item)
+    return items
+
+
+def expand_books(books: Iterable[Book], include: Set[str]) -> List[dict]:
+    """Monta a resposta de livros com os relacionamentos pedidos."""
+    items = []
+    for book in books:
+        item = book_fields(book)
+        if "author" in include:
+            item["author"] = author_summary(book.author)
+        items.append(item)
+    return items
@@ -0,0 +1,64 @@
+"""
+Geração de identificadores das entidades.
+
+Por padrão gera UUIDv7 (RFC 9562): os 48 bits iniciais são o timestamp em
+milissegundos, então IDs novos são crescentes e as inserções caem no final
+da chave primária clusterizada do InnoDB, em vez de espalhadas pela árvore
+como no UUIDv4 (que causa divisões de página e mais I/O em escrita).
+
+Dentro do mesmo milissegundo, os 12 bits `rand_a` funcionam como contador
+(método 1 da RFC), mantendo a ordem dos IDs gerados por este processo.
+A estratégia é definida por ID_STRATEGY (uuid7 | uuid4); ambos os formatos
+são UUIDs válidos e podem coexistir na mesma tabela.
+"""
+
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict
+
+from app.core.settings import settings
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Gera um UUIDv7 monotônico dentro do processo."""
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Mesmo milissegundo (ou relógio recuou): incrementa o contador e,
+            # se ele estourar, avança o timestamp lógico
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+ID_GENERATORS: Dict[str, Callable[[], uuid.UUID]] = {
+    "uuid7": uuid7,
+    "uuid4": uuid.uuid4,
+}
+
+
+def new_id() -> str:
+    """Gera o ID (em texto) de uma nova entidade, conforme ID_STRATEGY."""
+    return str(ID_GENERATORS.get(settings.ID_STRATEGY.lower(), uuid7)())
@@ -0,0 +1,136 @@
+"""
+Paginação por cursor (keyset).
+
+O cursor é um token opaco (base64 de JSON) com o campo de ordenação e os
+valores da última linha retornada. A próxima página é obtida com uma
+condição `(coluna, id) > (valor, último_id)` que usa o índice da coluna de
+ordenação, em vez de `OFFSET`, que lê e descarta as linhas anteriores.
+
+Colunas anuláveis seguem a ordenação padrão do MySQL (e do SQLite): NULL
+vem antes de qualquer valor em ordem crescente e depois em ordem
+decrescente. A condição do cursor trata NULL explicitamente, já que
+`coluna > NULL` nunca é verdadeira e encerraria a paginação.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, false, or_
+from sqlalchemy.sql import Select
+
+# Cabeçalho de resposta com o cursor da próxima página
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+def _from_json(column, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    return value
+
+
+def encode_cursor(sort_key: str, values: Sequence[Any]) -> str:
+    """Gera o token opaco a partir da chave de ordenação e dos valores."""
+    payload = json.dumps({"k": sort_key, "v": [_to_json(v) for v in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, columns: Sequence[Any]) -> List[Any]:
+    """
+    Decodifica o cursor e converte os valores para os tipos das colunas.
+    Lança 400 se o cursor for inválido ou gerado para outra ordenação.
+    """
+    invalid = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cursor de paginação inválido"
+    )
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["v"]
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise invalid
+    if payload.get("k") != sort_key or len(values) != len(columns):
+        raise invalid
+    try:
+        return [_from_json(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError, ArithmeticError):
+        raise invalid
+
+
+def _nullable(column) -> bool:
+    # Atributos do ORM expõem a coluna em `expression`; na dúvida, anulável
+    return getattr(getattr(column, "expression", column), "nullable", True)
+
+
+def _equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _beyond(column, value, descending: bool):
+    """Linhas posteriores a `value` na ordem da coluna (NULL como menor valor)."""
+    if value is None:
+        return column.is_not(None) if not descending else false()
+    if descending:
+        return or_(column < value, column.is_(None)) if _nullable(column) else column < value
+    return column > value
+
+
+def apply_keyset(
+    query: Select,
+    columns: Sequence[Any],
+    cursor_values: Optional[Sequence[Any]] = None,
+    descending: bool = False
+) -> Select:
+    """
+    Ordena a consulta pelas colunas informadas (a última deve ser única,
+    normalmente o `id`) e, se houver cursor, filtra as linhas posteriores.
+    """
+    if cursor_values is not None:
+        clauses = []
+        for i, column in enumerate(columns):
+            equal_prefix = [_equal(columns[j], cursor_values[j]) for j in range(i)]
+            clauses.append(and_(*equal_prefix, _beyond(column, cursor_values[i], descending)))
+        query = query.where(or_(*clauses))
+
+    return query.order_by(*[column.desc() if descending else column.asc() for column in columns])
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    sort_key: str,
+    attributes: Sequence[str]
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Recebe até `limit + 1` linhas e devolve a página e o cursor seguinte
+    (None quando não há mais resultados).
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(sort_key, [getattr(last, attr) for attr in attributes])
@@ -0,0 +1,84 @@
+"""
+Índice de trigramas em memória para busca de livros.
+
+Usado como alternativa ao índice FULLTEXT do MySQL em implantações com
+outros bancos (ex.: SQLite local). Indexa título do livro e nome do autor,
+normalizados (minúsculas, sem acentos), e ordena os resultados pela fração
+de trigramas da consulta presentes em cada documento.
+"""
+
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+
+def normalize(text: str) -> str:
+    """Converte para minúsculas e remove acentos."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Gera os trigramas de cada palavra, com espaços nas bordas."""
+    grams: Set[str] = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """
+    Índice invertido trigrama -> ids, reconstruído sob demanda.
+
+    O índice é marcado como inválido pelos serviços de escrita e também
+    expira após `ttl_seconds`, limitando a defasagem entre processos.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, min_score: float = 0.3):
+        self.ttl_seconds = ttl_seconds
+        self.min_score = min_score
+        self._postings: Dict[str, Set[str]] = {}
+        self._built_at = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        self._built_at = None
+
+    def _is_fresh(self) -> bool:
+        return self._built_at is not None and time.monotonic() - self._built_at < self.ttl_seconds
+
+    def ensure_built(self, loader: Callable[[], Iterable[Tuple[str, str]]]) -> None:
+        """Reconstrói o índice a partir de pares (id, texto) se necessário."""
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._is_fresh():
+                return
+            postings: Dict[str, Set[str]] = defaultdict(set)
+            for doc_id, text in loader():
+                for gram in trigrams(text):
+                    postings[gram].add(doc_id)
+            self._postings = dict(postings)
+            self._built_at = time.monotonic()
+
+    def search(self, query: str) -> List[Tuple[str, float]]:
+        """Retorna (id, relevância) ordenado por relevância decrescente."""
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+        postings = self._postings
+        counts: Dict[str, int] = defaultdict(int)
+        for gram in query_grams:
+            for doc_id in postings.get(gram, ()):
+                counts[doc_id] += 1
+        total = len(query_grams)
+        ranked = [
+            (doc_id, count / total)
+            for doc_id, count in counts.items()
+            if count / total >= self.min_score
+        ]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
@@ -11,3 +11,13 @@ CREATE INDEX idx_books_available ON books(available_copies);
 
 -- Índice composto para otimizar consultas de empréstimos vencidos
 CREATE INDEX idx_loans_overdue ON loans(due_date, return_date);
+
+-- Índices para paginação por cursor (keyset) na listagem de livros;
+-- no InnoDB o índice secundário já inclui a chave primária (id) como desempate
+CREATE INDEX idx_books_title ON books(title);
+CREATE INDEX idx_books_published_date ON books(published_date);
+CREATE INDEX idx_books_total_copies ON books(total_copies);
+
+-- Índices FULLTEXT para a busca textual (GET /books?q=) por título e autor
+CREATE FULLTEXT INDEX ft_books_title ON books(title);
+CREATE FULLTEXT INDEX ft_authors_name ON authors(name);
@@ -0,0 +1,16 @@
+-- 03_active_loan_count.sql
+
+-- Contador de empréstimos ativos por usuário, mantido pelos serviços de
+-- empréstimo; evita contar o histórico de empréstimos a cada checkout
+ALTER TABLE users
+  ADD COLUMN active_loan_count INT NOT NULL DEFAULT 0;  -- Empréstimos ainda não devolvidos
+
+-- Carga inicial do contador (equivalente a `python -m app.jobs.loan_counters`)
+UPDATE users u
+SET u.active_loan_count = (
+  SELECT COUNT(*) FROM loans l
+  WHERE l.user_id = u.id AND l.return_date IS NULL
+);
+
+-- Índice composto para empréstimos ativos por usuário (listagens e reconciliação)
+CREATE INDEX idx_loans_user_return ON loans(user_id, return_date);
@@ -0,0 +1,6 @@
+-- 04_fine_accrual.sql
+
+-- Data da última execução do acúmulo de multas aplicada ao empréstimo;
+-- torna o job `python -m app.jobs.fine_accrual` idempotente por data
+ALTER TABLE loans
+  ADD COLUMN fine_accrued_on DATE NULL;  -- Nulo até o primeiro acúmulo
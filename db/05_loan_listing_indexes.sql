@@ -0,0 +1,21 @@
+-- 05_loan_listing_indexes.sql
+
+-- Índices para a listagem paginada de empréstimos (GET /loans), ordenada
+-- por (loan_date, id); no InnoDB o índice secundário já inclui o id
+CREATE INDEX idx_loans_loan_date ON loans(loan_date);
+
+-- Filtros por usuário e por livro mantendo a ordem da paginação
+CREATE INDEX idx_loans_user_loan_date ON loans(user_id, loan_date);
+CREATE INDEX idx_loans_book_loan_date ON loans(book_id, loan_date);
+
+-- Filtro por situação, conforme o valor de `status`:
+-- - active (return_date IS NULL): igualdade na primeira coluna; o índice
+--   (com o id implícito do InnoDB) entrega as linhas já na ordem (loan_date, id).
+-- - overdue (return_date IS NULL AND due_date < hoje): mesma faixa e mesma
+--   ordem; due_date é verificado em cada linha ativa lida. Incluir due_date
+--   no índice quebraria a ordem (loan_date, id) e exigiria ordenação.
+-- - returned (return_date IS NOT NULL): é uma faixa em return_date, que não
+--   preserva a ordem por loan_date; é atendido por idx_loans_loan_date, que
+--   percorre a ordem da paginação e descarta apenas os empréstimos ativos
+--   (minoria da tabela).
+CREATE INDEX idx_loans_return_loan_date ON loans(return_date, loan_date);
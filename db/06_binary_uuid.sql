@@ -0,0 +1,71 @@
+-- 06_binary_uuid.sql
+
+-- Opcional: converte as chaves UUID de CHAR(36) para BINARY(16)
+-- (usar com UUID_STORAGE=binary). Com utf8mb4 cada CHAR(36) ocupa até 144
+-- bytes nas chaves; em BINARY(16) a chave primária e todos os índices
+-- secundários (que no InnoDB repetem a chave primária) ficam bem menores.
+--
+-- A conversão é feita no próprio lugar (CHAR -> VARBINARY -> UUID_TO_BIN
+-- -> BINARY(16)) para preservar os índices existentes. Requer MySQL 8.0+.
+-- Faça backup e execute com a aplicação parada: a API precisa ser reiniciada
+-- com UUID_STORAGE=binary logo após a migração.
+
+-- Remove as chaves estrangeiras enquanto os tipos das colunas divergem
+ALTER TABLE loans
+  DROP FOREIGN KEY fk_loans_user,
+  DROP FOREIGN KEY fk_loans_book;
+ALTER TABLE books
+  DROP FOREIGN KEY fk_books_author;
+
+-- Etapa 1: texto -> bytes, sem alterar o conteúdo
+ALTER TABLE users   MODIFY id VARBINARY(36) NOT NULL;
+ALTER TABLE authors MODIFY id VARBINARY(36) NOT NULL;
+ALTER TABLE books
+  MODIFY id VARBINARY(36) NOT NULL,
+  MODIFY author_id VARBINARY(36) NOT NULL;
+ALTER TABLE loans
+  MODIFY id VARBINARY(36) NOT NULL,
+  MODIFY user_id VARBINARY(36) NOT NULL,
+  MODIFY book_id VARBINARY(36) NOT NULL;
+
+-- Etapa 2: UUID em texto -> 16 bytes (sem swap_flag: mesma ordem de bytes
+-- usada pela aplicação, uuid.UUID(id).bytes)
+UPDATE users   SET id = UUID_TO_BIN(CONVERT(id USING ascii));
+UPDATE authors SET id = UUID_TO_BIN(CONVERT(id USING ascii));
+UPDATE books SET
+  id = UUID_TO_BIN(CONVERT(id USING ascii)),
+  author_id = UUID_TO_BIN(CONVERT(author_id USING ascii));
+UPDATE loans SET
+  id = UUID_TO_BIN(CONVERT(id USING ascii)),
+  user_id = UUID_TO_BIN(CONVERT(user_id USING ascii)),
+  book_id = UUID_TO_BIN(CONVERT(book_id USING ascii));
+
+-- Etapa 3: largura fixa de 16 bytes
+ALTER TABLE users   MODIFY id BINARY(16) NOT NULL;
+ALTER TABLE authors MODIFY id BINARY(16) NOT NULL;
+ALTER TABLE books
+  MODIFY id BINARY(16) NOT NULL,
+  MODIFY author_id BINARY(16) NOT NULL;
+ALTER TABLE loans
+  MODIFY id BINARY(16) NOT NULL,
+  MODIFY user_id BINARY(16) NOT NULL,
+  MODIFY book_id BINARY(16) NOT NULL;
+
+-- Recria as chaves estrangeiras
+ALTER TABLE books
+  ADD CONSTRAINT fk_books_author
+    FOREIGN KEY (author_id) REFERENCES authors(id)
+    ON DELETE RESTRICT ON UPDATE CASCADE;
+ALTER TABLE loans
+  ADD CONSTRAINT fk_loans_user
+    FOREIGN KEY (user_id) REFERENCES users(id)
+    ON DELETE RESTRICT ON UPDATE CASCADE,
+  ADD CONSTRAINT fk_loans_book
+    FOREIGN KEY (book_id) REFERENCES books(id)
+    ON DELETE RESTRICT ON UPDATE CASCADE;
+
+-- Atualiza as estatísticas dos índices após a reescrita
+ANALYZE TABLE users, authors, books, loans;
+
+-- Para consultas manuais, use BIN_TO_UUID(id) / UUID_TO_BIN('...'), ex.:
+-- SELECT BIN_TO_UUID(id) AS id, title FROM books;
@@ -0,0 +1,36 @@
+-- 07_loans_archive.sql
+
+-- Arquivo de empréstimos devolvidos, alimentado pelo job
+-- `python -m app.jobs.loan_archival`; mantém a tabela `loans` e seus
+-- índices restritos aos empréstimos recentes.
+-- Sem chaves estrangeiras (não suportadas em tabelas particionadas).
+-- Se a migração 06_binary_uuid.sql foi aplicada, use BINARY(16) nas colunas UUID.
+CREATE TABLE IF NOT EXISTS loans_archive (
+  id CHAR(36)               NOT NULL,             -- UUID do empréstimo original
+  user_id CHAR(36)          NOT NULL,             -- UUID do usuário
+  book_id CHAR(36)          NOT NULL,             -- UUID do livro
+  loan_date DATE            NOT NULL,             -- Data de início do empréstimo
+  due_date DATE             NOT NULL,             -- Data de vencimento
+  return_date DATE          NOT NULL,             -- Data de devolução
+  fine_amount DECIMAL(10,2) NOT NULL DEFAULT 0.00,-- Valor final da multa
+  archived_at DATETIME      NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Momento do arquivamento
+  PRIMARY KEY (id, return_date)                   -- return_date permite particionar por ano
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Paginação do job de arquivamento por (return_date, id): cada lote lê e
+-- bloqueia apenas as linhas do próprio lote, sem ordenar todo o intervalo
+CREATE INDEX idx_loans_return_id ON loans(return_date, id);
+
+-- Histórico por usuário (GET /loans/history/{user_id}?include_archived=true)
+CREATE INDEX idx_loans_archive_user_loan_date ON loans_archive(user_id, loan_date);
+
+-- Opcional: particionamento por ano da devolução, para descartar anos
+-- antigos com DROP PARTITION em vez de DELETE. Ajuste os anos e acrescente
+-- uma partição a cada ano (REORGANIZE PARTITION pmax).
+-- ALTER TABLE loans_archive
+--   PARTITION BY RANGE (YEAR(return_date)) (
+--     PARTITION p2023 VALUES LESS THAN (2024),
+--     PARTITION p2024 VALUES LESS THAN (2025),
+--     PARTITION p2025 VALUES LESS THAN (2026),
+--     PARTITION pmax  VALUES LESS THAN MAXVALUE
+--   );
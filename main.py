@@ -1,6 +1,26 @@
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.security import OAuth2PasswordBearer
 from app.core.settings import settings
+from app.core.security import shutdown_hash_executor
+from app.core.logging import logger
+from app.core.metrics import (
+    registry,
+    gauges_from_dict,
+    http_requests_total,
+    http_requests_in_flight,
+    http_request_duration_seconds
+)
+from app.db.session import pool_stats
+from app.db.instrumentation import start_request_stats, end_request_stats, report_request_stats
+from app.db.async_session import dispose_async_engine
+from app.dependencies.auth import principal_cache_stats
+from app.services.catalog_cache import catalog_cache_stats
+from app.services.reference_cache import reference_cache_stats
+from app.services.report_job_service import shutdown_report_jobs
+from app.jobs.fine_accrual import start_fine_accrual_scheduler, stop_fine_accrual_scheduler
 from app.api.v1.router import api_router as v1_router
 
 app = FastAPI(
@@ -18,6 +38,57 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 # Inclui o router com prefixo /api/v1
 app.include_router(v1_router, prefix="/api/v1")
 
+# Métricas lidas no momento da coleta (/metrics)
+registry.register_collector(lambda: gauges_from_dict("db_pool", "Pool de conexões do banco", pool_stats()))
+registry.register_collector(lambda: gauges_from_dict("principal_cache", "Cache de usuários autenticados", principal_cache_stats()))
+registry.register_collector(lambda: gauges_from_dict("log_queue", "Fila de logs assíncrona", logger.stats()))
+registry.register_collector(lambda: gauges_from_dict("catalog_cache", "Cache de leitura do catálogo", catalog_cache_stats()))
+registry.register_collector(lambda: gauges_from_dict("reference_cache", "Cache L1 de autores e metadados de livros", reference_cache_stats()))
+
+@app.middleware("http")
+async def metrics_middleware(request: Request, call_next):
+    """
+    Registra contagem, requisições em andamento e latência por rota e status,
+    além da quantidade e do tempo de SQL da requisição.
+    """
+    start = time.perf_counter()
+    http_requests_in_flight.inc()
+    query_stats, stats_token = start_request_stats()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        if settings.DEBUG:
+            response.headers["X-DB-Query-Count"] = str(query_stats.count)
+            response.headers["X-DB-Time-Ms"] = f"{query_stats.total_time * 1000:.2f}"
+        return response
+    finally:
+        end_request_stats(stats_token)
+        http_requests_in_flight.dec()
+        route = request.scope.get("route")
+        # Usa o template da rota (ex.: /api/v1/books/{book_id}) para limitar a cardinalidade
+        route_path = getattr(route, "path", "unmatched")
+        labels = (request.method, route_path, str(status_code))
+        http_requests_total.inc(*labels)
+        http_request_duration_seconds.observe(*labels, value=time.perf_counter() - start)
+        report_request_stats(query_stats, route_path)
+
+@app.on_event("startup")
+async def on_startup():
+    start_fine_accrual_scheduler()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    stop_fine_accrual_scheduler()
+    shutdown_hash_executor()
+    shutdown_report_jobs()
+    logger.shutdown()
+    await dispose_async_engine()
+
 @app.get("/", tags=["Health"], summary="Verifica status da API", description="Endpoint de verificação básica para confirmar que a API está operando.")
 def read_root():
     return {"status": "API is running"}
+
+@app.get("/metrics", tags=["Health"], summary="Métricas da API", description="Métricas de requisições e do pool de conexões no formato texto do Prometheus.", response_class=PlainTextResponse)
+def read_metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,118 @@
+"""
+Testes da paginação por cursor (keyset) de `app.utils.pagination`.
+
+Usam uma tabela `books` mínima em SQLite em memória, que ordena NULL como
+o menor valor, assim como o MySQL.
+"""
+
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, Date, Integer, MetaData, String, Table, create_engine, insert, select
+
+from app.utils.pagination import apply_keyset, decode_cursor, encode_cursor, split_page
+
+metadata = MetaData()
+books = Table(
+    "books", metadata,
+    Column("id", String(36), primary_key=True),
+    Column("title", String(255), nullable=False),
+    Column("published_date", Date, nullable=True),
+    Column("total_copies", Integer, nullable=False),
+)
+
+ROWS = [
+    {"id": "b01", "title": "Dom Casmurro", "published_date": date(1899, 1, 1), "total_copies": 3},
+    {"id": "b02", "title": "Iracema", "published_date": None, "total_copies": 1},
+    {"id": "b03", "title": "O Cortiço", "published_date": date(1890, 1, 1), "total_copies": 2},
+    {"id": "b04", "title": "Senhora", "published_date": None, "total_copies": 2},
+    {"id": "b05", "title": "Quincas Borba", "published_date": date(1899, 1, 1), "total_copies": 1},
+    {"id": "b06", "title": "O Guarani", "published_date": date(1857, 1, 1), "total_copies": 4},
+    {"id": "b07", "title": "Lucíola", "published_date": None, "total_copies": 1},
+    {"id": "b08", "title": "Memórias Póstumas", "published_date": date(1899, 1, 1), "total_copies": 2},
+]
+
+SORT_KEY = "published_date"
+ATTRIBUTES = ["published_date", "id"]
+COLUMNS = [books.c.published_date, books.c.id]
+
+
+@pytest.fixture(scope="module")
+def conn():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.execute(insert(books), ROWS)
+        yield connection
+
+
+def _expected_ids(descending: bool = False) -> list:
+    # NULL como menor valor; empates desfeitos pelo id
+    ordered = sorted(
+        ROWS,
+        key=lambda row: (row["published_date"] is not None, row["published_date"] or date.min, row["id"])
+    )
+    ids = [row["id"] for row in ordered]
+    return ids[::-1] if descending else ids
+
+
+def _walk(conn, limit: int, descending: bool = False) -> list:
+    """Percorre todas as páginas seguindo os cursores e retorna os ids na ordem recebida."""
+    ids, cursor = [], None
+    while True:
+        cursor_values = decode_cursor(cursor, SORT_KEY, COLUMNS) if cursor else None
+        query = apply_keyset(select(books), COLUMNS, cursor_values, descending).limit(limit + 1)
+        page, cursor = split_page(conn.execute(query).all(), limit, SORT_KEY, ATTRIBUTES)
+        ids.extend(row.id for row in page)
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 5, 8, 20])
+def test_ascending_pages_cover_every_row_once(conn, limit):
+    assert _walk(conn, limit) == _expected_ids()
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 5, 8, 20])
+def test_descending_pages_cover_every_row_once(conn, limit):
+    assert _walk(conn, limit, descending=True) == _expected_ids(descending=True)
+
+
+def test_ascending_cursor_on_null_continues_into_dated_rows(conn):
+    query = apply_keyset(select(books.c.id), COLUMNS, [None, "b04"])
+    assert conn.execute(query).scalars().all() == ["b07", "b06", "b03", "b01", "b05", "b08"]
+
+
+def test_descending_cursor_on_dated_row_continues_into_null_rows(conn):
+    query = apply_keyset(select(books.c.id), COLUMNS, [date(1857, 1, 1), "b06"], descending=True)
+    assert conn.execute(query).scalars().all() == ["b07", "b04", "b02"]
+
+
+def test_descending_cursor_on_null_returns_remaining_nulls(conn):
+    query = apply_keyset(select(books.c.id), COLUMNS, [None, "b04"], descending=True)
+    assert conn.execute(query).scalars().all() == ["b02"]
+
+
+def test_ties_on_sort_column_are_broken_by_id(conn):
+    query = apply_keyset(select(books.c.id), COLUMNS, [date(1899, 1, 1), "b01"])
+    assert conn.execute(query).scalars().all() == ["b05", "b08"]
+
+
+def test_cursor_round_trip_restores_column_types():
+    for values in ([date(1899, 1, 1), "b01"], [None, "b02"]):
+        cursor = encode_cursor(SORT_KEY, values)
+        assert decode_cursor(cursor, SORT_KEY, COLUMNS) == values
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64!",
+    encode_cursor(SORT_KEY, [date(1899, 1, 1), "b01"])[:-3] + "xyz",
+    encode_cursor(SORT_KEY, ["not-a-date", "b01"]),
+    encode_cursor(SORT_KEY, ["b01"]),
+    encode_cursor("title", ["Dom Casmurro", "b01"]),
+])
+def test_tampered_cursor_is_rejected_with_400(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, SORT_KEY, COLUMNS)
+    assert exc_info.value.status_code == 400